@@ -0,0 +1,106 @@
+"""Time finding anchor word hits as the anchor word list grows.
+
+The anchor word list of bug3 is padded with made up entries, literal
+words, words with wildcards and two word phrases, up to each size. The
+hits of every sentence of the giella documents are found with the compiled
+matchers, whose compilation is timed apart, and by trying every synonym at
+every position, up to --max-scan entries.
+
+Usage:
+    python benchmarks/bench_anchor_words.py [--sizes N ...] [--max-scan N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.anchorwordlistentry import AnchorWordListEntry
+
+ROOT = Path(__file__).parent.parent
+TEXT_FILES = ("bug3/giella_no.docx_nob_new.txt", "bug3/giella_sam.docx_sme_new.txt")
+
+
+def make_entry_line(number: int) -> str:
+    """Make up an anchor word list line, of one of four kinds."""
+    word = f"ord{number}"
+    return [
+        f"{word} / sátni{number}",
+        f"{word}* / *sátni{number}",
+        f"{word} og / sátni{number} ja",
+        f"{word}, {word}e / sátni{number}, sánit{number}",
+    ][number % 4]
+
+
+def make_anchor_word_list(size: int) -> AnchorWordList:
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.load_from_file(str(ROOT / "bug3/anchor-nob-sme.txt"))
+    anchor_word_list.entries = anchor_word_list.entries[:size] + [
+        AnchorWordListEntry(make_entry_line(number))
+        for number in range(size - len(anchor_word_list.entries))
+    ]
+    return anchor_word_list
+
+
+def load_words() -> list[list[list[str]]]:
+    return [
+        [
+            AlignmentElement(
+                anchor_word_list=AnchorWordList(),
+                text=line,
+                text_number=text_number,
+                element_number=element_number,
+            ).words
+            for element_number, line in enumerate(
+                (ROOT / text_file).read_text().splitlines()
+            )
+        ]
+        for text_number, text_file in enumerate(TEXT_FILES)
+    ]
+
+
+def time_hits(anchor_word_list: AnchorWordList, documents, scan: bool) -> float:
+    find_hits = (
+        anchor_word_list.scan_anchor_word_hits
+        if scan
+        else anchor_word_list.get_anchor_word_hits
+    )
+    start = time.perf_counter()
+    for text_number, document in enumerate(documents):
+        for element_number, words in enumerate(document):
+            find_hits(words, text_number, element_number)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 5000, 20000, 100000]
+    )
+    parser.add_argument("--max-scan", type=int, default=20000)
+    args = parser.parse_args()
+
+    documents = load_words()
+    sentences = sum(len(document) for document in documents)
+    print(f"{sentences} sentences")
+    for size in args.sizes:
+        anchor_word_list = make_anchor_word_list(size)
+        start = time.perf_counter()
+        for text_number in range(len(documents)):
+            anchor_word_list.get_matcher(text_number)
+        compilation = time.perf_counter() - start
+        compiled = time_hits(anchor_word_list, documents, scan=False)
+        line = (
+            f"{size:>7} entries: compilation {compilation:.3f}s, "
+            f"compiled {compiled:.4f}s"
+        )
+        if size <= args.max_scan:
+            scanned = time_hits(anchor_word_list, documents, scan=True)
+            line += f", scanned {scanned:.3f}s ({scanned / compiled:.0f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measure the memory of Ref objects.
+
+The bytes per Ref are measured with tracemalloc over many Refs sharing their
+field values, so only the Refs themselves are counted. The scoring keeps
+the references as plain RefFields tuples, and only makes Ref objects when
+the clusters are shown.
+
+Usage:
+    python benchmarks/bench_refs.py [--count N]
+"""
+
+import argparse
+import tracemalloc
+
+from python_tca2.ref import Ref
+
+
+def measure_bytes_per_ref(count: int) -> float:
+    words = [f"word{index}" for index in range(100)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    refs = [
+        Ref(
+            match_type=-1,
+            weight=1.0,
+            text_number=index % 2,
+            element_number=index % 100,
+            pos=index % 20,
+            length=1,
+            word=words[index % 100],
+        )
+        for index in range(count)
+    ]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = (
+        sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        - refs.__sizeof__()
+    )
+
+    return allocated / len(refs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"bytes per Ref: {measure_bytes_per_ref(args.count):.1f}")
+
+
+if __name__ == "__main__":
+    main()
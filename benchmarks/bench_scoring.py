@@ -0,0 +1,112 @@
+"""Time the scoring of alignment steps between data/nob.sent and data/fkv.sent.
+
+Every step the aligner may try near the diagonal is scored once, which is
+the work the step score cache cannot save.
+
+Usage:
+    python benchmarks/bench_scoring.py [--repeat N] [--width W] [--pair-cache]
+
+With --pair-cache, the steps share a pair match cache, as in the aligner.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from lxml import etree
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.alignment_suggestion import generate_alignment_suggestions
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.elementinfotobecompared import ElementInfoToBeCompared
+from python_tca2.pair_match_cache import PairMatchCache
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+def load_sentences(path: Path) -> list[str]:
+    return [sentence.text or "" for sentence in etree.parse(str(path)).iter("s")]
+
+
+def load_elements(
+    anchor_word_list: AnchorWordList,
+) -> tuple[list[AlignmentElement], list[AlignmentElement]]:
+    documents = (
+        load_sentences(DATA / "nob.sent"),
+        load_sentences(DATA / "fkv.sent"),
+    )
+    return (
+        [
+            AlignmentElement(
+                anchor_word_list=anchor_word_list,
+                text=sentence,
+                text_number=text_number,
+                element_number=element_number,
+            )
+            for element_number, sentence in enumerate(document)
+        ]
+        for text_number, document in enumerate(documents)
+    )
+
+
+def score_steps(
+    parallel_documents: tuple[list[AlignmentElement], list[AlignmentElement]],
+    width: int,
+    pair_match_cache: PairMatchCache | None,
+) -> tuple[int, float]:
+    """Score every step starting within width of the diagonal."""
+    steps = generate_alignment_suggestions(2)
+    lengths = [len(document) for document in parallel_documents]
+    count = 0
+    total = 0.0
+    for i in range(lengths[0]):
+        if pair_match_cache is not None:
+            pair_match_cache.forget_before((i, 0))
+        for j in range(max(0, i - width), min(lengths[1], i + width + 1)):
+            for step in steps:
+                if i + step[0] > lengths[0] or j + step[1] > lengths[1]:
+                    continue
+                total += ElementInfoToBeCompared(
+                    (
+                        parallel_documents[0][i : i + step[0]],
+                        parallel_documents[1][j : j + step[1]],
+                    ),
+                    pair_match_cache=pair_match_cache,
+                ).get_score()
+                count += 1
+
+    return count, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--pair-cache", action="store_true")
+    args = parser.parse_args()
+
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.load_from_file(str(DATA / "anchor-nob-fkv.txt"))
+
+    start = time.perf_counter()
+    parallel_documents = tuple(load_elements(anchor_word_list))
+    print(f"load: {time.perf_counter() - start:.3f}s")
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        count, total = score_steps(
+            parallel_documents,
+            width=args.width,
+            pair_match_cache=PairMatchCache() if args.pair_cache else None,
+        )
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"scored {count} steps (checksum {total:.3f}): best {min(timings):.3f}s, "
+        f"{1e6 * min(timings) / count:.1f}us per step"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Stop the lookahead search as soon as the next step is clear."""
+
+from collections import Counter
+
+from python_tca2 import constants
+from python_tca2.path_candidates import PathCandidates
+
+
+class AdaptiveDepth:
+    """Decides how deep each lookahead search goes.
+
+    Only the first step of the best path is used, so the search may stop
+    once the best path leads every path starting with another step by a
+    clear margin. When the paths are close, the search goes on, up to
+    max_depth levels.
+
+    Attributes:
+        margin: The lead in normalized score that ends the search.
+        min_depth: The number of levels always searched.
+        max_depth: The largest number of levels searched.
+        depths: How many searches ended at each depth.
+    """
+
+    def __init__(
+        self,
+        margin: float = constants.DEFAULT_LOOKAHEAD_MARGIN,
+        min_depth: int = constants.MIN_PATH_LENGTH,
+        max_depth: int = constants.MAX_PATH_LENGTH,
+    ) -> None:
+        if not 1 <= min_depth <= max_depth:
+            raise ValueError(
+                f"Expected 1 <= min_depth <= max_depth, got {min_depth} and {max_depth}"
+            )
+        self.margin = margin
+        self.min_depth = min_depth
+        self.max_depth = max_depth
+        self.depths: Counter[int] = Counter()
+
+    def is_decided(self, path_candidates: PathCandidates, depth: int) -> bool:
+        """Check if the search may stop at depth.
+
+        Args:
+            path_candidates: The paths found so far.
+            depth: The number of levels searched so far.
+
+        Returns:
+            True if the best first step leads the runner-up by the margin.
+        """
+        if depth < self.min_depth:
+            return False
+
+        best_scores: dict[tuple[int, ...], float] = {}
+        for path_candidate in path_candidates:
+            if not path_candidate.alignment_suggestions:
+                return False
+            first_step = path_candidate.alignment_suggestions[0]
+            normalized_score = path_candidate.normalized_score
+            if normalized_score > best_scores.get(first_step, -float("inf")):
+                best_scores[first_step] = normalized_score
+
+        scores = sorted(best_scores.values(), reverse=True)
+        return len(scores) == 1 or scores[0] - scores[1] >= self.margin
+
+    def record(self, depth: int) -> None:
+        """Count a search that ended at depth."""
+        self.depths[depth] += 1
+
+    def to_json(self) -> dict:
+        searches = sum(self.depths.values())
+        return {
+            "margin": self.margin,
+            "searches": searches,
+            "mean_depth": (
+                sum(depth * count for depth, count in self.depths.items()) / searches
+                if searches
+                else None
+            ),
+            "depths": {str(depth): self.depths[depth] for depth in sorted(self.depths)},
+        }
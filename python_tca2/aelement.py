@@ -4,6 +4,7 @@ from dataclasses import asdict
 from python_tca2 import constants
 from python_tca2.anchorwordhits import AnchorWordHits
 from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.feature_profile import FeatureProfile
 
 
 def remove_special_characters(word: str) -> str:
@@ -58,6 +59,7 @@ class AlignmentElement:
         anchor_word_hits: AnchorWordHits object containing anchor word hits.
         upper_case_words: A list of words starting with an uppercase letter.
         scoring_characters: A string containing scoring characters from the sentence.
+        profile: The precomputed features compared by the scoring functions.
     """
 
     def __init__(
@@ -81,6 +83,7 @@ class AlignmentElement:
             self.words, text_number, element_number
         )
         self.scoring_characters = get_scoring_characters(text)
+        self.profile = FeatureProfile.from_words(self.words, self.scoring_characters)
 
     def __str__(self):
         return json.dumps(self.to_json(), indent=0, ensure_ascii=False)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+from python_tca2.aligned_sentence_elements import (
+    AlignedSentenceElements,
+    to_string_tuple,
+)
+from python_tca2.alignment_suggestion import AlignmentSuggestion
+
+
+@dataclass(frozen=True)
+class AlignedPair:
+    """One alignment, as decided by the search.
+
+    Attributes:
+        start_position: The position of the first element in each text.
+        alignment_suggestion: The number of elements taken from each text.
+        score: The score of the step.
+        aligned_sentence_elements: The elements taken from each text.
+    """
+
+    start_position: tuple[int, int]
+    alignment_suggestion: AlignmentSuggestion
+    score: float
+    aligned_sentence_elements: AlignedSentenceElements
+
+    @property
+    def end_position(self) -> tuple[int, int]:
+        """The position after the last element in each text."""
+        return (
+            self.start_position[0] + self.alignment_suggestion[0],
+            self.start_position[1] + self.alignment_suggestion[1],
+        )
+
+    def is_non_empty(self) -> bool:
+        """Check if elements were taken from every text."""
+        return all(self.alignment_suggestion)
+
+    def to_string_tuple(self) -> tuple[str, str]:
+        """The texts of the elements taken from each text."""
+        return to_string_tuple(self.aligned_sentence_elements)
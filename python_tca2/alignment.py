@@ -1,35 +1,169 @@
+import json
+import sys
 from pathlib import Path
 
 import click
 
-from python_tca2 import alignmentmodel
-from python_tca2.anchorwordlist import AnchorWordList
-from python_tca2.tmx import write_tmx_result
+from python_tca2 import alignmentmodel, constants
+from python_tca2.adaptive_depth import AdaptiveDepth
+from python_tca2.aligned import Aligned
+from python_tca2.anchor_word_list_cache import load_anchor_word_list
+from python_tca2.chunked_alignment import merge_search_statistics, suggest_in_chunks
+from python_tca2.diagonal_band import DiagonalBand
+from python_tca2.disk_cache import get_cache_dir
+from python_tca2.document_cache import clear_documents
+from python_tca2.parity import compare_alignments
+from python_tca2.tmx import write_tmx_result, write_tmx_stream
 
 
 @click.command()
 @click.option("--anchor_file", default=None, help="Anchor word list file")
+@click.option(
+    "--no_anchor_cache",
+    is_flag=True,
+    help="Parse the anchor word list file instead of loading it from the cache",
+)
+@click.option(
+    "--document_cache",
+    is_flag=True,
+    help="Keep the loaded sentences of the documents in the cache, and read "
+    "them from there the next time",
+)
+@click.option(
+    "--clear_document_cache",
+    is_flag=True,
+    help="Remove every cached document before aligning",
+)
 @click.option(
     "--output_format",
     default="html",
     type=click.Choice(["tmx", "html"]),
     help="Output format",
 )
+@click.option(
+    "--search",
+    default="lookahead",
+    type=click.Choice(["lookahead", "dynamic"]),
+    help="Search engine used to find the alignment",
+)
+@click.option(
+    "--parity",
+    is_flag=True,
+    help="Report where the dynamic search differs from the lookahead search",
+)
+@click.option(
+    "--statistics",
+    is_flag=True,
+    help="Print counters describing the work done by the search to stderr",
+)
+@click.option(
+    "--step_score_cache_size",
+    default=constants.DEFAULT_STEP_SCORE_CACHE_SIZE,
+    type=click.IntRange(min=1),
+    help="Maximum number of step scores kept in memory",
+)
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Split the documents at confident sentence pairs, and align the "
+    "chunks in this many processes",
+)
+@click.option(
+    "--min_chunk_size",
+    default=constants.DEFAULT_MIN_CHUNK_SIZE,
+    type=click.IntRange(min=1),
+    help="Smallest number of sentences per document in a chunk",
+)
+@click.option(
+    "--band_width",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Only score positions within this many sentences of the diagonal",
+)
+@click.option(
+    "--band_fraction",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Only score positions within this fraction of the document length "
+    "of the diagonal",
+)
+@click.option(
+    "--adaptive_lookahead",
+    is_flag=True,
+    help="Stop each lookahead search as soon as the best next step is clear",
+)
+@click.option(
+    "--lookahead_margin",
+    default=constants.DEFAULT_LOOKAHEAD_MARGIN,
+    type=click.FloatRange(min=0),
+    help="The lead in normalized score over the runner-up that ends an "
+    "adaptive lookahead search",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Write each translation unit to the tmx file as soon as it is aligned",
+)
+@click.option(
+    "--load_workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Load the sentences of the documents in this many processes",
+)
+@click.option(
+    "--load_chunk_size",
+    default=constants.DEFAULT_LOAD_CHUNK_SIZE,
+    type=click.IntRange(min=1),
+    help="Number of sentences a loading process loads at a time",
+)
 @click.argument("text_file1")
 @click.argument("text_file2")
 @click.argument("text_file1_lang")
 @click.argument("text_file2_lang")
 def main(  # noqa: PLR0913
     anchor_file: str | None,
+    no_anchor_cache: bool,
+    document_cache: bool,
+    clear_document_cache: bool,
     output_format: str,
+    search: str,
+    parity: bool,
+    statistics: bool,
+    step_score_cache_size: int,
+    workers: int,
+    min_chunk_size: int,
+    band_width: int | None,
+    band_fraction: float | None,
+    adaptive_lookahead: bool,
+    lookahead_margin: float,
+    stream: bool,
+    load_workers: int,
+    load_chunk_size: int,
     text_file1: str,
     text_file2: str,
     text_file1_lang: str,
     text_file2_lang: str,
 ) -> None:
-    anchor_word_list = AnchorWordList()
-    if anchor_file is not None:
-        anchor_word_list.load_from_file(anchor_file)
+    if stream and (
+        output_format != "tmx" or search != "lookahead" or parity or workers > 1
+    ):
+        raise click.UsageError(
+            "--stream only works with the tmx output format and the lookahead "
+            "search, without --parity or --workers"
+        )
+
+    if band_width is not None and band_fraction is not None:
+        raise click.UsageError("Give either --band_width or --band_fraction")
+
+    cache_dir = get_cache_dir()
+    if clear_document_cache:
+        clear_documents(cache_dir)
+
+    anchor_word_list = load_anchor_word_list(
+        None if anchor_file is None else Path(anchor_file),
+        cache_dir=None if no_anchor_cache else cache_dir,
+    )
 
     aligner = alignmentmodel.AlignmentModel(
         sentences_tuple=(
@@ -37,9 +171,64 @@ def main(  # noqa: PLR0913
             Path(text_file2).read_text().splitlines(),
         ),
         anchor_word_list=anchor_word_list,
+        step_score_cache_size=step_score_cache_size,
+        diagonal_band=(
+            None
+            if band_width is None and band_fraction is None
+            else DiagonalBand(width=band_width, fraction=band_fraction)
+        ),
+        adaptive_depth=(
+            AdaptiveDepth(margin=lookahead_margin) if adaptive_lookahead else None
+        ),
+        load_workers=load_workers,
+        load_chunk_size=load_chunk_size,
+        document_cache_dir=cache_dir if document_cache else None,
     )
 
-    aligned, _ = aligner.suggest_without_gui()
+    if stream:
+        write_tmx_stream(
+            file1_path=Path(text_file1),
+            language_pair=(text_file1_lang, text_file2_lang),
+            non_empty_sentence_pairs=(
+                aligned_pair.to_string_tuple()
+                for aligned_pair in aligner.iter_alignments()
+                if aligned_pair.is_non_empty()
+            ),
+        )
+        if statistics:
+            print(json.dumps(aligner.statistics(), indent=2), file=sys.stderr)
+        return
+
+    search_statistics = []
+    if workers > 1:
+        aligned, chunk_sizes, chunk_statistics = suggest_in_chunks(
+            aligner, workers=workers, min_chunk_size=min_chunk_size, search=search
+        )
+        print(json.dumps(chunk_sizes), file=sys.stderr)
+        search_statistics.append(chunk_statistics)
+    else:
+        aligned = (
+            aligner.suggest_with_dynamic_programming()
+            if search == "dynamic"
+            else aligner.suggest_without_gui()
+        )
+
+    if parity:
+        report_parity(aligner, aligned=aligned, search=search)
+
+    if statistics:
+        # The chunks are searched by models of their own
+        search_statistics.append(aligner.search_statistics())
+        print(
+            json.dumps(
+                {
+                    **aligner.statistics(),
+                    **merge_search_statistics(search_statistics),
+                },
+                indent=2,
+            ),
+            file=sys.stderr,
+        )
 
     write_tmx_result(
         file1_path=Path(text_file1),
@@ -47,3 +236,28 @@ def main(  # noqa: PLR0913
         non_empty_sentence_pairs=aligned.non_empty_pairs(),
         output_format=output_format,
     )
+
+
+def report_parity(
+    aligner: alignmentmodel.AlignmentModel, aligned: Aligned, search: str
+) -> None:
+    """Print where the dynamic and the lookahead searches disagree.
+
+    Args:
+        aligner: The model that made the alignment.
+        aligned: The alignment made by the chosen search engine.
+        search: The search engine that made the alignment.
+    """
+    differences = (
+        compare_alignments(
+            lookahead=aligned, dynamic=aligner.suggest_with_dynamic_programming()
+        )
+        if search == "lookahead"
+        else compare_alignments(
+            lookahead=aligner.suggest_without_gui(), dynamic=aligned
+        )
+    )
+
+    for difference in differences:
+        print(difference)
+    print(f"{len(differences)} differences between lookahead and dynamic search")
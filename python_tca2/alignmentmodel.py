@@ -1,33 +1,190 @@
-from functools import cache
+import sys
+import time
+from pathlib import Path
 from typing import Iterator
 
-from python_tca2 import alignment_suggestion, constants
+from python_tca2 import alignment_suggestion, constants, document_cache
+from python_tca2.adaptive_depth import AdaptiveDepth
 from python_tca2.aelement import AlignmentElement
 from python_tca2.aligned import Aligned
+from python_tca2.aligned_pair import AlignedPair
 from python_tca2.aligned_sentence_elements import AlignedSentenceElements
-from python_tca2.alignment_suggestion import AlignmentSuggestion
+from python_tca2.alignment_suggestion import MAX_NUM_TRY, AlignmentSuggestion
 from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.best_path_scores import BestPathScores
+from python_tca2.diagonal_band import DiagonalBand
 from python_tca2.elementinfotobecompared import ElementInfoToBeCompared
+from python_tca2.pair_match_cache import PairMatchCache
+from python_tca2.parallel_loading import load_in_parallel
 from python_tca2.path_candidate import PathCandidate
 from python_tca2.path_candidates import PathCandidates
+from python_tca2.score_lattice import ScoreLattice
+from python_tca2.step_score_cache import StepScoreCache
+
+SEARCH_SETTINGS = ("max_path_length", "prune_visited_positions")
+"""The class attributes of AlignmentModel deciding how it searches."""
 
 
 class AlignmentModel:
     scoring_characters = constants.DEFAULT_SCORING_CHARACTERS
     max_path_length = constants.MAX_PATH_LENGTH
+    prune_visited_positions = False
+    """Remove the candidates passing through the position of a new candidate.
+
+    This was always meant to happen, but PathCandidate.has_hit used to compare
+    a list with a tuple, so no candidate was ever removed. The alignments
+    matching the Java version are made without it, so it is off by default.
+    """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         sentences_tuple: tuple[list[str], list[str]],
         anchor_word_list: AnchorWordList,
+        step_score_cache_size: int | None = constants.DEFAULT_STEP_SCORE_CACHE_SIZE,
+        diagonal_band: DiagonalBand | None = None,
+        adaptive_depth: AdaptiveDepth | None = None,
+        load_workers: int = 1,
+        load_chunk_size: int = constants.DEFAULT_LOAD_CHUNK_SIZE,
+        document_cache_dir: Path | None = None,
     ) -> None:
         self.anchor_word_list = anchor_word_list
-        self.parallel_documents = tuple(
-            self.load_sentences(
-                text_number=text_number,
-                sentences=sentences,
+        self.diagonal_band = diagonal_band
+        self.adaptive_depth = adaptive_depth
+        self.step_score_cache = StepScoreCache(max_size=step_score_cache_size)
+        self.best_path_scores = BestPathScores()
+        self.path_extension_count = 0
+        self.load_workers = load_workers
+        self.load_chunk_size = load_chunk_size
+        self.document_cache_dir = document_cache_dir
+        self.document_cache_hits = 0
+        self.document_cache_misses = 0
+        start = time.perf_counter()
+        self.parallel_documents = self.load_documents(sentences_tuple)
+        self.load_seconds = time.perf_counter() - start
+        self.pair_match_cache = PairMatchCache()
+
+    @classmethod
+    def from_parallel_documents(
+        cls,
+        parallel_documents: tuple[list[AlignmentElement], list[AlignmentElement]],
+        **kwargs,
+    ) -> "AlignmentModel":
+        """Make a model of documents whose sentences are already loaded.
+
+        The sentences keep their element numbers, so a model of a part of
+        the documents scores them exactly as a model of the whole would.
+
+        Args:
+            parallel_documents: The loaded sentences of both documents.
+            **kwargs: Passed on to the constructor, except for the search
+                settings of the class, like max_path_length, which are set
+                on the model.
+
+        Returns:
+            The model.
+        """
+        settings = {
+            name: kwargs.pop(name) for name in SEARCH_SETTINGS if name in kwargs
+        }
+        model = cls(
+            sentences_tuple=([], []),
+            anchor_word_list=kwargs.pop("anchor_word_list", AnchorWordList()),
+            **kwargs,
+        )
+        for name, value in settings.items():
+            setattr(model, name, value)
+        model.parallel_documents = parallel_documents
+        return model
+
+    def get_search_options(self) -> dict:
+        """The options deciding how the model searches.
+
+        Returns:
+            The keyword arguments that make from_parallel_documents search
+            other documents the same way.
+        """
+        return {
+            "step_score_cache_size": self.step_score_cache.max_size,
+            "diagonal_band": self.diagonal_band,
+            "adaptive_depth": self.adaptive_depth,
+            **{name: getattr(self, name) for name in SEARCH_SETTINGS},
+        }
+
+    def statistics(self) -> dict:
+        """Collect counters describing the work done by the model.
+
+        The anchor word matches count the words of every document the
+        anchor word list was used for, not only those of this model, and
+        leave out the words of sentences loaded by other processes.
+
+        Returns:
+            The counters, suitable for printing as JSON.
+        """
+        return {
+            "load": {
+                "workers": self.load_workers,
+                "chunk_size": self.load_chunk_size,
+                "seconds": self.load_seconds,
+            },
+            "document_cache": (
+                None
+                if self.document_cache_dir is None
+                else {
+                    "hits": self.document_cache_hits,
+                    "misses": self.document_cache_misses,
+                }
+            ),
+            "anchor_word_matches": self.anchor_word_list.to_json(),
+            **self.search_statistics(),
+        }
+
+    def search_statistics(self) -> dict:
+        """Collect counters describing the work done by the searches.
+
+        Returns:
+            The counters, suitable for printing as JSON.
+        """
+        return {
+            "path_extensions": self.path_extension_count,
+            "best_path_scores": self.best_path_scores.to_json(),
+            "step_score_cache": self.step_score_cache.to_json(),
+            "pair_match_cache": self.pair_match_cache.to_json(),
+            "diagonal_band": (
+                None if self.diagonal_band is None else self.diagonal_band.to_json()
+            ),
+            "adaptive_depth": (
+                None if self.adaptive_depth is None else self.adaptive_depth.to_json()
+            ),
+        }
+
+    def get_lengths(self) -> tuple[int, int]:
+        """The number of elements in each document."""
+        return (len(self.parallel_documents[0]), len(self.parallel_documents[1]))
+
+    def get_element_number(self, text_number: int, index: int) -> int:
+        """The element number of the element at an index of a document.
+
+        Past the end of the document, the numbering goes on.
+        """
+        document = self.parallel_documents[text_number]
+        if index < len(document):
+            return document[index].element_number
+
+        return (document[-1].element_number + 1 if document else 0) + (
+            index - len(document)
+        )
+
+    def forget_pair_matches_before(self, position: tuple[int, int]) -> None:
+        """Forget the sentence pairs no search from position will score.
+
+        Args:
+            position: The position every later step starts at or after.
+        """
+        self.pair_match_cache.forget_before(
+            (
+                self.get_element_number(text_number=0, index=position[0]),
+                self.get_element_number(text_number=1, index=position[1]),
             )
-            for text_number, sentences in enumerate(sentences_tuple)
         )
 
     def get_aligned_sentence_elements(
@@ -46,6 +203,78 @@ class AlignmentModel:
             self.parallel_documents[1][slices[1]],
         )
 
+    def load_documents(
+        self, sentences_tuple: tuple[list[str], list[str]]
+    ) -> tuple[list[AlignmentElement], list[AlignmentElement]]:
+        """Load the sentences of both documents, from the cache when possible.
+
+        The documents missing from the document cache are loaded, in a
+        process pool if there are several load workers, and then cached.
+
+        Args:
+            sentences_tuple: The sentences of each document.
+
+        Returns:
+            The loaded sentences of each document.
+        """
+        # A list whose entries were set directly has no digest, and so
+        # cannot be told apart from other lists
+        anchor_digest = self.anchor_word_list.digest()
+        cache_dir = None if anchor_digest is None else self.document_cache_dir
+        keys = [
+            None
+            if cache_dir is None or anchor_digest is None
+            else document_cache.make_key(
+                sentences, text_number=text_number, anchor_digest=anchor_digest
+            )
+            for text_number, sentences in enumerate(sentences_tuple)
+        ]
+        cached = [
+            None
+            if cache_dir is None or key is None
+            else document_cache.read_document(key, cache_dir=cache_dir)
+            for key in keys
+        ]
+        missing = tuple(
+            sentences if document is None else []
+            for document, sentences in zip(cached, sentences_tuple, strict=True)
+        )
+        loaded = (
+            load_in_parallel(
+                (missing[0], missing[1]),
+                anchor_word_list=self.anchor_word_list,
+                workers=self.load_workers,
+                chunk_size=self.load_chunk_size,
+            )
+            if self.load_workers > 1 and any(missing)
+            else tuple(
+                self.load_sentences(text_number=text_number, sentences=sentences)
+                for text_number, sentences in enumerate(missing)
+            )
+        )
+
+        documents = []
+        for key, cached_document, loaded_document in zip(
+            keys, cached, loaded, strict=True
+        ):
+            if cached_document is not None:
+                self.document_cache_hits += 1
+                documents.append(cached_document)
+                continue
+
+            documents.append(loaded_document)
+            if cache_dir is None or key is None:
+                continue
+            self.document_cache_misses += 1
+            try:
+                document_cache.write_document(
+                    key, cache_dir=cache_dir, document=loaded_document
+                )
+            except OSError as error:
+                print(f"Could not cache a loaded document: {error}", file=sys.stderr)
+
+        return documents[0], documents[1]
+
     def load_sentences(
         self, text_number: int, sentences: list[str]
     ) -> list[AlignmentElement]:
@@ -78,33 +307,130 @@ class AlignmentModel:
             A tuple containing the aligned object and the comparison object.
         """
         aligned = Aligned([])
+        for aligned_pair in self.iter_alignments():
+            aligned.pickup(aligned_pair.aligned_sentence_elements)
 
+        return aligned
+
+    def iter_alignments(self) -> Iterator[AlignedPair]:
+        """Suggest alignments one at a time.
+
+        Every alignment is yielded as soon as the lookahead search has
+        chosen it, so the caller can consume the result while the search
+        is still running.
+
+        Yields:
+            The alignments, in document order.
+        """
         start_position = (0, 0)
-        while (
-            alignment_suggestion := self.retrieve_alignment_suggestion(
-                start_position=start_position
-            )
-        ) is not None:
-            aligned.pickup(
-                self.get_aligned_sentence_elements(
-                    slices=(
-                        slice(
-                            start_position[0],
-                            start_position[0] + alignment_suggestion[0],
-                        ),
-                        slice(
-                            start_position[1],
-                            start_position[1] + alignment_suggestion[1],
-                        ),
-                    )
+        try:
+            while (
+                alignment_suggestion := self.retrieve_alignment_suggestion(
+                    start_position=start_position
+                )
+            ) is not None:
+                end_position = (
+                    start_position[0] + alignment_suggestion[0],
+                    start_position[1] + alignment_suggestion[1],
+                )
+                yield AlignedPair(
+                    start_position=start_position,
+                    alignment_suggestion=alignment_suggestion,
+                    score=self.get_step_score(start_position, alignment_suggestion),
+                    aligned_sentence_elements=self.get_aligned_sentence_elements(
+                        slices=(
+                            slice(start_position[0], end_position[0]),
+                            slice(start_position[1], end_position[1]),
+                        )
+                    ),
+                )
+                start_position = end_position
+                self.forget_pair_matches_before(start_position)
+        finally:
+            self.step_score_cache.clear()
+            self.pair_match_cache.clear()
+
+    def suggest_with_dynamic_programming(self) -> Aligned:
+        """Suggest alignments using a global dynamic programming search.
+
+        Instead of choosing one step at a time after a lookahead, this method
+        scores every cell of a lattice spanning both documents once, and then
+        traces the best scoring path back from the end of the documents.
+
+        Returns:
+            The aligned object.
+        """
+        try:
+            while True:
+                # Every fill starts from the first row, so the window of the
+                # pair match cache must start there too
+                self.pair_match_cache.clear()
+                lattice = ScoreLattice(
+                    lengths=self.get_lengths(), diagonal_band=self.diagonal_band
+                )
+                lattice.fill(get_step_score=self.get_lattice_step_score)
+                try:
+                    steps = lattice.backtrace()
+                    break
+                except ValueError:
+                    if self.diagonal_band is None or self.diagonal_band.covers(
+                        self.get_lengths()
+                    ):
+                        raise
+                    self.diagonal_band.widen()
+
+            if self.diagonal_band is not None:
+                self.diagonal_band.reset()
+
+            aligned = Aligned([])
+            start_position = (0, 0)
+            for step in steps:
+                start_position = self.pickup_step(
+                    aligned,
+                    start_position=start_position,
+                    alignment_suggestion=step,
+                )
+
+            return aligned
+        finally:
+            self.step_score_cache.clear()
+            self.pair_match_cache.clear()
+
+    def pickup_step(
+        self,
+        aligned: Aligned,
+        start_position: tuple[int, int],
+        alignment_suggestion: AlignmentSuggestion,
+    ) -> tuple[int, int]:
+        """Add the elements covered by a step to the aligned object.
+
+        Args:
+            aligned: The aligned object to add to.
+            start_position: The position the step starts from.
+            alignment_suggestion: The step to take.
+
+        Returns:
+            The position after the step.
+        """
+        aligned.pickup(
+            self.get_aligned_sentence_elements(
+                slices=(
+                    slice(
+                        start_position[0],
+                        start_position[0] + alignment_suggestion[0],
+                    ),
+                    slice(
+                        start_position[1],
+                        start_position[1] + alignment_suggestion[1],
+                    ),
                 )
             )
-            start_position = (
-                start_position[0] + alignment_suggestion[0],
-                start_position[1] + alignment_suggestion[1],
-            )
+        )
 
-        return aligned
+        return (
+            start_position[0] + alignment_suggestion[0],
+            start_position[1] + alignment_suggestion[1],
+        )
 
     def retrieve_alignment_suggestion(
         self,
@@ -163,48 +489,126 @@ class AlignmentModel:
         This method iteratively extends paths in the alignment model until no
         further extensions are possible or a maximum path length is reached.
 
+        With a diagonal band, the band is widened until some path survives,
+        and then set back to its configured width for the next search.
+
         Args:
             start_position: The starting position in the alignment.
 
         Returns:
             A QueueList containing the final set of extended paths.
         """
-        best_path_scores: dict[str, float] = {}
+        path_candidates = self.search_alignment_paths(start_position)
+        if self.diagonal_band is None:
+            return path_candidates
+
+        while is_stuck(path_candidates) and not self.diagonal_band.covers(
+            self.get_lengths()
+        ):
+            self.diagonal_band.widen()
+            path_candidates = self.search_alignment_paths(start_position)
+
+        if self.diagonal_band.level:
+            self.diagonal_band.reset()
+
+        return path_candidates
+
+    def search_alignment_paths(
+        self,
+        start_position: tuple[int, int],
+    ) -> PathCandidates:
+        """Run one lookahead search from start_position.
+
+        Args:
+            start_position: The starting position in the alignment.
+
+        Returns:
+            The extended paths.
+        """
+        if self.adaptive_depth is not None:
+            return self.extend_adaptively(
+                self.adaptive_depth, start_position=start_position
+            )
+
+        self.best_path_scores.reset()
+        path_candidates, _ = self.extend_path_candidates(
+            PathCandidates([PathCandidate(position=start_position)]),
+            levels=self.max_path_length,
+        )
+
+        return path_candidates
+
+    def extend_adaptively(
+        self,
+        adaptive_depth: AdaptiveDepth,
+        start_position: tuple[int, int],
+    ) -> PathCandidates:
+        """Lengthens paths one level at a time, until the next step is clear.
+
+        The search never goes deeper than the max_path_length of the model.
+
+        Args:
+            adaptive_depth: Decides when to stop, and counts the depths.
+            start_position: The starting position in the alignment.
+
+        Returns:
+            The extended paths.
+        """
+        self.best_path_scores.reset()
         path_candidates = PathCandidates([PathCandidate(position=start_position)])
-        for _ in range(self.max_path_length):
+        max_depth = min(adaptive_depth.max_depth, self.max_path_length)
+        depth = 0
+        while depth < max_depth:
+            path_candidates, stopped = self.extend_path_candidates(
+                path_candidates, levels=1
+            )
+            if stopped:
+                break
+            depth += 1
+            if adaptive_depth.is_decided(path_candidates, depth=depth):
+                break
+
+        adaptive_depth.record(depth)
+        return path_candidates
+
+    def extend_path_candidates(
+        self,
+        path_candidates: PathCandidates,
+        levels: int,
+    ) -> tuple[PathCandidates, bool]:
+        """Extends the path candidates one level at a time.
+
+        Args:
+            path_candidates: The paths to extend.
+            levels: The maximum number of levels to extend.
+
+        Returns:
+            The extended paths, and whether the extension stopped early
+            because none of the paths could be extended.
+        """
+        for _ in range(levels):
             next_path_candidates = PathCandidates([])
             for path_candidate in path_candidates.entries:
                 if not path_candidate.end:
-                    for new_path_candidate in self.extend_current_path(
-                        path_candidate,
-                        best_path_scores=best_path_scores,
-                    ):
+                    for new_path_candidate in self.extend_current_path(path_candidate):
                         if new_path_candidate is not None:
-                            pos = new_path_candidate.position
-                            path_candidates.entries = [
-                                path_candidate
-                                for path_candidate in path_candidates.entries
-                                if not path_candidate.has_hit(pos)
-                            ]
-                            next_path_candidates.entries = [
-                                path_candidate
-                                for path_candidate in next_path_candidates.entries
-                                if not path_candidate.has_hit(pos)
-                            ]
-                            if new_path_candidate not in next_path_candidates.entries:
-                                next_path_candidates.entries.append(new_path_candidate)
-
-            if not next_path_candidates.entries:
-                return path_candidates
+                            if self.prune_visited_positions:
+                                pos = new_path_candidate.position
+                                path_candidates.remove_visitors(pos)
+                                next_path_candidates.remove_visitors(pos)
+                            if new_path_candidate not in next_path_candidates:
+                                next_path_candidates.append(new_path_candidate)
+
+            if not next_path_candidates:
+                return path_candidates, True
 
             path_candidates = next_path_candidates
 
-        return path_candidates
+        return path_candidates, False
 
     def extend_current_path(
         self,
         path_candidate: PathCandidate,
-        best_path_scores: dict[str, float],
     ) -> Iterator[PathCandidate | None]:
         """Extends the current path in the alignment process.
 
@@ -216,7 +620,6 @@ class AlignmentModel:
             path_candidate: The current queue entry to be extended.
             path_candidates: The list of current queue entries.
             next_path_candidates: The list of queue entries for the next iteration.
-            best_path_scores: A dictionary to store the best path scores.
         Yields:
             QueueEntry: A new queue entry representing the extended path or None if
                 the path cannot be extended further.
@@ -225,33 +628,70 @@ class AlignmentModel:
             len(self.parallel_documents)
         ):
             yield self.extend_path_with_step(
-                old_position=path_candidate.position,
-                old_score=path_candidate.score,
-                alignment_suggestions=path_candidate.alignment_suggestions + [step],
-                best_path_scores=best_path_scores,
+                path_candidate=path_candidate,
+                alignment_suggestion=step,
             )
 
-    @cache
     def get_step_score(
         self,
-        slices: tuple[slice, slice],
+        position: tuple[int, int],
+        alignment_suggestion: AlignmentSuggestion,
     ) -> float:
         """Calculate the score for a given step at a specific position.
 
+        Scores are kept in the step score cache of the model, and the
+        matches between the sentences of the step in its pair match cache.
+
         Args:
             position: The current position in the alignment.
-            step: The step to evaluate.
+            alignment_suggestion: The step to evaluate.
 
         Returns:
             The score for the specified step.
         """
-        eitbc = ElementInfoToBeCompared(
-            aligned_sentence_elements=self.get_aligned_sentence_elements(
-                slices=slices,
-            )
+        key = (
+            position[0],
+            position[1],
+            alignment_suggestion[0],
+            alignment_suggestion[1],
         )
+        score = self.step_score_cache.get(key)
+        if score is None:
+            eitbc = ElementInfoToBeCompared(
+                aligned_sentence_elements=self.get_aligned_sentence_elements(
+                    slices=(
+                        slice(position[0], position[0] + alignment_suggestion[0]),
+                        slice(position[1], position[1] + alignment_suggestion[1]),
+                    )
+                ),
+                pair_match_cache=self.pair_match_cache,
+            )
+            score = eitbc.get_score()
+            self.step_score_cache.set(key, score)
+
+        return score
+
+    def get_lattice_step_score(
+        self,
+        position: tuple[int, int],
+        alignment_suggestion: AlignmentSuggestion,
+    ) -> float:
+        """Calculate the score of a step while filling the score lattice.
+
+        The lattice is filled one row at a time, and the steps into a row
+        start at most MAX_NUM_TRY rows back, so the sentence pairs before
+        those are forgotten.
+
+        Args:
+            position: The position the step starts at.
+            alignment_suggestion: The step to evaluate.
 
-        return eitbc.get_score()
+        Returns:
+            The score for the specified step.
+        """
+        row = position[0] + alignment_suggestion[0]
+        self.forget_pair_matches_before((max(row - MAX_NUM_TRY, 0), 0))
+        return self.get_step_score(position, alignment_suggestion)
 
     def will_reach_both_ends(self, position: tuple[int, ...]) -> bool:
         """Check if the current position will reach the end of the texts.
@@ -294,25 +734,27 @@ class AlignmentModel:
 
     def extend_path_with_step(
         self,
-        old_position: tuple[int, int],
-        old_score: float,
-        alignment_suggestions: list[AlignmentSuggestion],
-        best_path_scores: dict[str, float],
+        path_candidate: PathCandidate,
+        alignment_suggestion: AlignmentSuggestion,
     ) -> PathCandidate | None:
         """Extend a path with a new step and update its score.
 
         Args:
-            ret_path_candidate: The current queue entry containing the path and score.
+            path_candidate: The current queue entry containing the path and score.
             alignment_suggestion: The new alignement suggestion to add to the path.
-            best_path_scores: A dictionary to store the best path scores.
 
         Returns:
             The updated queue entry if the new score is better, otherwise None.
         """
-        current_alignment_step = alignment_suggestions[-1]
+        self.path_extension_count += 1
+        old_position = path_candidate.position
+        old_score = path_candidate.score
+        alignment_suggestions = path_candidate.alignment_suggestions + [
+            alignment_suggestion
+        ]
         new_position = (
-            old_position[0] + current_alignment_step[0],
-            old_position[1] + current_alignment_step[1],
+            old_position[0] + alignment_suggestion[0],
+            old_position[1] + alignment_suggestion[1],
         )
 
         if self.will_reach_both_ends(new_position):
@@ -326,11 +768,14 @@ class AlignmentModel:
         if self.will_reach_one_end(new_position):
             return None
 
+        if self.diagonal_band is not None and not self.diagonal_band.contains(
+            new_position, self.get_lengths()
+        ):
+            self.diagonal_band.rejections += 1
+            return None
+
         position_step_score = self.get_step_score(
-            slices=(
-                slice(old_position[0], new_position[0]),
-                slice(old_position[1], new_position[1]),
-            )
+            old_position, alignment_suggestion=alignment_suggestion
         )
 
         if position_step_score == constants.ELEMENTINFO_SCORE_HOPELESS:
@@ -338,25 +783,10 @@ class AlignmentModel:
 
         new_score = old_score + position_step_score
 
-        best_path_score = get_best_path_score(
-            new_position, best_path_scores=best_path_scores
-        )
-
-        # HACK:
-        # The score is multiplied by 1000000000 to give the same result as the original
-        # Java code. The difference is probably due to differences in floating-point
-        # arithmetic between Python and Java.
-        if (
-            best_path_score is not None
-            and new_score * 1000000000 <= best_path_score * 1000000000
-        ):
+        if not self.best_path_scores.is_improvement(new_position, new_score):
             return None
 
-        set_best_path_score(
-            new_position,
-            new_score,
-            best_path_scores=best_path_scores,
-        )
+        self.best_path_scores.set(new_position, new_score)
 
         return PathCandidate(
             position=new_position,
@@ -365,32 +795,17 @@ class AlignmentModel:
         )
 
 
-def set_best_path_score(
-    position: tuple[int, ...], score: float, best_path_scores: dict[str, float]
-) -> None:
-    """Sets the score for a specific position in the best path scores.
-
-    Args:
-        position: A list representing the position in the path.
-        score: The score to assign to the specified position.
-    """
-    best_path_score_key = ",".join(str(pos) for pos in position)
-    best_path_scores[best_path_score_key] = score
-
-
-def get_best_path_score(
-    position: tuple[int, ...], best_path_scores: dict[str, float]
-) -> float | None:
-    """Calculate and return the score for a given position.
+def is_stuck(path_candidates: PathCandidates) -> bool:
+    """Check if a search could not take a single step from its start.
 
     Args:
-        position: A list of integers representing the position.
+        path_candidates: The paths found by the search.
 
     Returns:
-        The score as a float for the given position, None if not found.
+        True if the only path is the unextended start of the search.
     """
-    if any(pos < 0 for pos in position):
-        return constants.BEST_PATH_SCORE_BAD
-
-    best_path_score_key = ",".join(str(pos) for pos in position)
-    return best_path_scores.get(best_path_score_key)
+    return (
+        len(path_candidates) == 1
+        and not path_candidates.entries[0].alignment_suggestions
+        and not path_candidates.entries[0].end
+    )
@@ -0,0 +1,108 @@
+"""Keep compiled anchor word lists on disk, so each file is parsed only once."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.disk_cache import (
+    get_cache_dir,
+    hash_file,
+    read_cache_file,
+    write_cache_file,
+)
+
+CACHE_SUBDIR = "anchor_word_lists"
+
+
+def get_cache_path(digest: str, cache_dir: Path) -> Path:
+    """The path of the cached anchor word list of a file content."""
+    return cache_dir / CACHE_SUBDIR / f"{digest}.pickle"
+
+
+def parse_anchor_word_list(anchor_file: Path) -> AnchorWordList:
+    """Parse an anchor word list file, and compile its matchers."""
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.load_from_file(str(anchor_file))
+    anchor_word_list.compile()
+    return anchor_word_list
+
+
+def build_anchor_word_list_cache(anchor_file: Path, cache_dir: Path) -> Path:
+    """Parse an anchor word list file, and write it to the cache.
+
+    Args:
+        anchor_file: The anchor word list file.
+        cache_dir: The cache directory.
+
+    Returns:
+        The path of the cache file.
+    """
+    digest = hash_file(anchor_file)
+    path = get_cache_path(digest, cache_dir)
+    write_cache_file(
+        path, key={"sha256": digest}, payload=parse_anchor_word_list(anchor_file)
+    )
+    return path
+
+
+def load_anchor_word_list(
+    anchor_file: Path | None, cache_dir: Path | None
+) -> AnchorWordList:
+    """Load an anchor word list file, through the cache if there is one.
+
+    The cache file is found by the SHA-256 digest of the content of the
+    anchor file, so an edited file is parsed again. A cache file written by
+    another version of the package, or by edited code, is ignored and
+    replaced, so the matchers are never restored into classes that have
+    changed since. If the cache cannot be written, the parsed list is used
+    anyway.
+
+    Args:
+        anchor_file: The anchor word list file, if any.
+        cache_dir: The cache directory, or None to always parse the file.
+
+    Returns:
+        The anchor word list, empty if there is no anchor file.
+    """
+    if anchor_file is None:
+        return AnchorWordList()
+    if cache_dir is None:
+        return parse_anchor_word_list(anchor_file)
+
+    digest = hash_file(anchor_file)
+    path = get_cache_path(digest, cache_dir)
+    anchor_word_list = read_cache_file(path, key={"sha256": digest})
+    if isinstance(anchor_word_list, AnchorWordList):
+        return anchor_word_list
+
+    anchor_word_list = parse_anchor_word_list(anchor_file)
+    try:
+        write_cache_file(path, key={"sha256": digest}, payload=anchor_word_list)
+    except OSError as error:
+        print(f"Could not cache {anchor_file}: {error}", file=sys.stderr)
+
+    return anchor_word_list
+
+
+@click.command()
+@click.option(
+    "--cache_dir",
+    default=None,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="The cache directory, by default $TCA2_CACHE_DIR or the user cache directory",
+)
+@click.argument(
+    "anchor_files",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+def main(cache_dir: Path | None, anchor_files: tuple[Path, ...]) -> None:
+    """Parse and compile ANCHOR_FILES into the anchor word list cache."""
+    for anchor_file in anchor_files:
+        path = build_anchor_word_list_cache(
+            anchor_file, cache_dir=get_cache_dir() if cache_dir is None else cache_dir
+        )
+        print(f"{anchor_file}: {path}")
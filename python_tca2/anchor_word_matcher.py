@@ -0,0 +1,252 @@
+"""Find the anchor word hits of a sentence with indexes of the anchor phrases."""
+
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from re import Pattern
+
+from python_tca2.anchorwordhit import AnchorWordHit
+
+SPECIAL_CHARACTERS = frozenset("^$+?{}[]\\|()")
+"""Regular expression characters making an anchor word be tried on every word.
+
+The wildcards . and * are the other ones an indexed anchor word may contain.
+"""
+
+Synonym = tuple[int, list[Pattern[str]]]
+"""The number of an anchor word list entry, and the patterns of one phrase."""
+
+
+def fold_case(text: str) -> str:
+    """Fold the case of a text, for looking up case insensitive patterns.
+
+    Characters that match ignoring case always fold to the same string.
+    The case insensitive regular expressions match the dotted and dotless
+    i to i, which casefold does not, so they are made i first.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The folded text.
+    """
+    return text.replace("\u0130", "i").replace("\u0131", "i").casefold()
+
+
+class AnchorWordMatcher:
+    """The anchor phrases of one language, compiled for matching sentences.
+
+    Each distinct word pattern gets a number. The patterns without
+    wildcards are looked up by their folded text, the ones with wildcards
+    by their folded literal prefix or suffix, and the rest are tried on
+    every word. The candidates found in the indexes are confirmed with the
+    pattern itself, so a word matches exactly the patterns it matched when
+    every pattern was tried. The phrases are kept in a token trie of
+    pattern numbers, whose nodes are numbers too, the root being 0, so a
+    large anchor word list makes no object per node.
+
+    The patterns matched by each distinct word are remembered, so a word
+    seen in an earlier sentence, of this document or of another one aligned
+    with the same anchor word list, is not matched again.
+
+    Only the sources of the patterns are pickled, and a pattern is compiled
+    again the first time a word is confirmed with it, so a pickled matcher
+    loads without compiling them all. The remembered words are not pickled.
+
+    Attributes:
+        entry_numbers: The entry number of each synonym, by synonym number,
+            in the order their hits are listed.
+        pattern_sources: The source and flags of the distinct word
+            patterns, by pattern number.
+        patterns: The compiled patterns, by pattern number.
+        literals: The patterns without wildcards, by folded text.
+        prefixes: The patterns with wildcards, by folded literal prefix.
+        prefix_lengths: The sorted lengths of the keys of prefixes.
+        suffixes: The patterns with wildcards and no literal prefix, by
+            folded literal suffix.
+        suffix_lengths: The sorted lengths of the keys of suffixes.
+        scanned: The patterns tried on every word.
+        trie: The child of each node for each pattern number.
+        node_synonyms: The numbers of the synonyms ending at each node.
+        word_matches: The patterns matched by each word seen so far.
+        hits: The number of words whose patterns were remembered.
+        misses: The number of words that had to be matched.
+    """
+
+    def __init__(self, synonyms: list[Synonym]) -> None:
+        self.entry_numbers = [entry_number for entry_number, _ in synonyms]
+        self.pattern_sources: list[tuple[str, int]] = []
+        self.patterns: dict[int, Pattern[str]] = {}
+        self.literals: defaultdict[str, list[int]] = defaultdict(list)
+        self.prefixes: defaultdict[str, list[int]] = defaultdict(list)
+        self.suffixes: defaultdict[str, list[int]] = defaultdict(list)
+        self.scanned: list[int] = []
+        self.trie: dict[tuple[int, int], int] = {}
+        self.node_synonyms: defaultdict[int, list[int]] = defaultdict(list)
+        self.word_matches: dict[str, frozenset[int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        pattern_numbers: dict[tuple[str, int], int] = {}
+        for synonym_number, (_, anchor_phrase) in enumerate(synonyms):
+            node = 0
+            for pattern in anchor_phrase:
+                key = (pattern.pattern, pattern.flags)
+                if key not in pattern_numbers:
+                    pattern_number = len(self.pattern_sources)
+                    pattern_numbers[key] = pattern_number
+                    self.index_pattern(pattern, pattern_number=pattern_number)
+                    self.pattern_sources.append(key)
+                    self.patterns[pattern_number] = pattern
+                node = self.trie.setdefault(
+                    (node, pattern_numbers[key]), len(self.trie) + 1
+                )
+            self.node_synonyms[node].append(synonym_number)
+
+        self.prefix_lengths = sorted({len(prefix) for prefix in self.prefixes})
+        self.suffix_lengths = sorted({len(suffix) for suffix in self.suffixes})
+
+    def __getstate__(self) -> dict:
+        return {
+            **self.__dict__,
+            "patterns": {},
+            "word_matches": {},
+            "hits": 0,
+            "misses": 0,
+        }
+
+    def index_pattern(self, pattern: Pattern[str], pattern_number: int) -> None:
+        """Put a word pattern in the index it is looked up in.
+
+        The patterns are made by AnchorWordListEntry.make_compiled_pattern,
+        anchoring the anchor word at both ends.
+        """
+        if not (pattern.pattern.startswith("^") and pattern.pattern.endswith("$")):
+            self.scanned.append(pattern_number)
+            return
+
+        body = pattern.pattern[1:-1]
+        if not SPECIAL_CHARACTERS.isdisjoint(body):
+            self.scanned.append(pattern_number)
+            return
+
+        wildcard_positions = [
+            position for position in (body.find("."), body.find("*")) if position != -1
+        ]
+        if not wildcard_positions:
+            self.literals[fold_case(body)].append(pattern_number)
+        elif prefix := body[: min(wildcard_positions)]:
+            self.prefixes[fold_case(prefix)].append(pattern_number)
+        elif suffix := body[max(body.rfind("."), body.rfind("*")) + 1 :]:
+            self.suffixes[fold_case(suffix)].append(pattern_number)
+        else:
+            self.scanned.append(pattern_number)
+
+    def find_candidates(self, word: str) -> list[int]:
+        """Find the patterns a word may match, from the indexes.
+
+        Args:
+            word: A word of a sentence.
+
+        Returns:
+            The numbers of the patterns to try.
+        """
+        # $ also matches before a newline ending the word
+        forms = [word, word[:-1]] if word.endswith("\n") else [word]
+        candidates = []
+        for folded in map(fold_case, forms):
+            candidates.extend(self.literals.get(folded, ()))
+            for length in self.prefix_lengths[
+                : bisect_right(self.prefix_lengths, len(folded))
+            ]:
+                candidates.extend(self.prefixes.get(folded[:length], ()))
+            for length in self.suffix_lengths[
+                : bisect_right(self.suffix_lengths, len(folded))
+            ]:
+                candidates.extend(self.suffixes.get(folded[-length:], ()))
+        candidates.extend(self.scanned)
+
+        return candidates
+
+    def match_word(self, word: str) -> frozenset[int]:
+        """Find the patterns a word matches, matching each distinct word once.
+
+        Args:
+            word: A word of a sentence.
+
+        Returns:
+            The numbers of the matching patterns.
+        """
+        matched = self.word_matches.get(word)
+        if matched is not None:
+            self.hits += 1
+            return matched
+
+        self.misses += 1
+        matched = frozenset(
+            pattern_number
+            for pattern_number in self.find_candidates(word)
+            if self.get_pattern(pattern_number).match(word)
+        )
+        self.word_matches[word] = matched
+        return matched
+
+    def get_pattern(self, pattern_number: int) -> Pattern[str]:
+        """Get a compiled pattern, compiling it the first time."""
+        if pattern_number not in self.patterns:
+            self.patterns[pattern_number] = re.compile(
+                *self.pattern_sources[pattern_number]
+            )
+
+        return self.patterns[pattern_number]
+
+    def find_hits(self, words: list[str], element_number: int) -> list[AnchorWordHit]:
+        """Find the anchor phrases occurring in a sentence.
+
+        Args:
+            words: The words of the sentence.
+            element_number: The number of the sentence.
+
+        Returns:
+            The hits, ordered by synonym and then by position, as when every
+            phrase was tried at every position.
+        """
+        matches = [self.match_word(word) for word in words]
+        found: list[tuple[int, int, int]] = []
+        for pos in range(len(words)):
+            if not matches[pos]:
+                continue
+            nodes = [0]
+            length = 0
+            while nodes and pos + length < len(words):
+                nodes = [
+                    child
+                    for node in nodes
+                    for pattern_number in matches[pos + length]
+                    if (child := self.trie.get((node, pattern_number))) is not None
+                ]
+                length += 1
+                found.extend(
+                    (synonym_number, pos, length)
+                    for node in nodes
+                    for synonym_number in self.node_synonyms.get(node, ())
+                )
+
+        return [
+            AnchorWordHit(
+                self.entry_numbers[synonym_number],
+                element_number,
+                pos,
+                # found_success puts a space between the words of a phrase,
+                # and then joins them all with spaces
+                "   ".join(words[pos : pos + length]),
+            )
+            for synonym_number, pos, length in sorted(found)
+        ]
+
+    def to_json(self) -> dict[str, int]:
+        return {
+            "size": len(self.word_matches),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
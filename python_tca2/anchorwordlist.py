@@ -1,18 +1,61 @@
+import hashlib
+import json
 import re
 import sys
 from re import Pattern
 
-from python_tca2 import similarity_utils
+from python_tca2 import constants, similarity_utils
+from python_tca2.anchor_word_matcher import AnchorWordMatcher
 from python_tca2.anchorwordhit import AnchorWordHit
 from python_tca2.anchorwordhits import AnchorWordHits
 from python_tca2.anchorwordlistentry import AnchorWordListEntry
 
 
 class AnchorWordList:
-    """Represents a list of anchor words and provides methods to process them."""
+    """Represents a list of anchor words and provides methods to process them.
+
+    The entries of each language are compiled into an AnchorWordMatcher the
+    first time hits are looked for in that language. Replacing the entries,
+    or loading more, makes the matchers be compiled again.
+
+    The entries hold compiled patterns, so when the lines they were parsed
+    from are known, a pickled list holds the lines and the matchers
+    instead, and the entries are parsed again only if they are used.
+
+    Attributes:
+        lines: The lines the entries were parsed from, None if the entries
+            were set directly.
+        matchers: The compiled entries of each language, by text number.
+    """
 
     def __init__(self) -> None:
         self.entries: list[AnchorWordListEntry] = []
+        self.lines: list[str] | None = []
+
+    @property
+    def entries(self) -> list[AnchorWordListEntry]:
+        if self._entries is None:
+            self._entries = [AnchorWordListEntry(line) for line in self.lines or []]
+
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries: list[AnchorWordListEntry]) -> None:
+        self._entries: list[AnchorWordListEntry] | None = entries
+        self.lines = None
+        self.matchers: dict[int, AnchorWordMatcher] = {}
+
+    def __getstate__(self) -> dict:
+        return {
+            "lines": self.lines,
+            "entries": self._entries if self.lines is None else None,
+            "matchers": self.matchers,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self._entries = state["entries"]
+        self.lines = state["lines"]
+        self.matchers = state["matchers"]
 
     def load_from_file(self, from_file: str) -> None:
         """Loads anchor word list entries from a specified file.
@@ -23,12 +66,34 @@ class AnchorWordList:
         with open(from_file, "r") as file:
             for line in file:
                 try:
-                    self.entries.append(AnchorWordListEntry(line.strip()))
+                    entry = AnchorWordListEntry(line.strip())
                 except re.error as error:
                     print(
                         f"Error processing line '{line.strip()}': {error}",
                         file=sys.stderr,
                     )
+                    continue
+
+                self.entries.append(entry)
+                if self.lines is not None:
+                    self.lines.append(line.strip())
+        self.matchers.clear()
+
+    def digest(self) -> str | None:
+        """The SHA-256 digest of the lines the entries were parsed from.
+
+        Returns:
+            The digest in hexadecimal, None if the entries were set directly.
+        """
+        if self.lines is None:
+            return None
+
+        return hashlib.sha256(json.dumps(self.lines).encode("utf-8")).hexdigest()
+
+    def compile(self) -> None:
+        """Compile the matchers of every language, ahead of looking for hits."""
+        for text_number in range(constants.NUM_FILES):
+            self.get_matcher(text_number)
 
     def get_synonyms(self, text_number: int) -> list[tuple[int, list[Pattern[str]]]]:
         """Retrieve synonyms for a given text number from the entries.
@@ -46,11 +111,69 @@ class AnchorWordList:
             for anchor_phrase in entry.language[text_number]
         ]
 
+    def get_matcher(self, text_number: int) -> AnchorWordMatcher:
+        """Get the compiled anchor phrases of a language, compiling them once.
+
+        Args:
+            text_number: The index of the text the language is found in.
+
+        Returns:
+            The matcher of the synonyms of the language.
+        """
+        if text_number not in self.matchers:
+            self.matchers[text_number] = AnchorWordMatcher(
+                self.get_synonyms(text_number)
+            )
+
+        return self.matchers[text_number]
+
+    def count_word_matches(self) -> tuple[int, int]:
+        """Count the words whose patterns were remembered, and those matched.
+
+        Returns:
+            The hits and misses of the remembered word matches of every
+            language, since the matchers were compiled.
+        """
+        return (
+            sum(matcher.hits for matcher in self.matchers.values()),
+            sum(matcher.misses for matcher in self.matchers.values()),
+        )
+
+    def to_json(self) -> dict:
+        hits, misses = self.count_word_matches()
+        return {
+            "languages": {
+                text_number: matcher.to_json()
+                for text_number, matcher in sorted(self.matchers.items())
+            },
+            "hit_rate": hits / (hits + misses) if hits + misses else None,
+        }
+
     def get_anchor_word_hits(
         self, words: list[str], text_number: int, element_number: int
     ) -> AnchorWordHits:
         """Retrieves anchor word hits based on provided words and indices.
 
+        Args:
+            words: A list of words to search for anchor word hits.
+            text_number: The identifier for the text to search within.
+            element_number: The specific element number for the search.
+
+        Returns:
+            An AnchorWordHits object containing the matching anchor word hits.
+        """
+        return AnchorWordHits(
+            self.get_matcher(text_number).find_hits(words, element_number)
+        )
+
+    def scan_anchor_word_hits(
+        self, words: list[str], text_number: int, element_number: int
+    ) -> AnchorWordHits:
+        """Find the anchor word hits by trying every synonym at every position.
+
+        This gives the same hits as get_anchor_word_hits, one regular
+        expression at a time.
+
         Args:
             words: A list of words to search for anchor word hits.
             text_number: The identifier for the text to search within.
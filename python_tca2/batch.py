@@ -0,0 +1,334 @@
+"""Align many document pairs in one run, listed in a manifest."""
+
+import csv
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import click
+
+from python_tca2.alignmentmodel import AlignmentModel
+from python_tca2.anchor_word_list_cache import load_anchor_word_list
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.disk_cache import get_cache_dir
+from python_tca2.document_cache import clear_documents
+from python_tca2.tmx import write_tmx_result
+
+OUTPUT_FORMATS = ("tmx", "html")
+
+
+@dataclass
+class ManifestEntry:
+    """A document pair to align, and where to write the result.
+
+    Attributes:
+        file1: The path of the first document.
+        file2: The path of the second document.
+        lang1: The language of the first document.
+        lang2: The language of the second document.
+        output: The path of the result. The suffix, .tmx or .html, decides
+            the output format.
+    """
+
+    file1: str
+    file2: str
+    lang1: str
+    lang2: str
+    output: str
+
+    def estimated_cost(self) -> int:
+        """Estimate the cost of aligning the pair by the size of its documents.
+
+        Missing documents cost nothing, and fail as soon as they are aligned.
+        """
+        return sum(
+            Path(file_name).stat().st_size
+            for file_name in (self.file1, self.file2)
+            if Path(file_name).exists()
+        )
+
+
+@dataclass
+class PairResult:
+    """The outcome of aligning a document pair.
+
+    Attributes:
+        output: The path of the result.
+        seconds: The time spent reading, aligning and writing the pair.
+        sentence_pairs: The number of sentence pairs written.
+        error: What went wrong, None if the pair was aligned.
+        word_match_hits: The words of the pair whose anchor word matches
+            were remembered from earlier sentences or pairs of the worker.
+        word_match_misses: The words of the pair that had to be matched.
+    """
+
+    output: str
+    seconds: float
+    sentence_pairs: int = 0
+    error: str | None = None
+    word_match_hits: int = 0
+    word_match_misses: int = 0
+
+
+def read_manifest(manifest_path: Path) -> list[ManifestEntry]:
+    """Read a tab separated manifest.
+
+    Every non-empty line holds file1, file2, lang1, lang2 and output.
+    Lines starting with # are comments.
+
+    Args:
+        manifest_path: The path of the manifest.
+
+    Returns:
+        The document pairs, in manifest order.
+
+    Raises:
+        ValueError: If a line does not have five fields.
+    """
+    entries = []
+    with manifest_path.open(newline="") as manifest:
+        for line_number, row in enumerate(csv.reader(manifest, delimiter="\t"), 1):
+            if not row or row[0].startswith("#"):
+                continue
+            if len(row) != len(ManifestEntry.__dataclass_fields__):
+                raise ValueError(
+                    f"{manifest_path}:{line_number}: expected file1, file2, "
+                    f"lang1, lang2 and output, got {row}"
+                )
+            entries.append(ManifestEntry(*row))
+
+    return entries
+
+
+_anchor_word_list = AnchorWordList()
+"""The anchor word list shared by the pairs aligned in a worker process."""
+
+
+def set_anchor_word_list(anchor_word_list: AnchorWordList) -> None:
+    """Install the anchor word list of a worker process.
+
+    Args:
+        anchor_word_list: The anchor word list parsed by the parent process.
+    """
+    global _anchor_word_list  # noqa: PLW0603
+    _anchor_word_list = anchor_word_list
+
+
+def align_pair(
+    entry: ManifestEntry, search: str, document_cache_dir: Path | None = None
+) -> PairResult:
+    """Align a document pair, and write the result.
+
+    Errors are reported in the result, so that one bad pair does not
+    stop the batch.
+
+    Args:
+        entry: The document pair.
+        search: The search engine to use, "lookahead" or "dynamic".
+        document_cache_dir: The cache directory of the loaded documents,
+            None to always load them.
+
+    Returns:
+        The outcome of the alignment.
+    """
+    start = time.perf_counter()
+    hits_before, misses_before = _anchor_word_list.count_word_matches()
+    try:
+        output_format = Path(entry.output).suffix.lstrip(".")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"{entry.output}: output must end with .tmx or .html")
+
+        model = AlignmentModel(
+            sentences_tuple=(
+                Path(entry.file1).read_text().splitlines(),
+                Path(entry.file2).read_text().splitlines(),
+            ),
+            anchor_word_list=_anchor_word_list,
+            document_cache_dir=document_cache_dir,
+        )
+        aligned = (
+            model.suggest_with_dynamic_programming()
+            if search == "dynamic"
+            else model.suggest_without_gui()
+        )
+        non_empty_sentence_pairs = aligned.non_empty_pairs()
+        write_tmx_result(
+            file1_path=Path(entry.file1),
+            language_pair=(entry.lang1, entry.lang2),
+            non_empty_sentence_pairs=non_empty_sentence_pairs,
+            output_format=output_format,
+            output_path=Path(entry.output),
+        )
+    except Exception as error:
+        return PairResult(
+            output=entry.output,
+            seconds=time.perf_counter() - start,
+            error="".join(traceback.format_exception_only(error)).strip(),
+        )
+
+    hits, misses = _anchor_word_list.count_word_matches()
+    return PairResult(
+        output=entry.output,
+        seconds=time.perf_counter() - start,
+        sentence_pairs=len(non_empty_sentence_pairs),
+        word_match_hits=hits - hits_before,
+        word_match_misses=misses - misses_before,
+    )
+
+
+def align_manifest(
+    entries: list[ManifestEntry],
+    anchor_word_list: AnchorWordList,
+    workers: int,
+    search: str = "lookahead",
+    document_cache_dir: Path | None = None,
+) -> list[PairResult]:
+    """Align the document pairs of a manifest in a process pool.
+
+    The most expensive pairs are started first, so that a large pair does
+    not end up running alone after the others are done.
+
+    Args:
+        entries: The document pairs.
+        anchor_word_list: The anchor word list, sent once to every worker.
+        workers: The number of worker processes.
+        search: The search engine to use, "lookahead" or "dynamic".
+        document_cache_dir: The cache directory of the loaded documents,
+            None to always load them.
+
+    Returns:
+        The outcome of every pair, in manifest order.
+    """
+    order = sorted(
+        range(len(entries)),
+        key=lambda index: entries[index].estimated_cost(),
+        reverse=True,
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=set_anchor_word_list,
+        initargs=(anchor_word_list,),
+    ) as executor:
+        futures = {
+            index: executor.submit(
+                align_pair, entries[index], search, document_cache_dir
+            )
+            for index in order
+        }
+        return [futures[index].result() for index in range(len(entries))]
+
+
+def summarize(results: list[PairResult]) -> dict:
+    """Summarize the outcome of a batch.
+
+    Args:
+        results: The outcome of every pair.
+
+    Returns:
+        The totals and the per pair results, suitable for printing as JSON.
+    """
+    word_match_hits = sum(result.word_match_hits for result in results)
+    word_matches = word_match_hits + sum(result.word_match_misses for result in results)
+    return {
+        "pairs": len(results),
+        "failures": sum(result.error is not None for result in results),
+        "seconds": sum(result.seconds for result in results),
+        "word_match_hit_rate": (
+            word_match_hits / word_matches if word_matches else None
+        ),
+        "results": [asdict(result) for result in results],
+    }
+
+
+@click.command()
+@click.option("--anchor_file", default=None, help="Anchor word list file")
+@click.option(
+    "--no_anchor_cache",
+    is_flag=True,
+    help="Parse the anchor word list file instead of loading it from the cache",
+)
+@click.option(
+    "--document_cache",
+    is_flag=True,
+    help="Keep the loaded sentences of the documents in the cache, and read "
+    "them from there the next time",
+)
+@click.option(
+    "--clear_document_cache",
+    is_flag=True,
+    help="Remove every cached document before aligning",
+)
+@click.option(
+    "--search",
+    default="lookahead",
+    type=click.Choice(["lookahead", "dynamic"]),
+    help="Search engine used to find the alignments",
+)
+@click.option(
+    "--workers",
+    default=os.cpu_count() or 1,
+    type=click.IntRange(min=1),
+    help="Number of document pairs aligned at the same time",
+)
+@click.option(
+    "--summary",
+    default=None,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the per pair runtimes and failures as JSON to this file",
+)
+@click.argument("manifest", type=click.Path(exists=True, path_type=Path))
+def main(  # noqa: PLR0913
+    anchor_file: str | None,
+    no_anchor_cache: bool,
+    document_cache: bool,
+    clear_document_cache: bool,
+    search: str,
+    workers: int,
+    summary: Path | None,
+    manifest: Path,
+) -> None:
+    """Align the document pairs listed in MANIFEST.
+
+    MANIFEST is a tab separated file with the columns file1, file2, lang1,
+    lang2 and output.
+    """
+    cache_dir = get_cache_dir()
+    if clear_document_cache:
+        clear_documents(cache_dir)
+
+    anchor_word_list = load_anchor_word_list(
+        None if anchor_file is None else Path(anchor_file),
+        cache_dir=None if no_anchor_cache else cache_dir,
+    )
+
+    results = align_manifest(
+        read_manifest(manifest),
+        anchor_word_list=anchor_word_list,
+        workers=workers,
+        search=search,
+        document_cache_dir=cache_dir if document_cache else None,
+    )
+
+    for result in results:
+        outcome = (
+            f"{result.sentence_pairs} sentence pairs"
+            if result.error is None
+            else f"FAILED {result.error}"
+        )
+        print(f"{result.seconds:8.2f}s {result.output}: {outcome}")
+
+    batch_summary = summarize(results)
+    print(
+        f"{batch_summary['pairs']} pairs, {batch_summary['failures']} failures, "
+        f"{batch_summary['seconds']:.2f}s"
+    )
+    if summary is not None:
+        summary.write_text(json.dumps(batch_summary, indent=2))
+
+    if batch_summary["failures"]:
+        sys.exit(1)
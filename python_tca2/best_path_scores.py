@@ -0,0 +1,92 @@
+"""Keep track of the best score of any path reaching a position."""
+
+from python_tca2 import constants
+
+
+class BestPathScores:
+    """The best score of any path reaching each position during a search.
+
+    The table is keyed directly by position, and is reset at the start of
+    every search. The counters are kept across searches.
+
+    Attributes:
+        scores: The best score per position.
+        lookups: The number of times a position was looked up.
+        hits: The number of lookups that found a score.
+        rejections: The number of paths pruned because they did not beat the
+            best score at their position.
+        updates: The number of times a best score was set.
+    """
+
+    def __init__(self) -> None:
+        self.scores: dict[tuple[int, int], float] = {}
+        self.lookups = 0
+        self.hits = 0
+        self.rejections = 0
+        self.updates = 0
+
+    def reset(self) -> None:
+        """Forget the scores, to prepare for a new search."""
+        self.scores.clear()
+
+    def get(self, position: tuple[int, int]) -> float | None:
+        """Return the best score found at a position.
+
+        Args:
+            position: The position to look up.
+
+        Returns:
+            The best score for the given position, None if not found.
+        """
+        if position[0] < 0 or position[1] < 0:
+            return constants.BEST_PATH_SCORE_BAD
+
+        self.lookups += 1
+        best_path_score = self.scores.get(position)
+        if best_path_score is not None:
+            self.hits += 1
+
+        return best_path_score
+
+    def set(self, position: tuple[int, int], score: float) -> None:
+        """Set the best score at a position.
+
+        Args:
+            position: The position of the path.
+            score: The score of the path.
+        """
+        self.updates += 1
+        self.scores[position] = score
+
+    def is_improvement(self, position: tuple[int, int], score: float) -> bool:
+        """Check if a path beats the best path found at its position.
+
+        Args:
+            position: The position of the path.
+            score: The score of the path.
+
+        Returns:
+            True if the path is better, False if it should be pruned.
+        """
+        best_path_score = self.get(position)
+
+        # HACK:
+        # The score is multiplied by 1000000000 to give the same result as the original
+        # Java code. The difference is probably due to differences in floating-point
+        # arithmetic between Python and Java.
+        if (
+            best_path_score is not None
+            and score * 1000000000 <= best_path_score * 1000000000
+        ):
+            self.rejections += 1
+            return False
+
+        return True
+
+    def to_json(self) -> dict[str, int]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "rejections": self.rejections,
+            "updates": self.updates,
+        }
@@ -0,0 +1,354 @@
+"""Split long documents at confident sentence pairs, and align the parts in parallel.
+
+Sentences that share a feature found nowhere else in either document,
+like an anchor word, a number or a proper name, are very likely to be
+translations of each other. The documents are cut in front of such pairs,
+and the chunks between the cuts are aligned independently.
+"""
+
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
+from statistics import median
+
+from python_tca2 import constants
+from python_tca2.adaptive_depth import AdaptiveDepth
+from python_tca2.aelement import AlignmentElement
+from python_tca2.aligned import Aligned
+from python_tca2.alignment_suggestion import AlignmentSuggestion
+from python_tca2.alignmentmodel import AlignmentModel
+from python_tca2.parity import to_steps
+
+Signature = tuple[str, str | int | float]
+"""A feature of a sentence, like ("number", 25.0) or ("propername", "Oslo")."""
+ParallelDocuments = tuple[list[AlignmentElement], list[AlignmentElement]]
+
+SEARCH_OPTION_KEYS = frozenset(["max_size", "width"])
+"""The whole numbers of the search statistics that are options, not counters."""
+
+
+def get_signatures(alignment_element: AlignmentElement) -> set[Signature]:
+    """Find the features of a sentence that may identify its translation.
+
+    Args:
+        alignment_element: The sentence to examine.
+
+    Returns:
+        The anchor word entries, numbers and proper names of the sentence.
+    """
+    signatures: set[Signature] = {
+        ("anchor", hit.index) for hit in alignment_element.anchor_word_hits.hits
+    }
+    for word in alignment_element.words:
+        try:
+            signatures.add(("number", float(word)))
+        except ValueError:
+            if word[0].isupper():
+                signatures.add(("propername", word))
+
+    return signatures
+
+
+def find_unique_signatures(
+    alignment_elements: list[AlignmentElement],
+) -> dict[Signature, int]:
+    """Find the features that occur in exactly one sentence of a document.
+
+    Args:
+        alignment_elements: The sentences of the document.
+
+    Returns:
+        The position of the only sentence having each such feature.
+    """
+    positions: defaultdict[Signature, list[int]] = defaultdict(list)
+    for position, alignment_element in enumerate(alignment_elements):
+        for signature in get_signatures(alignment_element):
+            positions[signature].append(position)
+
+    return {
+        signature: sentence_positions[0]
+        for signature, sentence_positions in positions.items()
+        if len(sentence_positions) == 1
+    }
+
+
+def find_anchor_pairs(
+    parallel_documents: ParallelDocuments,
+    min_support: int = constants.DEFAULT_CHUNK_ANCHOR_MIN_SUPPORT,
+) -> list[tuple[int, int]]:
+    """Find sentence pairs that are almost certainly translations of each other.
+
+    A pair is kept if at least min_support features are unique to both
+    sentences, neither sentence takes part in another such pair, and the
+    pair is part of the longest chain of pairs in document order.
+
+    Args:
+        parallel_documents: The sentences of both documents.
+        min_support: The number of shared unique features a pair needs.
+
+    Returns:
+        The positions of the paired sentences, in document order.
+    """
+    unique_signatures = [
+        find_unique_signatures(alignment_elements)
+        for alignment_elements in parallel_documents
+    ]
+    support: defaultdict[tuple[int, int], int] = defaultdict(int)
+    for signature, position in unique_signatures[0].items():
+        if signature in unique_signatures[1]:
+            support[(position, unique_signatures[1][signature])] += 1
+
+    pairs = [pair for pair, count in support.items() if count >= min_support]
+    pair_counts: list[defaultdict[int, int]] = [
+        defaultdict(int) for _ in range(constants.NUM_FILES)
+    ]
+    for pair in pairs:
+        for text_number, position in enumerate(pair):
+            pair_counts[text_number][position] += 1
+
+    return longest_chain(
+        [
+            pair
+            for pair in pairs
+            if all(
+                pair_counts[text_number][position] == 1
+                for text_number, position in enumerate(pair)
+            )
+        ]
+    )
+
+
+def longest_chain(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Find the longest sequence of pairs increasing in both positions.
+
+    Args:
+        pairs: Sentence pairs, no sentence occurring in more than one pair.
+
+    Returns:
+        The longest chain, in document order.
+    """
+    pairs = sorted(pairs)
+    tails: list[int] = []  # smallest second position ending a chain of each length
+    tail_indexes: list[int] = []
+    previous: list[int | None] = []
+    for index, (_, position) in enumerate(pairs):
+        length = bisect_left(tails, position)
+        if length == len(tails):
+            tails.append(position)
+            tail_indexes.append(index)
+        else:
+            tails[length] = position
+            tail_indexes[length] = index
+        previous.append(tail_indexes[length - 1] if length else None)
+
+    chain = []
+    current = tail_indexes[-1] if tail_indexes else None
+    while current is not None:
+        chain.append(pairs[current])
+        current = previous[current]
+
+    chain.reverse()
+    return chain
+
+
+def choose_cuts(
+    anchor_pairs: list[tuple[int, int]],
+    lengths: tuple[int, int],
+    min_chunk_size: int,
+) -> list[tuple[int, int]]:
+    """Choose where to cut the documents.
+
+    The documents are cut in front of anchor pairs, as long as every chunk
+    has at least min_chunk_size sentences in each document.
+
+    Args:
+        anchor_pairs: The anchor pairs, in document order.
+        lengths: The number of sentences in each document.
+        min_chunk_size: The smallest number of sentences in a chunk.
+
+    Returns:
+        The positions to cut at, in document order.
+    """
+    cuts: list[tuple[int, int]] = []
+    previous = (0, 0)
+    for anchor_pair in anchor_pairs:
+        if all(
+            anchor_pair[text_number] - previous[text_number] >= min_chunk_size
+            and lengths[text_number] - anchor_pair[text_number] >= min_chunk_size
+            for text_number in range(constants.NUM_FILES)
+        ):
+            cuts.append(anchor_pair)
+            previous = anchor_pair
+
+    return cuts
+
+
+def split_documents(
+    parallel_documents: ParallelDocuments, cuts: list[tuple[int, int]]
+) -> list[ParallelDocuments]:
+    """Split the documents at the cuts.
+
+    Args:
+        parallel_documents: The sentences of both documents.
+        cuts: The positions to cut at, in document order.
+
+    Returns:
+        The chunks of both documents.
+    """
+    boundaries = (
+        [(0, 0)] + cuts + [(len(parallel_documents[0]), len(parallel_documents[1]))]
+    )
+    return [
+        (
+            parallel_documents[0][start[0] : end[0]],
+            parallel_documents[1][start[1] : end[1]],
+        )
+        for start, end in pairwise(boundaries)
+    ]
+
+
+def align_chunk(
+    chunk: ParallelDocuments,
+    search: str,
+    search_options: dict,
+) -> tuple[list[AlignmentSuggestion], dict]:
+    """Align one chunk of the documents.
+
+    Args:
+        chunk: The sentences of the chunk.
+        search: The search engine to use, "lookahead" or "dynamic".
+        search_options: The search options of the model of the whole
+            documents, from AlignmentModel.get_search_options.
+
+    Returns:
+        The steps aligning the chunk, and the statistics of its searches.
+    """
+    model = AlignmentModel.from_parallel_documents(chunk, **search_options)
+    steps = to_steps(
+        model.suggest_with_dynamic_programming()
+        if search == "dynamic"
+        else model.suggest_without_gui()
+    )
+    return steps, model.search_statistics()
+
+
+def add_counters(total: dict, counters: dict) -> None:
+    """Add the counters of a search to the total of several searches.
+
+    Args:
+        total: The counters added so far, updated in place.
+        counters: The counters to add, as AlignmentModel.search_statistics
+            makes them. The options come from the first counters added.
+    """
+    for key, value in counters.items():
+        if isinstance(value, dict):
+            add_counters(total.setdefault(key, {}), value)
+        elif isinstance(value, int) and key not in SEARCH_OPTION_KEYS:
+            total[key] = total.get(key, 0) + value
+        else:
+            total.setdefault(key, value)
+
+
+def merge_search_statistics(search_statistics: list[dict]) -> dict:
+    """Add up the statistics of the searches of several models.
+
+    The models are expected to search with the same options.
+
+    Args:
+        search_statistics: The statistics of each model, from
+            AlignmentModel.search_statistics.
+
+    Returns:
+        The statistics of all the searches, suitable for printing as JSON.
+    """
+    merged: dict = {}
+    for statistics in search_statistics:
+        add_counters(merged, statistics)
+
+    if merged.get("adaptive_depth") is not None:
+        adaptive_depth = AdaptiveDepth(margin=merged["adaptive_depth"]["margin"])
+        adaptive_depth.depths = Counter(
+            {
+                int(depth): count
+                for depth, count in merged["adaptive_depth"]["depths"].items()
+            }
+        )
+        merged["adaptive_depth"] = adaptive_depth.to_json()
+
+    return merged
+
+
+def summarize_chunk_sizes(chunks: list[ParallelDocuments]) -> dict:
+    """Describe the number and size of the chunks.
+
+    The size of a chunk is the number of sentences in both documents.
+
+    Args:
+        chunks: The chunks of both documents.
+
+    Returns:
+        The chunk count and size distribution, suitable for printing as JSON.
+    """
+    sizes = [len(chunk[0]) + len(chunk[1]) for chunk in chunks]
+    return {
+        "chunks": len(chunks),
+        "min_size": min(sizes),
+        "median_size": median(sizes),
+        "max_size": max(sizes),
+        "sizes": sizes,
+    }
+
+
+def suggest_in_chunks(
+    model: AlignmentModel,
+    workers: int,
+    min_chunk_size: int = constants.DEFAULT_MIN_CHUNK_SIZE,
+    search: str = "lookahead",
+) -> tuple[Aligned, dict, dict]:
+    """Align the documents of a model chunk by chunk in a process pool.
+
+    Every chunk is searched with the search options of the model, and a
+    diagonal band of the model is applied to every chunk on its own.
+
+    Args:
+        model: The model holding the documents.
+        workers: The number of worker processes.
+        min_chunk_size: The smallest number of sentences in a chunk.
+        search: The search engine to use, "lookahead" or "dynamic".
+
+    Returns:
+        The aligned object, a summary of the chunk sizes, and the statistics
+        of the searches of all the chunks.
+    """
+    parallel_documents = (model.parallel_documents[0], model.parallel_documents[1])
+    cuts = choose_cuts(
+        find_anchor_pairs(parallel_documents),
+        lengths=(len(parallel_documents[0]), len(parallel_documents[1])),
+        min_chunk_size=min_chunk_size,
+    )
+    chunks = split_documents(parallel_documents, cuts)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_results = list(
+            executor.map(
+                align_chunk,
+                chunks,
+                [search] * len(chunks),
+                [model.get_search_options()] * len(chunks),
+            )
+        )
+
+    aligned = Aligned([])
+    start_position = (0, 0)
+    for steps, _ in chunk_results:
+        for step in steps:
+            start_position = model.pickup_step(
+                aligned, start_position=start_position, alignment_suggestion=step
+            )
+
+    return (
+        aligned,
+        summarize_chunk_sizes(chunks),
+        merge_search_statistics([statistics for _, statistics in chunk_results]),
+    )
@@ -5,9 +5,25 @@ from python_tca2 import constants
 from python_tca2.ref import Ref
 
 
+def score_cluster(max_cluster_weight: float, low: int) -> float:
+    """Calculate the score of a cluster from its aggregates.
+
+    Args:
+        max_cluster_weight: The biggest weight among the refs of the cluster.
+        low: The smallest number of unique positions referred to in a text.
+
+    Returns:
+        The score of the cluster.
+    """
+    return max_cluster_weight * (
+        1 + ((low - 1) * constants.DEFAULT_LARGE_CLUSTER_SCORE_PERCENTAGE / 100.0)
+    )
+
+
 class Cluster:
     def __init__(self) -> None:
         self.refs: list[Ref] = []
+        self.ref_set: set[Ref] = set()
 
     def to_json(self) -> dict:
         return {"refs": [asdict(ref) for ref in self.refs]}
@@ -21,7 +37,8 @@ class Cluster:
         Args:
             other_ref: The reference to be added to the cluster.
         """
-        if other_ref not in self.refs:
+        if other_ref not in self.ref_set:
+            self.ref_set.add(other_ref)
             self.refs.append(other_ref)
 
     def matches(self, other_ref: Ref) -> bool:
@@ -56,16 +73,14 @@ class Cluster:
         Returns:
             The calculated score for the cluster.
         """
-        max_cluster_weight = self.get_max_cluster_weight()
-        low = min(
-            [
-                len({ref.pos for ref in self.refs if ref.is_in_text(text_number)})
-                for text_number in range(constants.NUM_FILES)
-            ]
-        )
-
-        return max_cluster_weight * (
-            1 + ((low - 1) * constants.DEFAULT_LARGE_CLUSTER_SCORE_PERCENTAGE / 100.0)
+        return score_cluster(
+            max_cluster_weight=self.get_max_cluster_weight(),
+            low=min(
+                [
+                    len({ref.pos for ref in self.refs if ref.is_in_text(text_number)})
+                    for text_number in range(constants.NUM_FILES)
+                ]
+            ),
         )
 
     def get_max_cluster_weight(self) -> float:
@@ -1,13 +1,52 @@
 import json
-from copy import deepcopy
+from itertools import count
 
-from python_tca2.cluster import Cluster
-from python_tca2.ref import Ref
+from python_tca2 import constants
+from python_tca2.cluster import Cluster, score_cluster
+from python_tca2.ref import Ref, RefFields
 
 
 class Clusters:
+    """Groups references that match each other, directly or through others.
+
+    The references are kept in a disjoint-set forest. A new reference joins
+    the set of every reference it matches, as given by Ref.matches: the
+    ones overlapping it in the same element are found through an index of
+    the references of each element, and the ones with the same non-negative
+    match type through an index of the match types.
+
+    The aggregates get_score needs are kept for each set and merged along
+    with the sets, so no cluster is ever copied or rescanned.
+
+    The references are kept as the plain tuples of their fields, and Ref
+    and Cluster objects are only made by the clusters property.
+
+    Attributes:
+        refs: The fields of every distinct reference added, the nodes of
+            the forest.
+        nodes: The node of each reference.
+        parents: The parent of each node, a root being its own parent.
+        members: The nodes of each set, keyed by its root.
+        positions: The positions referred to in each text, for each set.
+        max_weights: The largest weight of the references of each set.
+        stamps: When each set was last added to. The sets are listed in
+            this order, which is the order the scores are summed in.
+        element_nodes: The nodes of each element, keyed by text number and
+            element number.
+        match_type_nodes: A node of each non-negative match type.
+    """
+
     def __init__(self) -> None:
-        self.clusters: list[Cluster] = []  # list of Cluster
+        self.refs: list[RefFields] = []
+        self.nodes: dict[RefFields, int] = {}
+        self.parents: list[int] = []
+        self.members: dict[int, list[int]] = {}
+        self.positions: dict[int, tuple[set[int], ...]] = {}
+        self.max_weights: dict[int, float] = {}
+        self.stamps: dict[int, int] = {}
+        self.element_nodes: dict[tuple[int, int], list[int]] = {}
+        self.match_type_nodes: dict[int, int] = {}
+        self.clock = count()
 
     def __str__(self) -> str:
         return json.dumps(self.to_json(), indent=0, ensure_ascii=False)
@@ -15,97 +54,155 @@ class Clusters:
     def to_json(self) -> dict:
         return {"clusters": [cluster.to_json() for cluster in self.clusters]}
 
-    def create_and_add_cluster(
-        self,
-        ref1: Ref,
-        ref2: Ref,
-    ) -> None:
-        """Adds two references to a new cluster and stores the cluster.
+    @property
+    def clusters(self) -> list[Cluster]:
+        """The clusters, in the order they were last added to."""
+        clusters = []
+        for root in self.get_roots():
+            cluster = Cluster()
+            for node in self.members[root]:
+                cluster.add_ref(Ref(*self.refs[node]))
+            clusters.append(cluster)
 
-        This method creates a new cluster, adds the provided references to it,
-        and then adds the cluster to the collection of clusters.
+        return clusters
 
-        Args:
-            ref1 (Ref): The first reference to add to the cluster.
-            ref2 (Ref): The second reference to add to the cluster.
-        """
-        new_cluster = Cluster()
-        new_cluster.add_ref(ref1)
-        new_cluster.add_ref(ref2)
-        self.add_cluster(new_cluster)
+    def get_roots(self) -> list[int]:
+        return sorted(self.stamps, key=self.stamps.__getitem__)
 
-    def add_ref(self, ref: Ref) -> None:
-        """Adds a reference to the appropriate cluster or creates a new one.
+    def find(self, node: int) -> int:
+        """Find the root of the set of a node, halving the path on the way."""
+        parents = self.parents
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
 
-        This method checks for clusters that match the given reference and merges
-        them into a new cluster if overlaps are found. If no matching clusters
-        exist, a new cluster is created with the reference.
+        return node
+
+    def union(self, root1: int, root2: int) -> int:
+        """Merge two sets, the smaller into the larger.
 
         Args:
-            ref: The reference to be added to a cluster.
+            root1: The root of a set.
+            root2: The root of another set.
+
+        Returns:
+            The root of the merged set.
         """
-        overlaps = []
-        for cluster in self.clusters:
-            if cluster.matches(ref):
-                overlaps.append(cluster)
+        if root1 == root2:
+            return root1
+        if len(self.members[root1]) < len(self.members[root2]):
+            root1, root2 = root2, root1
+
+        self.parents[root2] = root1
+        self.members[root1].extend(self.members.pop(root2))
+        for positions1, positions2 in zip(
+            self.positions[root1], self.positions.pop(root2), strict=True
+        ):
+            positions1.update(positions2)
+        self.max_weights[root1] = max(
+            self.max_weights[root1], self.max_weights.pop(root2)
+        )
+        del self.stamps[root2]
+        return root1
+
+    def find_matching_roots(self, ref: RefFields) -> set[int]:
+        """Find the sets having a reference that matches ref, as in Ref.matches."""
+        match_type, _, text_number, element_number, pos, length, _ = ref
+        roots = set()
+        for node in self.element_nodes.get((text_number, element_number), ()):
+            _, _, _, _, other_pos, other_length, _ = self.refs[node]
+            if pos <= other_pos + other_length - 1 and other_pos <= pos + length - 1:
+                roots.add(self.find(node))
+        if match_type >= 0 and match_type in self.match_type_nodes:
+            roots.add(self.find(self.match_type_nodes[match_type]))
+
+        return roots
+
+    def make_node(self, ref: RefFields) -> int:
+        """Add a reference as a set of its own."""
+        match_type, weight, text_number, element_number, pos, _, _ = ref
+        node = len(self.refs)
+        self.refs.append(ref)
+        self.nodes[ref] = node
+        self.parents.append(node)
+        self.members[node] = [node]
+        self.positions[node] = tuple(
+            {pos} if text_number == other_text_number else set()
+            for other_text_number in range(constants.NUM_FILES)
+        )
+        self.max_weights[node] = weight
+        self.stamps[node] = -1
+        self.element_nodes.setdefault((text_number, element_number), []).append(node)
+        if match_type >= 0:
+            self.match_type_nodes.setdefault(match_type, node)
+
+        return node
+
+    def add_refs(self, refs: list[RefFields]) -> None:
+        """Add references that belong together, merging the sets they match.
+
+        A reference that was added before is not added again, its set is
+        merged instead.
 
-        merged_cluster = Cluster()
-        merged_cluster.add_ref(ref)
+        Args:
+            refs: The fields of the references, at least one.
+        """
+        matching_roots = set()
+        for ref in refs:
+            matching_roots |= self.find_matching_roots(ref)
 
-        for cluster in overlaps:
-            if cluster.refs:
-                merged_cluster.add_cluster(cluster)
-                self.clusters.remove(cluster)
+        nodes = [
+            self.nodes[ref] if ref in self.nodes else self.make_node(ref)
+            for ref in refs
+        ]
+        root = self.find(nodes[0])
+        for node in nodes[1:]:
+            root = self.union(root, self.find(node))
+        for matching_root in matching_roots:
+            root = self.union(root, self.find(matching_root))
 
-        self.clusters.append(merged_cluster)
+        self.stamps[root] = next(self.clock)
 
-    def add_clusters(self, other_clusters: "Clusters") -> None:
-        """Add clusters from another Clusters object to the current instance.
+    def create_and_add_cluster(
+        self,
+        ref1: RefFields,
+        ref2: RefFields,
+    ) -> None:
+        """Adds two references to a new cluster and stores the cluster.
 
         Args:
-            other_clusters: The Clusters object containing the
-                clusters to be added.
+            ref1: The fields of the first reference to add to the cluster.
+            ref2: The fields of the second reference to add to the cluster.
         """
-        for other_cluster in other_clusters.clusters:
-            self.add_cluster(other_cluster)
+        self.add_refs([ref1, ref2])
 
-    @staticmethod
-    def have_same_ref(cluster: Cluster, other_cluster: Cluster):
-        """Check if two clusters share a common reference.
+    def add_ref(self, ref: RefFields) -> None:
+        """Adds a reference to the clusters it matches, merging them.
 
         Args:
-            cluster: The first cluster to compare.
-            other_cluster: The second cluster to compare.
+            ref: The fields of the reference to be added to a cluster.
+        """
+        self.add_refs([ref])
 
-        Returns:
-            True if any reference in other_cluster matches the cluster, else False.
+    def add_clusters(self, other_clusters: "Clusters") -> None:
+        """Add clusters from another Clusters object to the current instance.
+
+        Args:
+            other_clusters: The Clusters object containing the
+                clusters to be added.
         """
-        return any(cluster.matches(ref) for ref in other_cluster.refs)
+        for root in other_clusters.get_roots():
+            self.add_refs(
+                [other_clusters.refs[node] for node in other_clusters.members[root]]
+            )
 
     def add_cluster(self, other_cluster: Cluster) -> None:
-        """Add a cluster to the current collection of clusters.
-
-        This method identifies overlapping clusters based on reference similarity,
-        merges them with the given cluster, and updates the collection by removing
-        the old clusters and appending the merged one.
+        """Add a cluster, merging it with the clusters it matches.
 
         Args:
             other_cluster: The cluster to be added and potentially merged.
         """
-        overlaps: list[Cluster] = [
-            cluster
-            for cluster in self.clusters
-            if self.have_same_ref(cluster, other_cluster)
-        ]
-
-        merged_cluster = deepcopy(other_cluster)
-
-        for cluster in overlaps:
-            if cluster.refs:
-                merged_cluster.add_cluster(cluster)
-                self.clusters.remove(cluster)
-
-        self.clusters.append(merged_cluster)
+        self.add_refs([ref.to_fields() for ref in other_cluster.refs])
 
     def get_score(self) -> float:
         """Calculate the total score for all clusters.
@@ -113,4 +210,10 @@ class Clusters:
         Returns:
             The total score as a float.
         """
-        return sum(cluster.get_score() for cluster in self.clusters)
+        return sum(
+            score_cluster(
+                max_cluster_weight=self.max_weights[root],
+                low=min(len(positions) for positions in self.positions[root]),
+            )
+            for root in self.get_roots()
+        )
@@ -6,6 +6,7 @@ DEFAULT_SCORING_CHARACTERS = "§?!%"
 DEFAULT_SPECIAL_CHARACTERS = ".,;:?!&^(){}[]'" + '"'
 ELEMENTINFO_SCORE_HOPELESS = -99999.0
 MAX_PATH_LENGTH = 10
+MIN_PATH_LENGTH = 2
 NUM_FILES = 2
 DEFAULT_ANCHORPHRASE_MATCH_WEIGHT = 1.6
 DEFAULT_SCORING_CHARACTER_MATCH_WEIGHT = 0.5
@@ -14,3 +15,8 @@ DEFAULT_DICE_MIN_COUNTING_SCORE = 0.7
 DEFAULT_DICE_MIN_WORD_LENGTH = 5
 DEFAULT_DICEPHRASE_MATCH_WEIGHT = 3.0
 DEFAULT_NUMBER_MATCH_WEIGHT = 3.0
+DEFAULT_STEP_SCORE_CACHE_SIZE = 100000
+DEFAULT_MIN_CHUNK_SIZE = 50
+DEFAULT_CHUNK_ANCHOR_MIN_SUPPORT = 2
+DEFAULT_LOOKAHEAD_MARGIN = 2.0
+DEFAULT_LOAD_CHUNK_SIZE = 200
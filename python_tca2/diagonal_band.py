@@ -0,0 +1,112 @@
+"""Keep the alignment close to the diagonal of the two documents."""
+
+import math
+
+
+class DiagonalBand:
+    """A band around the length-proportional diagonal of two documents.
+
+    Parallel texts advance through both documents at roughly the same
+    relative pace, so a position (i, j) far from the line from (0, 0) to
+    the end of both documents is unlikely to be on the best path. Positions
+    outside the band are never scored.
+
+    The half width of the band is either an absolute number of elements in
+    the second document, or a fraction of the length of the longest
+    document. When no path survives inside the band, the band is widened
+    by doubling its half width.
+
+    Attributes:
+        width: The absolute half width, None if fraction is used.
+        fraction: The half width as a fraction of the longest document.
+        level: The number of times the current band has been doubled.
+        widenings: The number of times the band has been widened in total.
+        rejections: The number of steps rejected for leaving the band.
+    """
+
+    def __init__(self, width: int | None = None, fraction: float | None = None):
+        if (width is None) == (fraction is None):
+            raise ValueError("Give either the width or the fraction of the band")
+        self.width = width
+        self.fraction = fraction
+        self.level = 0
+        self.widenings = 0
+        self.rejections = 0
+
+    def get_half_width(self, lengths: tuple[int, int]) -> float:
+        """The current half width of the band.
+
+        Args:
+            lengths: The number of elements in each document.
+
+        Returns:
+            The largest allowed distance from the diagonal.
+        """
+        half_width = (
+            self.width if self.width is not None else self.fraction * max(lengths)
+        )
+        return max(half_width, 1) * 2**self.level
+
+    def get_diagonal(self, row: int, lengths: tuple[int, int]) -> float:
+        """The position in the second document the diagonal passes at row.
+
+        Args:
+            row: The position in the first document.
+            lengths: The number of elements in each document.
+
+        Returns:
+            The position on the diagonal.
+        """
+        return row * lengths[1] / lengths[0] if lengths[0] else 0.0
+
+    def covers(self, lengths: tuple[int, int]) -> bool:
+        """Check if the band has grown to hold every position."""
+        return self.get_half_width(lengths) >= max(lengths)
+
+    def contains(self, position: tuple[int, int], lengths: tuple[int, int]) -> bool:
+        """Check if a position is inside the band.
+
+        Args:
+            position: The position to check.
+            lengths: The number of elements in each document.
+
+        Returns:
+            True if the position is close enough to the diagonal.
+        """
+        return abs(
+            position[1] - self.get_diagonal(position[0], lengths)
+        ) <= self.get_half_width(lengths)
+
+    def get_columns(self, row: int, lengths: tuple[int, int]) -> range:
+        """The positions in the second document that are inside the band at row.
+
+        Args:
+            row: The position in the first document.
+            lengths: The number of elements in each document.
+
+        Returns:
+            The positions, clipped to the second document.
+        """
+        diagonal = self.get_diagonal(row, lengths)
+        half_width = self.get_half_width(lengths)
+        return range(
+            max(0, math.ceil(diagonal - half_width)),
+            min(lengths[1], math.floor(diagonal + half_width)) + 1,
+        )
+
+    def widen(self) -> None:
+        """Double the half width of the band."""
+        self.level += 1
+        self.widenings += 1
+
+    def reset(self) -> None:
+        """Return to the configured half width."""
+        self.level = 0
+
+    def to_json(self) -> dict[str, int | float | None]:
+        return {
+            "width": self.width,
+            "fraction": self.fraction,
+            "widenings": self.widenings,
+            "rejections": self.rejections,
+        }
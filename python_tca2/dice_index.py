@@ -0,0 +1,109 @@
+"""Find the word pairs of a step that may be Dice matches, without comparing all."""
+
+from collections import defaultdict
+from typing import Iterator
+
+from python_tca2 import constants
+from python_tca2.aelement import AlignmentElement
+
+WordPosition = tuple[AlignmentElement, int]
+"""A sentence and the position of a word in it."""
+
+
+def get_dice_words(alignment_elements: list[AlignmentElement]) -> list[WordPosition]:
+    """List the words long enough to take part in a Dice match.
+
+    Args:
+        alignment_elements: The sentences of one side of a step.
+
+    Returns:
+        The words, in sentence and word order.
+    """
+    return [
+        (alignment_element, position)
+        for alignment_element in alignment_elements
+        for position, word in enumerate(alignment_element.words)
+        if len(word) >= constants.DEFAULT_DICE_MIN_WORD_LENGTH
+    ]
+
+
+class BigramIndex:
+    """The words of one side of a step, indexed by their bigrams.
+
+    Attributes:
+        words: The indexed words, in sentence and word order.
+        postings: The indexes into words of the words having each bigram.
+    """
+
+    def __init__(self, words: list[WordPosition]) -> None:
+        self.words = words
+        self.postings: defaultdict[str, list[int]] = defaultdict(list)
+        for index, (alignment_element, position) in enumerate(words):
+            for bigram in alignment_element.profile.bigrams[position]:
+                self.postings[bigram].append(index)
+
+    def count_shared_bigrams(self, bigrams: frozenset[str]) -> dict[int, int]:
+        """Count the bigrams each indexed word shares with a word.
+
+        Args:
+            bigrams: The unique bigrams of the word.
+
+        Returns:
+            The number of shared bigrams of every word sharing any, keyed by
+            its index into words.
+        """
+        shared_counts: defaultdict[int, int] = defaultdict(int)
+        for bigram in bigrams:
+            for index in self.postings.get(bigram, ()):
+                shared_counts[index] += 1
+
+        return shared_counts
+
+
+def may_match(shared_count: int, sizes: tuple[int, int]) -> bool:
+    """Check if two words sharing shared_count bigrams may be any kind of match.
+
+    A word pair match needs a Dice score of at least the minimum counting
+    score, and a phrase match needs that share of the bigrams of one of the
+    words. Both need at least that share of the smaller bigram set. The
+    bound is a division like the scores themselves, so rounding never
+    discards a pair the scores would keep.
+
+    Args:
+        shared_count: The number of bigrams the words share.
+        sizes: The number of unique bigrams of each word.
+
+    Returns:
+        False if the words can be neither kind of match.
+    """
+    return shared_count / min(sizes) >= constants.DEFAULT_DICE_MIN_COUNTING_SCORE
+
+
+def find_dice_candidates(
+    left: list[AlignmentElement], right: list[AlignmentElement]
+) -> Iterator[tuple[WordPosition, WordPosition]]:
+    """Find the word pairs that may be Dice matches.
+
+    Only the words of the right side sharing a bigram with a left word are
+    visited, and of those only the ones passing may_match are yielded. The
+    pairs come in the order of the cross product of the words of both sides,
+    which is the order of the exhaustive comparison.
+
+    Args:
+        left: The sentences of the first side of a step.
+        right: The sentences of the second side of a step.
+
+    Yields:
+        A word from each side.
+    """
+    right_index = BigramIndex(get_dice_words(right))
+    for left_word in get_dice_words(left):
+        left_bigrams = left_word[0].profile.bigrams[left_word[1]]
+        shared_counts = right_index.count_shared_bigrams(left_bigrams)
+        for index in sorted(shared_counts):
+            right_word = right_index.words[index]
+            right_bigrams = right_word[0].profile.bigrams[right_word[1]]
+            if may_match(
+                shared_counts[index], sizes=(len(left_bigrams), len(right_bigrams))
+            ):
+                yield left_word, right_word
@@ -0,0 +1,130 @@
+"""Versioned binary cache files, kept in a cache directory of the user.
+
+A cache file is only read back by the code that wrote it. Cached objects
+are made by the code of the package, and unpickled into its classes, so
+the header holds a fingerprint of the source of the package besides its
+version, which stays the same while the code is being worked on.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+CACHE_FORMAT_VERSION = 1
+"""The version of the layout of cache files, raised when it changes."""
+
+MAGIC = b"TCA2CACHE\n"
+"""The bytes every cache file starts with."""
+
+UNREADABLE_CACHE_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+"""The errors of reading a missing, truncated or incompatible cache file."""
+
+
+def get_cache_dir() -> Path:
+    """Find the directory the cache files are kept in.
+
+    Returns:
+        $TCA2_CACHE_DIR if it is set, else python-tca2 in $XDG_CACHE_HOME,
+        or in ~/.cache.
+    """
+    if cache_dir := os.environ.get("TCA2_CACHE_DIR"):
+        return Path(cache_dir)
+
+    return (
+        Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "python-tca2"
+    )
+
+
+def get_package_version() -> str:
+    """The installed version of python-tca2, or "unknown" if not installed."""
+    try:
+        return version("python-tca2")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@functools.cache
+def get_code_fingerprint() -> str:
+    """The SHA-256 digest of the source of every module of the package.
+
+    Returns:
+        The digest in hexadecimal, the same as long as no module changes.
+    """
+    digest = hashlib.sha256()
+    for module in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(module.name.encode("utf-8") + b"\0")
+        digest.update(module.read_bytes() + b"\0")
+
+    return digest.hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    """The SHA-256 digest of the content of a file, in hexadecimal."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def make_header(key: dict) -> dict:
+    """Make the header of a cache file, valid for key in this package code."""
+    return {
+        "format": CACHE_FORMAT_VERSION,
+        "package_version": get_package_version(),
+        "code": get_code_fingerprint(),
+        **key,
+    }
+
+
+def write_cache_file(path: Path, key: dict, payload: object) -> None:
+    """Write a cache file, replacing any file at path at once.
+
+    Args:
+        path: The path of the cache file.
+        key: What the payload was made from, checked when it is read.
+        payload: The cached object.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary_name = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(descriptor, "wb") as temporary:
+            temporary.write(MAGIC)
+            pickle.dump(make_header(key), temporary, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, temporary, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_name, path)
+    except BaseException:
+        Path(temporary_name).unlink(missing_ok=True)
+        raise
+
+
+def read_cache_file(path: Path, key: dict) -> object | None:
+    """Read a cache file made for key by this package version.
+
+    Args:
+        path: The path of the cache file.
+        key: What the payload must have been made from.
+
+    Returns:
+        The cached object, or None if there is no such cache file, or it is
+        unreadable, of another format, package version or package code, or
+        for another key.
+    """
+    try:
+        with path.open("rb") as cache_file:
+            if cache_file.read(len(MAGIC)) != MAGIC:
+                return None
+            if pickle.load(cache_file) != make_header(key):
+                return None
+            return pickle.load(cache_file)
+    except UNREADABLE_CACHE_ERRORS:
+        return None
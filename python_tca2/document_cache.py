@@ -0,0 +1,80 @@
+"""Keep loaded documents on disk, so a document is loaded only once.
+
+A loaded sentence holds its words, anchor word hits, scoring characters
+and feature profile, which depend only on the text of the sentence, the
+anchor word list and the code of the package, constants included. The
+loaded sentences of a document are cached under a digest of the
+sentences, of the anchor word list and of the number of the document,
+which decides the language of the anchor words. The cache file header
+adds the package version and a fingerprint of its code, so a document
+loaded by edited code is loaded again.
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.disk_cache import read_cache_file, write_cache_file
+
+CACHE_SUBDIR = "documents"
+
+
+def make_key(sentences: list[str], text_number: int, anchor_digest: str) -> dict:
+    """Make the key a loaded document is cached under.
+
+    Args:
+        sentences: The sentences of the document.
+        text_number: The number of the document.
+        anchor_digest: The digest of the anchor word list the document is
+            loaded with, from AnchorWordList.digest.
+
+    Returns:
+        The key.
+    """
+    return {
+        "sentences_sha256": hashlib.sha256(
+            json.dumps(sentences).encode("utf-8")
+        ).hexdigest(),
+        "text_number": text_number,
+        "anchor_word_list_sha256": anchor_digest,
+    }
+
+
+def get_cache_path(key: dict, cache_dir: Path) -> Path:
+    """The path of the cached document of a key."""
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+    return cache_dir / CACHE_SUBDIR / f"{digest}.pickle"
+
+
+def read_document(key: dict, cache_dir: Path) -> list[AlignmentElement] | None:
+    """Read a cached document.
+
+    Args:
+        key: The key the document was cached under.
+        cache_dir: The cache directory.
+
+    Returns:
+        The loaded sentences, or None if they are not cached.
+    """
+    document = read_cache_file(get_cache_path(key, cache_dir), key=key)
+    return document if isinstance(document, list) else None
+
+
+def write_document(
+    key: dict, cache_dir: Path, document: list[AlignmentElement]
+) -> None:
+    """Cache a loaded document.
+
+    Args:
+        key: The key to cache the document under.
+        cache_dir: The cache directory.
+        document: The loaded sentences.
+    """
+    write_cache_file(get_cache_path(key, cache_dir), key=key, payload=document)
+
+
+def clear_documents(cache_dir: Path) -> None:
+    """Remove every cached document, leaving the rest of the cache."""
+    shutil.rmtree(cache_dir / CACHE_SUBDIR, ignore_errors=True)
@@ -1,31 +1,43 @@
 import json
 from collections import Counter
-from itertools import product
 from typing import Iterator
 
 from python_tca2 import (
     constants,
-    match,
+    pair_matches,
     similarity_utils,
 )
+from python_tca2.aelement import AlignmentElement
 from python_tca2.aligned_sentence_elements import AlignedSentenceElements
 from python_tca2.alignment_utils import count_words
 from python_tca2.anchorwordhit import AnchorWordHit
 from python_tca2.clusters import Clusters
-from python_tca2.ref import Ref
+from python_tca2.pair_match_cache import PairMatchCache
+from python_tca2.pair_matches import (
+    MATCH_FINDERS,
+    MatchFinder,
+    PairMatches,
+    combine_ranked_matches,
+)
+from python_tca2.ref import RefFields
 
 
 class ElementInfoToBeCompared:
     def __init__(
         self,
         aligned_sentence_elements: AlignedSentenceElements,
+        pair_match_cache: PairMatchCache | None = None,
     ) -> None:
         self.aligned_sentence_elements = aligned_sentence_elements
+        self.pair_match_cache = (
+            PairMatchCache() if pair_match_cache is None else pair_match_cache
+        )
         self.score: float | None = None
 
     def to_json(self):
         return {
             "score": self.get_score(),
+            "clusters": self.make_clusters().to_json(),
             "info": [
                 alignment_element.to_json()
                 for alignment_elements in self.aligned_sentence_elements
@@ -67,21 +79,20 @@ class ElementInfoToBeCompared:
             constants.DEFAULT_LENGTH_RATIO,
         )
 
-    def calculate_clusters_score(self) -> float:
+    def make_clusters(self) -> Clusters:
+        """Cluster the anchor word hits and the other matches of the step."""
         common_clusters = Clusters()
         for anchor_word_clusters in self.make_anchor_word_clusters():
             common_clusters.add_clusters(anchor_word_clusters)
 
-        for score_function in [
-            self.find_number_matches,
-            self.find_propername_matches,
-            self.find_dice_matches,
-            self.find_special_character_matches,
-        ]:
-            for ref1, ref2 in score_function():
+        for finder in MATCH_FINDERS:
+            for ref1, ref2 in self.find_matches(finder):
                 common_clusters.create_and_add_cluster(ref1=ref1, ref2=ref2)
 
-        return common_clusters.get_score()
+        return common_clusters
+
+    def calculate_clusters_score(self) -> float:
+        return self.make_clusters().get_score()
 
     def adjust_for_length_correlation(self, score: float) -> float:
         lengths = [
@@ -119,93 +130,6 @@ class ElementInfoToBeCompared:
 
         return score if self.is11() else score - 0.001
 
-    def find_dice_matches(self) -> Iterator[tuple[Ref, Ref]]:
-        half_refs = [
-            [
-                (alignment_element, position)
-                for alignment_element in alignment_elements
-                for position, _ in enumerate(alignment_element.words)
-            ]
-            for alignment_elements in self.aligned_sentence_elements
-        ]
-
-        for (info1, x), (info2, y) in product(*half_refs):
-            if (
-                len(info1.words[x]) >= constants.DEFAULT_DICE_MIN_WORD_LENGTH
-                and len(info2.words[y]) >= constants.DEFAULT_DICE_MIN_WORD_LENGTH
-            ):
-                if similarity_utils.dice_match_word_pair(
-                    info1.words[x],
-                    info2.words[y],
-                    constants.DEFAULT_DICE_MIN_COUNTING_SCORE,
-                ):
-                    yield Ref(
-                        match_type=match.DICE,
-                        weight=constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT,
-                        text_number=info1.text_number,
-                        element_number=info1.element_number,
-                        pos=x,
-                        length=1,
-                        word=info1.words[x],
-                    ), Ref(
-                        match_type=match.DICE,
-                        weight=constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT,
-                        text_number=info2.text_number,
-                        element_number=info2.element_number,
-                        pos=y,
-                        length=1,
-                        word=info2.words[y],
-                    )
-                next_word1 = info1.words[x + 1] if x < len(info1.words) - 1 else ""
-                if len(
-                    next_word1
-                ) >= constants.DEFAULT_DICE_MIN_WORD_LENGTH and similarity_utils.dice_match_word_with_phrase(
-                    phrase=(info1.words[x], next_word1),
-                    word=info2.words[y],
-                ):
-                    yield Ref(
-                        match_type=match.DICE,
-                        weight=constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT,
-                        text_number=info1.text_number,
-                        element_number=info1.element_number,
-                        pos=x,
-                        length=2,
-                        word=" ".join(info1.words[x : x + 2]),
-                    ), Ref(
-                        match_type=match.DICE,
-                        weight=constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT,
-                        text_number=info2.text_number,
-                        element_number=info2.element_number,
-                        pos=y,
-                        length=1,
-                        word=info2.words[y],
-                    )
-
-                next_word2 = info2.words[y + 1] if y < len(info2.words) - 1 else ""
-                if len(
-                    next_word2
-                ) >= constants.DEFAULT_DICE_MIN_WORD_LENGTH and similarity_utils.dice_match_word_with_phrase(
-                    word=info1.words[x],
-                    phrase=(info2.words[y], next_word2),
-                ):
-                    yield Ref(
-                        match_type=match.DICE,
-                        weight=constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT,
-                        text_number=info1.text_number,
-                        element_number=info1.element_number,
-                        pos=x,
-                        length=1,
-                        word=info1.words[x],
-                    ), Ref(
-                        match_type=match.DICE,
-                        weight=constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT,
-                        text_number=info2.text_number,
-                        element_number=info2.element_number,
-                        pos=y,
-                        length=2,
-                        word=" ".join(info2.words[y : y + 2]),
-                    )
-
     def get_these_hits(
         self, hits: list[list[AnchorWordHit]], current: list[int]
     ) -> list[AnchorWordHit]:
@@ -235,7 +159,7 @@ class ElementInfoToBeCompared:
             ):
                 anchor_word_clusters.add_ref(ref)
 
-            if anchor_word_clusters.clusters:
+            if anchor_word_clusters.refs:
                 yield anchor_word_clusters
 
     @staticmethod
@@ -258,7 +182,7 @@ class ElementInfoToBeCompared:
         current: list[int],
         smallest: int,
         present_in_all_texts: bool,
-    ) -> Iterator[Ref]:
+    ) -> Iterator[RefFields]:
         for text_number in range(constants.NUM_FILES):
             if current[text_number] < len(hits[text_number]):
                 while (
@@ -269,99 +193,54 @@ class ElementInfoToBeCompared:
                     if (
                         present_in_all_texts
                     ):  # if the smallest index is present in all texts
-                        yield Ref(
-                            match_type=hit.index,
-                            weight=(
-                                constants.DEFAULT_ANCHORPHRASE_MATCH_WEIGHT
-                                if count_words(hit.word) > 1
-                                else constants.DEFAULT_ANCHOR_WORD_MATCH_WEIGHT
-                            ),
-                            text_number=text_number,
-                            element_number=hit.element_number,
-                            pos=hit.pos,
-                            length=count_words(hit.word),
-                            word=hit.word,
+                        length = count_words(hit.word)
+                        yield (
+                            hit.index,
+                            constants.DEFAULT_ANCHORPHRASE_MATCH_WEIGHT
+                            if length > 1
+                            else constants.DEFAULT_ANCHOR_WORD_MATCH_WEIGHT,
+                            text_number,
+                            hit.element_number,
+                            hit.pos,
+                            length,
+                            hit.word,
                         )
 
                     current[text_number] += 1  # increment the count
 
-    def find_propername_matches(self) -> Iterator[tuple[Ref, Ref]]:
-        pairs = [
-            [
-                Ref(
-                    match_type=match.PROPER,
-                    weight=constants.DEFAULT_PROPERNAME_MATCH_WEIGHT,
-                    text_number=alignment_element.text_number,
-                    element_number=alignment_element.element_number,
-                    pos=position,
-                    length=1,
-                    word=word,
-                )
-                for alignment_element in alignment_elements
-                for position, word in enumerate(alignment_element.words)
-            ]
-            for alignment_elements in self.aligned_sentence_elements
-        ]
-
-        for ref1, ref2 in product(*pairs):
-            if (
-                ref2.word
-                and ref1.word[0].isupper()
-                and ref2.word[0].isupper()
-                and ref1.word == ref2.word
-            ):
-                yield ref1, ref2
+    def get_pair_matches(
+        self, left: AlignmentElement, right: AlignmentElement
+    ) -> PairMatches:
+        return self.pair_match_cache.get(left, right)
+
+    def find_matches(
+        self, finder: MatchFinder
+    ) -> Iterator[tuple[RefFields, RefFields]]:
+        """Find the matches of one kind between the sentences of the step.
+
+        Args:
+            finder: One of pair_matches.MATCH_FINDERS.
+
+        Returns:
+            The fields of the reference pairs of the matches.
+        """
+        kind = MATCH_FINDERS.index(finder)
+        return combine_ranked_matches(
+            self.aligned_sentence_elements,
+            lambda left, right: self.get_pair_matches(left, right)[kind],
+        )
 
-    def are_words_numbers_and_equal(self, word1: str, word2: str) -> bool:
-        """Check if both words are numbers."""
-        try:
-            return float(word1) == float(word2)
-        except ValueError:
-            return False
+    def find_number_matches(self) -> Iterator[tuple[RefFields, RefFields]]:
+        return self.find_matches(pair_matches.find_number_matches)
 
-    def find_number_matches(self) -> Iterator[tuple[Ref, Ref]]:
-        pairs = [
-            [
-                Ref(
-                    match_type=match.NUMBER,
-                    weight=constants.DEFAULT_NUMBER_MATCH_WEIGHT,
-                    text_number=alignment_element.text_number,
-                    element_number=alignment_element.element_number,
-                    pos=position,
-                    length=1,
-                    word=word,
-                )
-                for alignment_element in alignment_elements
-                for position, word in enumerate(alignment_element.words)
-            ]
-            for alignment_elements in self.aligned_sentence_elements
-        ]
+    def find_propername_matches(self) -> Iterator[tuple[RefFields, RefFields]]:
+        return self.find_matches(pair_matches.find_propername_matches)
 
-        for ref1, ref2 in product(*pairs):
-            if self.are_words_numbers_and_equal(ref1.word, ref2.word):
-                yield ref1, ref2
-
-    def find_special_character_matches(self) -> Iterator[tuple[Ref, Ref]]:
-        pairs = [
-            [
-                Ref(
-                    match_type=match.SCORING_CHARACTERS,
-                    weight=constants.DEFAULT_SCORING_CHARACTER_MATCH_WEIGHT,
-                    text_number=alignment_element.text_number,
-                    element_number=alignment_element.element_number,
-                    pos=0,
-                    length=1,
-                    word=char,
-                )
-                for alignment_element in alignment_elements
-                for char in alignment_element.scoring_characters
-            ]
-            for alignment_elements in self.aligned_sentence_elements
-        ]
+    def find_dice_matches(self) -> Iterator[tuple[RefFields, RefFields]]:
+        return self.find_matches(pair_matches.find_dice_matches)
 
-        for ref1, ref2 in product(*pairs):
-            if ref1.word == ref2.word:
-                yield ref1, ref2
+    def find_special_character_matches(self) -> Iterator[tuple[RefFields, RefFields]]:
+        return self.find_matches(pair_matches.find_special_character_matches)
 
     def find_hits(self) -> list[list[AnchorWordHit]]:
         return [
@@ -0,0 +1,64 @@
+from collections import Counter
+from dataclasses import dataclass
+
+from python_tca2 import similarity_utils
+
+
+def parse_number(word: str) -> float | None:
+    """Parse a word as a number.
+
+    Args:
+        word: The word to parse.
+
+    Returns:
+        The value of the word, or None if it is not a number.
+    """
+    try:
+        return float(word)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureProfile:
+    """The features of a sentence the scoring functions compare.
+
+    A sentence takes part in many steps, so the features are computed once,
+    when the sentence is loaded. Every tuple has one item per word.
+
+    Attributes:
+        lowercase_words: The words in lower case.
+        bigrams: The unique bigrams of each lower cased word.
+        numbers: The value of each word, None if it is not a number.
+        capitalized: Whether each word starts with an upper case letter.
+        scoring_character_counts: How many times each scoring character occurs.
+    """
+
+    lowercase_words: tuple[str, ...]
+    bigrams: tuple[frozenset[str], ...]
+    numbers: tuple[float | None, ...]
+    capitalized: tuple[bool, ...]
+    scoring_character_counts: tuple[tuple[str, int], ...]
+
+    @classmethod
+    def from_words(cls, words: list[str], scoring_characters: str) -> "FeatureProfile":
+        """Compute the profile of a sentence.
+
+        Args:
+            words: The words of the sentence.
+            scoring_characters: The scoring characters of the sentence.
+
+        Returns:
+            The profile.
+        """
+        lowercase_words = tuple(word.lower() for word in words)
+        return cls(
+            lowercase_words=lowercase_words,
+            bigrams=tuple(
+                frozenset(similarity_utils.string_to_bigram(word))
+                for word in lowercase_words
+            ),
+            numbers=tuple(parse_number(word) for word in words),
+            capitalized=tuple(word[0].isupper() for word in words),
+            scoring_character_counts=tuple(sorted(Counter(scoring_characters).items())),
+        )
@@ -0,0 +1,92 @@
+"""The matches between sentence pairs the search is working on."""
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.pair_matches import PairMatches, find_pair_matches
+
+
+class PairMatchCache:
+    """Remembers the matches between pairs of sentences, one of each text.
+
+    A sentence pair takes part in every step covering both sentences, so
+    the matches are found when the pair is first scored and reused after
+    that. The search never goes back, so the pairs before the start of the
+    search window are forgotten as the window moves on.
+
+    Attributes:
+        matches: The matches, keyed by the element numbers of the sentences.
+        window_start: The element numbers of the first sentences of the
+            window in each text.
+        hits: The number of lookups that found the matches.
+        misses: The number of lookups that had to find the matches.
+        evictions: The number of sentence pairs forgotten.
+    """
+
+    def __init__(self) -> None:
+        self.matches: dict[tuple[int, int], PairMatches] = {}
+        self.window_start = (0, 0)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def get(self, left: AlignmentElement, right: AlignmentElement) -> PairMatches:
+        """Get the matches between two sentences, finding them if needed.
+
+        Args:
+            left: A sentence of the first text.
+            right: A sentence of the second text.
+
+        Returns:
+            The matches of the sentence pair.
+        """
+        key = (left.element_number, right.element_number)
+        pair_matches = self.matches.get(key)
+        if pair_matches is None:
+            self.misses += 1
+            pair_matches = find_pair_matches(left, right)
+            self.matches[key] = pair_matches
+        else:
+            self.hits += 1
+
+        return pair_matches
+
+    def forget_before(self, element_numbers: tuple[int, int]) -> None:
+        """Move the start of the window, forgetting the pairs before it.
+
+        The window never moves back, so smaller element numbers are ignored.
+
+        Args:
+            element_numbers: The element numbers of the first sentences still
+                needed in each text.
+        """
+        window_start = (
+            max(self.window_start[0], element_numbers[0]),
+            max(self.window_start[1], element_numbers[1]),
+        )
+        if window_start == self.window_start:
+            return
+
+        self.window_start = window_start
+        outside = [
+            key
+            for key in self.matches
+            if key[0] < window_start[0] or key[1] < window_start[1]
+        ]
+        for key in outside:
+            del self.matches[key]
+        self.evictions += len(outside)
+
+    def clear(self) -> None:
+        """Forget all matches and reset the window. The counters are kept."""
+        self.matches.clear()
+        self.window_start = (0, 0)
+
+    def to_json(self) -> dict[str, int]:
+        return {
+            "size": len(self.matches),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
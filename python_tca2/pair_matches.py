@@ -0,0 +1,262 @@
+"""Matches between one sentence of each text, and how to combine them into a step."""
+
+import math
+from collections import defaultdict
+from operator import itemgetter
+from typing import Callable, Hashable, Iterable, Iterator
+
+from python_tca2 import constants, match, similarity_utils
+from python_tca2.aelement import AlignmentElement
+from python_tca2.aligned_sentence_elements import AlignedSentenceElements
+from python_tca2.dice_index import find_dice_candidates
+from python_tca2.ref import RefFields
+
+RankedMatch = tuple[int, RefFields, RefFields]
+"""A match, after the position of the item it starts at in the first sentence."""
+
+MatchFinder = Callable[[AlignmentElement, AlignmentElement], Iterator[RankedMatch]]
+"""Finds the matches of one kind between two sentences."""
+
+PairMatches = tuple[tuple[RankedMatch, ...], ...]
+"""The matches of a sentence pair, one tuple for each of MATCH_FINDERS."""
+
+
+def make_ref_fields(
+    alignment_element: AlignmentElement,
+    match_type: int,
+    weight: float,
+    pos: int,
+    length: int = 1,
+) -> RefFields:
+    """Make the fields of a reference to words of a sentence.
+
+    Args:
+        alignment_element: The sentence.
+        match_type: The kind of match the reference is part of.
+        weight: The weight of the match.
+        pos: The position of the first word.
+        length: The number of words.
+
+    Returns:
+        The fields of the reference.
+    """
+    return (
+        match_type,
+        weight,
+        alignment_element.text_number,
+        alignment_element.element_number,
+        pos,
+        length,
+        alignment_element.words[pos]
+        if length == 1
+        else " ".join(alignment_element.words[pos : pos + length]),
+    )
+
+
+def equality_join(
+    left_keys: Iterable[tuple[int, Hashable]],
+    right_keys: Iterable[tuple[int, Hashable]],
+) -> Iterator[tuple[int, int]]:
+    """Pair the items of two sentences having equal keys, with a hash join.
+
+    The pairs come in the order of the cross product of the items, but
+    only the equal pairs are visited.
+
+    Args:
+        left_keys: The position and key of items of the first sentence.
+        right_keys: The position and key of items of the second sentence.
+
+    Yields:
+        The positions of each pair of items with equal keys.
+    """
+    right_positions: defaultdict[Hashable, list[int]] = defaultdict(list)
+    for y, key in right_keys:
+        right_positions[key].append(y)
+
+    for x, key in left_keys:
+        for y in right_positions.get(key, ()):
+            yield x, y
+
+
+def get_number_keys(alignment_element: AlignmentElement) -> Iterator[tuple[int, float]]:
+    """The value of the numbers of a sentence, NaN never being equal."""
+    for position, number in enumerate(alignment_element.profile.numbers):
+        if number is not None and not math.isnan(number):
+            yield position, number
+
+
+def get_propername_keys(
+    alignment_element: AlignmentElement,
+) -> Iterator[tuple[int, str]]:
+    """The capitalized words of a sentence."""
+    for position, capitalized in enumerate(alignment_element.profile.capitalized):
+        if capitalized:
+            yield position, alignment_element.words[position]
+
+
+def find_number_matches(
+    left: AlignmentElement, right: AlignmentElement
+) -> Iterator[RankedMatch]:
+    """Find the words that are the same number in both sentences."""
+    weight = constants.DEFAULT_NUMBER_MATCH_WEIGHT
+    for x, y in equality_join(get_number_keys(left), get_number_keys(right)):
+        yield (
+            x,
+            make_ref_fields(left, match.NUMBER, weight, x),
+            make_ref_fields(right, match.NUMBER, weight, y),
+        )
+
+
+def find_propername_matches(
+    left: AlignmentElement, right: AlignmentElement
+) -> Iterator[RankedMatch]:
+    """Find the capitalized words found in both sentences."""
+    weight = constants.DEFAULT_PROPERNAME_MATCH_WEIGHT
+    for x, y in equality_join(get_propername_keys(left), get_propername_keys(right)):
+        yield (
+            x,
+            make_ref_fields(left, match.PROPER, weight, x),
+            make_ref_fields(right, match.PROPER, weight, y),
+        )
+
+
+def find_dice_matches(
+    left: AlignmentElement, right: AlignmentElement
+) -> Iterator[RankedMatch]:
+    """Find the words and two word phrases that are Dice matches."""
+    weight = constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT
+    bigrams1 = left.profile.bigrams
+    bigrams2 = right.profile.bigrams
+    for (_, x), (_, y) in find_dice_candidates([left], [right]):
+        if similarity_utils.dice_match_bigrams(
+            bigrams1[x],
+            bigrams2[y],
+            constants.DEFAULT_DICE_MIN_COUNTING_SCORE,
+        ):
+            yield (
+                x,
+                make_ref_fields(left, match.DICE, weight, x),
+                make_ref_fields(right, match.DICE, weight, y),
+            )
+
+        next_word1 = left.words[x + 1] if x < len(left.words) - 1 else ""
+        if len(next_word1) >= constants.DEFAULT_DICE_MIN_WORD_LENGTH and (
+            similarity_utils.dice_match_bigrams_with_phrase(
+                word_bigrams=bigrams2[y],
+                phrase_bigrams=(bigrams1[x], bigrams1[x + 1]),
+            )
+        ):
+            yield (
+                x,
+                make_ref_fields(left, match.DICE, weight, x, length=2),
+                make_ref_fields(right, match.DICE, weight, y),
+            )
+
+        next_word2 = right.words[y + 1] if y < len(right.words) - 1 else ""
+        if len(next_word2) >= constants.DEFAULT_DICE_MIN_WORD_LENGTH and (
+            similarity_utils.dice_match_bigrams_with_phrase(
+                word_bigrams=bigrams1[x],
+                phrase_bigrams=(bigrams2[y], bigrams2[y + 1]),
+            )
+        ):
+            yield (
+                x,
+                make_ref_fields(left, match.DICE, weight, x),
+                make_ref_fields(right, match.DICE, weight, y, length=2),
+            )
+
+
+def find_special_character_matches(
+    left: AlignmentElement, right: AlignmentElement
+) -> Iterator[RankedMatch]:
+    """Find the scoring characters found in both sentences.
+
+    The references point at the start of the sentences and hold the
+    character, so a match is ranked by the position of the character among
+    the scoring characters of the first sentence.
+    """
+    left_characters = {char for char, _ in left.profile.scoring_character_counts}
+    if not any(
+        char in left_characters for char, _ in right.profile.scoring_character_counts
+    ):
+        return
+
+    weight = constants.DEFAULT_SCORING_CHARACTER_MATCH_WEIGHT
+    for rank, y in equality_join(
+        enumerate(left.scoring_characters), enumerate(right.scoring_characters)
+    ):
+        yield (
+            rank,
+            (
+                match.SCORING_CHARACTERS,
+                weight,
+                left.text_number,
+                left.element_number,
+                0,
+                1,
+                left.scoring_characters[rank],
+            ),
+            (
+                match.SCORING_CHARACTERS,
+                weight,
+                right.text_number,
+                right.element_number,
+                0,
+                1,
+                right.scoring_characters[y],
+            ),
+        )
+
+
+MATCH_FINDERS: tuple[MatchFinder, ...] = (
+    find_number_matches,
+    find_propername_matches,
+    find_dice_matches,
+    find_special_character_matches,
+)
+"""The kinds of matches between sentences, in the order they are clustered."""
+
+
+def find_pair_matches(left: AlignmentElement, right: AlignmentElement) -> PairMatches:
+    """Find all kinds of matches between two sentences.
+
+    Args:
+        left: A sentence of the first text.
+        right: A sentence of the second text.
+
+    Returns:
+        The matches found by each of MATCH_FINDERS.
+    """
+    return tuple(tuple(finder(left, right)) for finder in MATCH_FINDERS)
+
+
+def combine_ranked_matches(
+    aligned_sentence_elements: AlignedSentenceElements,
+    get_ranked_matches: Callable[
+        [AlignmentElement, AlignmentElement], Iterable[RankedMatch]
+    ],
+) -> Iterator[tuple[RefFields, RefFields]]:
+    """Combine the matches of every sentence pair of a step.
+
+    The matches come in the order of the cross product of the items of all
+    the sentences on each side, as if the sentences of each side were one.
+    The cluster score sums the clusters in the order they are made, so this
+    keeps the score of a step identical to the exhaustive comparison.
+
+    Args:
+        aligned_sentence_elements: The sentences of the step.
+        get_ranked_matches: Finds the matches of a sentence pair.
+
+    Returns:
+        The fields of the reference pairs of the matches.
+    """
+    ranked_matches = sorted(
+        (
+            (index, *ranked_match)
+            for index, left in enumerate(aligned_sentence_elements[0])
+            for right in aligned_sentence_elements[1]
+            for ranked_match in get_ranked_matches(left, right)
+        ),
+        key=itemgetter(0, 1),
+    )
+    return ((ref1, ref2) for _, _, ref1, ref2 in ranked_matches)
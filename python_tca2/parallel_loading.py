@@ -0,0 +1,99 @@
+"""Load the sentences of long documents in a process pool, a chunk at a time.
+
+Loading a sentence, splitting it into words and finding its anchor word
+hits and features, does not depend on the other sentences. The sentences
+are sent to the workers in chunks, and the loaded chunks are put back
+together in order, so the result is the same as loading them one by one.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.anchorwordlist import AnchorWordList
+
+_anchor_word_list = AnchorWordList()
+"""The anchor word list of the sentences loaded in a worker process."""
+
+
+def set_anchor_word_list(anchor_word_list: AnchorWordList) -> None:
+    """Install the anchor word list of a worker process.
+
+    Args:
+        anchor_word_list: The anchor word list of the loading process.
+    """
+    global _anchor_word_list  # noqa: PLW0603
+    _anchor_word_list = anchor_word_list
+
+
+def load_chunk(
+    text_number: int, start: int, sentences: list[str]
+) -> list[AlignmentElement]:
+    """Load consecutive sentences of a document.
+
+    Args:
+        text_number: The number of the document.
+        start: The element number of the first sentence.
+        sentences: The sentences.
+
+    Returns:
+        The loaded sentences.
+    """
+    return [
+        AlignmentElement(
+            anchor_word_list=_anchor_word_list,
+            text=sentence,
+            text_number=text_number,
+            element_number=element_number,
+        )
+        for element_number, sentence in enumerate(sentences, start)
+    ]
+
+
+def load_in_parallel(
+    sentences_tuple: tuple[list[str], list[str]],
+    anchor_word_list: AnchorWordList,
+    workers: int,
+    chunk_size: int,
+) -> tuple[list[AlignmentElement], list[AlignmentElement]]:
+    """Load the sentences of both documents in a process pool.
+
+    The anchor word list is compiled here, and sent once to every worker.
+
+    Args:
+        sentences_tuple: The sentences of each document.
+        anchor_word_list: The anchor word list.
+        workers: The number of worker processes.
+        chunk_size: The number of sentences loaded by a task.
+
+    Returns:
+        The loaded sentences of each document, as AlignmentModel.load_sentences
+        loads them.
+    """
+    anchor_word_list.compile()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=set_anchor_word_list,
+        initargs=(anchor_word_list,),
+    ) as executor:
+        futures = [
+            [
+                executor.submit(
+                    load_chunk,
+                    text_number,
+                    start,
+                    sentences[start : start + chunk_size],
+                )
+                for start in range(0, len(sentences), chunk_size)
+            ]
+            for text_number, sentences in enumerate(sentences_tuple)
+        ]
+        first, second = (
+            [
+                alignment_element
+                for future in document_futures
+                for alignment_element in future.result()
+            ]
+            for document_futures in futures
+        )
+
+    return first, second
@@ -0,0 +1,121 @@
+"""Compare the alignments produced by two search engines."""
+
+from dataclasses import dataclass
+from itertools import pairwise
+
+from python_tca2.aligned import Aligned
+from python_tca2.alignment_suggestion import AlignmentSuggestion
+
+
+@dataclass
+class ParityDifference:
+    """A stretch where two alignments disagree.
+
+    Both alignments pass through start and end, but take different steps
+    in between.
+
+    Attributes:
+        start: The position where the alignments part ways.
+        end: The position where the alignments meet again.
+        lookahead_steps: The steps taken by the lookahead search.
+        dynamic_steps: The steps taken by the dynamic programming search.
+    """
+
+    start: tuple[int, int]
+    end: tuple[int, int]
+    lookahead_steps: list[AlignmentSuggestion]
+    dynamic_steps: list[AlignmentSuggestion]
+
+    def __str__(self) -> str:
+        return (
+            f"{self.start} -> {self.end}: "
+            f"lookahead {self.lookahead_steps}, dynamic {self.dynamic_steps}"
+        )
+
+
+def to_steps(aligned: Aligned) -> list[AlignmentSuggestion]:
+    """Convert an alignment into the steps that produced it.
+
+    Args:
+        aligned: The alignment to convert.
+
+    Returns:
+        The number of elements taken from each text, per alignment.
+    """
+    return [
+        AlignmentSuggestion(
+            len(alignment_elements) for alignment_elements in aligned_sentence_elements
+        )
+        for aligned_sentence_elements in aligned.alignments
+    ]
+
+
+def to_positions(
+    steps: list[AlignmentSuggestion],
+) -> list[tuple[int, int]]:
+    """List the positions visited by a sequence of steps, starting at (0, 0)."""
+    positions = [(0, 0)]
+    for step in steps:
+        positions.append((positions[-1][0] + step[0], positions[-1][1] + step[1]))
+
+    return positions
+
+
+def find_differences(
+    lookahead_steps: list[AlignmentSuggestion],
+    dynamic_steps: list[AlignmentSuggestion],
+) -> list[ParityDifference]:
+    """Find the stretches where two step sequences disagree.
+
+    The sequences are split at the positions both of them visit. Every
+    stretch between two such positions where the steps differ is reported.
+    Positions are visited in the same order by both sequences, since every
+    step moves forward in at least one text.
+
+    Args:
+        lookahead_steps: The steps taken by the lookahead search.
+        dynamic_steps: The steps taken by the dynamic programming search.
+
+    Returns:
+        The differences, in document order.
+    """
+    lookahead_indexes = {
+        position: index for index, position in enumerate(to_positions(lookahead_steps))
+    }
+    dynamic_indexes = {
+        position: index for index, position in enumerate(to_positions(dynamic_steps))
+    }
+    meeting_points = sorted(
+        set(lookahead_indexes).intersection(dynamic_indexes), key=sum
+    )
+
+    differences = []
+    for start, end in pairwise(meeting_points):
+        lookahead_stretch = lookahead_steps[
+            lookahead_indexes[start] : lookahead_indexes[end]
+        ]
+        dynamic_stretch = dynamic_steps[dynamic_indexes[start] : dynamic_indexes[end]]
+        if lookahead_stretch != dynamic_stretch:
+            differences.append(
+                ParityDifference(
+                    start=start,
+                    end=end,
+                    lookahead_steps=lookahead_stretch,
+                    dynamic_steps=dynamic_stretch,
+                )
+            )
+
+    return differences
+
+
+def compare_alignments(lookahead: Aligned, dynamic: Aligned) -> list[ParityDifference]:
+    """Report where the dynamic programming alignment differs from the lookahead one.
+
+    Args:
+        lookahead: The alignment made by the lookahead search.
+        dynamic: The alignment made by the dynamic programming search.
+
+    Returns:
+        The differences, in document order.
+    """
+    return find_differences(to_steps(lookahead), to_steps(dynamic))
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Iterator
 
 from python_tca2.alignment_suggestion import AlignmentSuggestion
 
@@ -32,6 +33,20 @@ class PathCandidate:
         """
         return self.score / self.get_length_in_sentences()
 
+    def visited_positions(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the positions the path has passed through.
+
+        Yields:
+            The end position of the path, followed by the position before each
+            of its steps, from the last step to the first.
+        """
+        current = tuple(self.position)
+        yield current
+
+        for step in reversed(self.alignment_suggestions):
+            current = (current[0] - step[0], current[1] - step[1])
+            yield current
+
     def has_hit(self, pos: tuple[int, ...]) -> bool:
         """Determines if a given position is a hit in the queue.
 
@@ -41,20 +56,7 @@ class PathCandidate:
         Returns:
             bool: True if the position is a hit, False otherwise.
         """
-        current = list(self.position)
-
-        if current == pos:
-            return True
-
-        for step in reversed(self.alignment_suggestions):
-            # hvorfor trekkes step.increment fra current?
-            # treffer den noe som helst med det?
-            current[0] -= step[0]
-            current[1] -= step[1]
-            if current == pos:
-                return True
-
-        return False
+        return tuple(pos) in self.visited_positions()
 
     def get_length_in_sentences(self):
         """Calculate the total number of sentences across all alignment suggestions.
@@ -1,10 +1,114 @@
-from dataclasses import dataclass
+from collections import defaultdict
+from typing import Iterator
 
 from python_tca2.path_candidate import PathCandidate
 
 
-@dataclass
 class PathCandidates:
-    """QueueEntries is a container for managing a list of queue entries."""
+    """A container of path candidates.
 
-    entries: list[PathCandidate]
+    Every candidate is indexed by the position it ends at, so that
+    membership tests are lookups. The candidates are also indexed by all
+    the positions they pass through, so that removal of the candidates
+    visiting a position is a lookup. Only the search removing visited
+    positions needs that index, so it is built on the first removal.
+
+    Attributes:
+        candidates: The candidates in insertion order, keyed by their id.
+        visitors: The candidates passing through each position, None until
+            the first call to remove_visitors.
+        endings: The candidates ending at each position.
+    """
+
+    def __init__(self, entries: list[PathCandidate]) -> None:
+        self.candidates: dict[int, PathCandidate] = {}
+        self.visitors: defaultdict[tuple[int, int], dict[int, PathCandidate]] | None = (
+            None
+        )
+        self.endings: defaultdict[tuple[int, int], dict[int, PathCandidate]] = (
+            defaultdict(dict)
+        )
+        for path_candidate in entries:
+            self.append(path_candidate)
+
+    def __repr__(self) -> str:
+        return f"PathCandidates(entries={self.entries!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathCandidates):
+            return NotImplemented
+        return self.entries == other.entries
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def __iter__(self) -> Iterator[PathCandidate]:
+        return iter(self.entries)
+
+    def __contains__(self, path_candidate: PathCandidate) -> bool:
+        """Check if an equal candidate is present.
+
+        Equal candidates end at the same position, so only those are compared.
+        """
+        return any(
+            other == path_candidate
+            for other in self.endings.get(path_candidate.position, {}).values()
+        )
+
+    @property
+    def entries(self) -> list[PathCandidate]:
+        """The candidates in insertion order."""
+        return list(self.candidates.values())
+
+    def append(self, path_candidate: PathCandidate) -> None:
+        """Add a candidate, and index it.
+
+        Args:
+            path_candidate: The candidate to add.
+        """
+        key = id(path_candidate)
+        self.candidates[key] = path_candidate
+        self.endings[tuple(path_candidate.position)][key] = path_candidate
+        if self.visitors is not None:
+            self.index_visits(path_candidate)
+
+    def index_visits(self, path_candidate: PathCandidate) -> None:
+        """Index the positions a candidate visits.
+
+        Args:
+            path_candidate: The candidate to index.
+        """
+        key = id(path_candidate)
+        for position in path_candidate.visited_positions():
+            self.visitors[position][key] = path_candidate
+
+    def remove(self, path_candidate: PathCandidate) -> None:
+        """Remove a candidate, and drop it from the indexes.
+
+        Args:
+            path_candidate: The candidate to remove.
+        """
+        key = id(path_candidate)
+        del self.candidates[key]
+        del self.endings[tuple(path_candidate.position)][key]
+        if self.visitors is not None:
+            for position in path_candidate.visited_positions():
+                if position in self.visitors:
+                    self.visitors[position].pop(key, None)
+
+    def remove_visitors(self, position: tuple[int, int]) -> None:
+        """Remove every candidate that has passed through position.
+
+        This removes the same candidates as filtering out those whose
+        has_hit(position) is True.
+
+        Args:
+            position: The position to clear.
+        """
+        if self.visitors is None:
+            self.visitors = defaultdict(dict)
+            for path_candidate in self.candidates.values():
+                self.index_visits(path_candidate)
+
+        for path_candidate in list(self.visitors.pop(position, {}).values()):
+            self.remove(path_candidate)
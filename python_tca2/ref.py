@@ -1,10 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 
+RefFields = tuple[int, float, int, int, int, int, str]
+"""The fields of a Ref, in order, so that Ref(*fields) makes the Ref.
 
-@dataclass
+The scoring passes these plain tuples around, and only makes Ref objects
+when they are shown.
+"""
+
+
+@dataclass(frozen=True, slots=True)
 class Ref:
     """Represents a reference with attributes and matching logic.
 
+    A reference is an immutable value: it has no instance dictionary, and
+    equal references hash alike, so they can be kept in sets.
+
     Attributes:
         match_type: The type of match for the reference.
         weight: The weight or importance of the reference.
@@ -23,6 +33,10 @@ class Ref:
     length: int
     word: str
 
+    def to_fields(self) -> RefFields:
+        """The fields of the reference, as a plain tuple."""
+        return astuple(self)
+
     def matches(self, other_ref: "Ref") -> bool:
         """Determines if this reference matches another reference.
 
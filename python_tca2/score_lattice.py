@@ -0,0 +1,114 @@
+"""Global dynamic programming search over the alignment score lattice."""
+
+from typing import Callable
+
+from python_tca2 import constants
+from python_tca2.alignment_suggestion import (
+    AlignmentSuggestion,
+    generate_alignment_suggestions,
+)
+from python_tca2.diagonal_band import DiagonalBand
+
+StepScorer = Callable[[tuple[int, int], AlignmentSuggestion], float]
+"""A callable returning the score of a step taken from a position."""
+
+
+class ScoreLattice:
+    """Best cumulative scores for every pair of positions in two documents.
+
+    Cell (i, j) holds the best total score of any sequence of alignment
+    suggestions that consumes the first i elements of the first document and
+    the first j elements of the second document, together with the last step
+    of that sequence.
+
+    Only reachable cells are stored, so with a diagonal band the lattice
+    grows linearly with the length of the documents.
+
+    Attributes:
+        lengths: The number of elements in each document.
+        diagonal_band: The band cells must be in, None to fill every cell.
+        scores: The best cumulative score per reachable cell.
+        steps: The last step of the best path into each reachable cell.
+    """
+
+    def __init__(
+        self, lengths: tuple[int, int], diagonal_band: DiagonalBand | None = None
+    ) -> None:
+        self.lengths = lengths
+        self.diagonal_band = diagonal_band
+        self.scores: dict[tuple[int, int], float] = {(0, 0): 0.0}
+        self.steps: dict[tuple[int, int], AlignmentSuggestion] = {}
+
+    def fill(self, get_step_score: StepScorer) -> None:
+        """Fill every cell of the lattice from its predecessors.
+
+        The moves are the ones produced by generate_alignment_suggestions.
+        Steps that get_step_score deems hopeless are never taken. When two
+        moves give the same score, the first one in suggestion order wins.
+        With a diagonal band, only the cells inside the band are filled.
+
+        Args:
+            get_step_score: Scores a step taken from a position.
+        """
+        suggestions = generate_alignment_suggestions(constants.NUM_FILES)
+        for i in range(self.lengths[0] + 1):
+            columns = (
+                range(self.lengths[1] + 1)
+                if self.diagonal_band is None
+                else self.diagonal_band.get_columns(i, self.lengths)
+            )
+            for j in columns:
+                for step in suggestions:
+                    self.relax(
+                        position=(i, j), step=step, get_step_score=get_step_score
+                    )
+
+    def relax(
+        self,
+        position: tuple[int, int],
+        step: AlignmentSuggestion,
+        get_step_score: StepScorer,
+    ) -> None:
+        """Try to improve a cell by arriving at it with the given step.
+
+        Args:
+            position: The cell to improve.
+            step: The step leading into the cell.
+            get_step_score: Scores a step taken from a position.
+        """
+        previous = (position[0] - step[0], position[1] - step[1])
+        previous_score = self.scores.get(previous)
+        if previous_score is None:
+            return
+
+        step_score = get_step_score(previous, step)
+        if step_score == constants.ELEMENTINFO_SCORE_HOPELESS:
+            return
+
+        new_score = previous_score + step_score
+        best_score = self.scores.get(position)
+        if best_score is None or new_score > best_score:
+            self.scores[position] = new_score
+            self.steps[position] = step
+
+    def backtrace(self) -> list[AlignmentSuggestion]:
+        """Follow the best steps back from the end of both documents.
+
+        Returns:
+            The alignment suggestions of the best path, from the start of the
+            documents to their end.
+
+        Raises:
+            ValueError: If no path reaches the end of both documents.
+        """
+        path: list[AlignmentSuggestion] = []
+        position = self.lengths
+        while position != (0, 0):
+            step = self.steps.get(position)
+            if step is None:
+                raise ValueError(f"No path reaches position {position}")
+            path.append(step)
+            position = (position[0] - step[0], position[1] - step[1])
+
+        path.reverse()
+        return path
@@ -1,3 +1,4 @@
+import math
 import re
 
 from python_tca2 import constants
@@ -19,7 +20,10 @@ def unique_bigrams(bigrams: list[str]) -> set[str]:
     return set(bigrams)
 
 
-def shared_bigrams(unique_bigrams1: set[str], unique_bigrams2: set[str]) -> set[str]:
+def shared_bigrams(
+    unique_bigrams1: set[str] | frozenset[str],
+    unique_bigrams2: set[str] | frozenset[str],
+) -> set[str] | frozenset[str]:
     """Calculate the shared bigrams between two sets of bigrams.
 
     Args:
@@ -52,9 +56,30 @@ def dice_match_word_pair(
         `dice_min_counting_score`, False otherwise.
     """
 
-    unique_bigrams1 = unique_bigrams(string_to_bigram(word1.lower()))
-    unique_bigrams2 = unique_bigrams(string_to_bigram(word2.lower()))
+    return dice_match_bigrams(
+        unique_bigrams(string_to_bigram(word1.lower())),
+        unique_bigrams(string_to_bigram(word2.lower())),
+        dice_min_counting_score,
+    )
+
+
+def dice_match_bigrams(
+    unique_bigrams1: set[str] | frozenset[str],
+    unique_bigrams2: set[str] | frozenset[str],
+    dice_min_counting_score: float,
+) -> bool:
+    """Check if two words given by their unique bigrams are a Dice match.
 
+    Args:
+        unique_bigrams1: The unique bigrams of the first word.
+        unique_bigrams2: The unique bigrams of the second word.
+        dice_min_counting_score: The minimum Dice coefficient score
+            required for the function to return True.
+
+    Returns:
+        True if the Dice coefficient score is greater than or equal to
+        `dice_min_counting_score`, False otherwise.
+    """
     if not unique_bigrams1 or not unique_bigrams2:
         return False
 
@@ -80,12 +105,28 @@ def dice_match_word_with_phrase(word: str, phrase: tuple[str, str]) -> bool:
         bool: True if both Dice coefficients meet or exceed the minimum score,
               False otherwise.
     """
-    word_bigrams = unique_bigrams(string_to_bigram(word.lower()))
-
-    phrase_bigrams = (
-        unique_bigrams(string_to_bigram(phrase_word.lower())) for phrase_word in phrase
+    return dice_match_bigrams_with_phrase(
+        unique_bigrams(string_to_bigram(word.lower())),
+        tuple(
+            unique_bigrams(string_to_bigram(phrase_word.lower()))
+            for phrase_word in phrase
+        ),
     )
 
+
+def dice_match_bigrams_with_phrase(
+    word_bigrams: set[str] | frozenset[str],
+    phrase_bigrams: tuple[set[str] | frozenset[str], ...],
+) -> bool:
+    """Check if a word matches a phrase, all given by their unique bigrams.
+
+    Args:
+        word_bigrams: The unique bigrams of the word.
+        phrase_bigrams: The unique bigrams of each word of the phrase.
+
+    Returns:
+        True if the word shares enough bigrams with every word of the phrase.
+    """
     dice_scores = (
         (
             len(shared_bigrams(word_bigrams, phrase_bigram)) / len(phrase_bigram)
@@ -147,11 +188,12 @@ def calculate_length_correlation_factor(lengths: list[int], ratio: float) -> flo
     Returns:
         The length correlation factor as a float.
     """
-    return (
-        2
-        * abs(0.0 + ratio * lengths[0] - lengths[1])
-        / (ratio * lengths[0] + lengths[1])
-    )
+    total_length = ratio * lengths[0] + lengths[1]
+    if not total_length:
+        # Java gives NaN here, which fails every comparison made by the callers
+        return math.nan
+
+    return 2 * abs(0.0 + ratio * lengths[0] - lengths[1]) / total_length
 
 
 def adjust_for_length_correlation(
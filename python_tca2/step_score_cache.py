@@ -0,0 +1,74 @@
+"""A bounded cache of step scores."""
+
+from collections import OrderedDict
+
+StepScoreKey = tuple[int, int, int, int]
+"""The start position in each text, followed by the step in each text."""
+
+
+class StepScoreCache:
+    """Remembers the scores of the most recently used steps.
+
+    When the cache is full, the least recently used score is evicted.
+
+    Attributes:
+        max_size: The maximum number of scores to keep, None for no limit.
+        scores: The cached scores, least recently used first.
+        hits: The number of lookups that found a score.
+        misses: The number of lookups that did not find a score.
+        evictions: The number of scores evicted to make room for new ones.
+    """
+
+    def __init__(self, max_size: int | None) -> None:
+        self.max_size = max_size
+        self.scores: OrderedDict[StepScoreKey, float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def get(self, key: StepScoreKey) -> float | None:
+        """Look up the score of a step.
+
+        Args:
+            key: The start position and the step.
+
+        Returns:
+            The score, or None if it is not cached.
+        """
+        score = self.scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.scores.move_to_end(key)
+        return score
+
+    def set(self, key: StepScoreKey, score: float) -> None:
+        """Cache the score of a step, evicting the least recently used if full.
+
+        Args:
+            key: The start position and the step.
+            score: The score of the step.
+        """
+        self.scores[key] = score
+        self.scores.move_to_end(key)
+        if self.max_size is not None and len(self.scores) > self.max_size:
+            self.scores.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Forget all scores. The counters are kept."""
+        self.scores.clear()
+
+    def to_json(self) -> dict[str, int | None]:
+        return {
+            "max_size": self.max_size,
+            "size": len(self.scores),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Iterable
 
 from lxml import etree
 
@@ -77,6 +78,48 @@ def make_tmx(
     return tmx
 
 
+def write_tmx_stream(
+    file1_path: Path,
+    language_pair: tuple[str, str],
+    non_empty_sentence_pairs: Iterable[tuple[str, str]],
+    output_path: Path | None = None,
+) -> int:
+    """Write the tmx file to disk one translation unit at a time.
+
+    Every unit is flushed to disk as soon as the pair is available, so the
+    file grows while the aligner is still running. The file is written
+    next to file1_path, unless output_path is given.
+
+    Returns:
+        The number of translation units written.
+    """
+    if output_path is None:
+        output_path = file1_path.with_suffix(".tmx")
+
+    unit_count = 0
+    with etree.xmlfile(str(output_path), encoding="utf-8") as xml_file:
+        xml_file.write_declaration()
+        with xml_file.element("tmx"):
+            xml_file.write(
+                "\n",
+                make_tmx_header(file1_path.stem, language_pair[0]),
+                pretty_print=True,
+            )
+            with xml_file.element("body"):
+                xml_file.write("\n")
+                for sentence_pair in non_empty_sentence_pairs:
+                    xml_file.write(
+                        make_tu(tuple(zip(sentence_pair, language_pair, strict=True))),
+                        pretty_print=True,
+                    )
+                    xml_file.flush()
+                    unit_count += 1
+            xml_file.write("\n")
+
+    print(f"Wrote {output_path}")
+    return unit_count
+
+
 def make_html(
     tmx: etree._Element,
 ) -> etree._XSLTResultTree:
@@ -92,8 +135,12 @@ def write_tmx_result(
     language_pair: tuple[str, str],
     non_empty_sentence_pairs: list[tuple[str, str]],
     output_format: str = "tmx",
+    output_path: Path | None = None,
 ) -> None:
-    """Write the tmx file to disk."""
+    """Write the tmx file to disk.
+
+    The file is written next to file1_path, unless output_path is given.
+    """
 
     tmx_result = (
         make_tmx(
@@ -111,7 +158,8 @@ def write_tmx_result(
         )
     )
 
-    output_path = file1_path.with_suffix(f".{output_format}")
+    if output_path is None:
+        output_path = file1_path.with_suffix(f".{output_format}")
     output_path.write_bytes(
         etree.tostring(
             tmx_result,
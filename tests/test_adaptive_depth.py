@@ -0,0 +1,69 @@
+import pytest
+
+from python_tca2.adaptive_depth import AdaptiveDepth
+from python_tca2.path_candidate import PathCandidate
+from python_tca2.path_candidates import PathCandidates
+
+
+def make_path_candidates(
+    paths: list[tuple[float, list[tuple[int, int]]]],
+) -> PathCandidates:
+    return PathCandidates(
+        [
+            PathCandidate(
+                position=(
+                    sum(step[0] for step in steps),
+                    sum(step[1] for step in steps),
+                ),
+                score=score,
+                alignment_suggestions=steps,
+            )
+            for score, steps in paths
+        ]
+    )
+
+
+def test_is_decided():
+    adaptive_depth = AdaptiveDepth(margin=1.0, min_depth=1)
+
+    # normalized scores: 3.0 for (1, 1), 1.5 and 1.0 for (0, 1)
+    path_candidates = make_path_candidates(
+        [
+            (12.0, [(1, 1), (1, 1)]),
+            (6.0, [(0, 1), (1, 1), (1, 1)]),
+            (5.0, [(0, 1), (2, 1), (1, 1)]),
+        ]
+    )
+    assert adaptive_depth.is_decided(path_candidates, depth=2)
+
+    path_candidates = make_path_candidates(
+        [
+            (12.0, [(1, 1), (1, 1)]),
+            (12.5, [(0, 1), (1, 1), (1, 1)]),
+        ]
+    )
+    assert not adaptive_depth.is_decided(path_candidates, depth=2)
+
+
+def test_one_first_step_is_decided():
+    adaptive_depth = AdaptiveDepth(margin=1.0, min_depth=2)
+    path_candidates = make_path_candidates(
+        [(4.0, [(1, 1), (1, 1)]), (1.0, [(1, 1), (0, 1)])]
+    )
+
+    assert not adaptive_depth.is_decided(path_candidates, depth=1)
+    assert adaptive_depth.is_decided(path_candidates, depth=2)
+
+
+def test_depths():
+    adaptive_depth = AdaptiveDepth()
+    for depth in (2, 10, 2):
+        adaptive_depth.record(depth)
+
+    assert adaptive_depth.to_json()["depths"] == {"2": 2, "10": 1}
+    assert adaptive_depth.to_json()["mean_depth"] == pytest.approx(14 / 3)
+
+
+def test_depth_range():
+    with pytest.raises(ValueError, match="min_depth"):
+        AdaptiveDepth(min_depth=3, max_depth=2)
@@ -1,6 +1,9 @@
 from dataclasses import asdict
 
-from python_tca2 import alignmentmodel
+import pytest
+
+from python_tca2 import alignmentmodel, match
+from python_tca2.adaptive_depth import AdaptiveDepth
 from python_tca2.aelement import AlignmentElement
 from python_tca2.aligned import Aligned
 from python_tca2.aligned_sentence_elements import (
@@ -9,7 +12,12 @@ from python_tca2.aligned_sentence_elements import (
 )
 from python_tca2.anchorwordlist import AnchorWordList
 from python_tca2.anchorwordlistentry import AnchorWordListEntry
+from python_tca2.diagonal_band import DiagonalBand
 from python_tca2.elementinfotobecompared import ElementInfoToBeCompared
+from python_tca2.pair_match_cache import PairMatchCache
+from python_tca2.pair_matches import PairMatches
+from python_tca2.parity import ParityDifference, compare_alignments
+from python_tca2.score_lattice import ScoreLattice
 
 
 def test_get_score():
@@ -111,6 +119,24 @@ def test_find_dice_matches():
 
     assert eitbc.to_json() == {
         "score": 4.0,
+        "clusters": {
+            "clusters": [
+                {
+                    "refs": [
+                        {
+                            "match_type": match.DICE,
+                            "weight": 3.0,
+                            "text_number": text_number,
+                            "element_number": 0,
+                            "pos": 0,
+                            "length": 1,
+                            "word": word,
+                        }
+                        for text_number, word in enumerate(["Mobil", "Mobiila"])
+                    ]
+                }
+            ]
+        },
         "info": [
             {
                 "element_number": 0,
@@ -342,3 +368,287 @@ def test_anchorword_hits():
         ],
         [{"index": 0, "element_number": 0, "pos": 0, "word": "1"}],
     ]
+
+
+def test_suggest_with_dynamic_programming():
+    strings = [
+        """- regjeringen.no
+Ot.prp. nr. 25 (2006-2007)
+Om lov om reindrift (reindriftsloven)
+""",
+        """- regjeringen.no
+Boazodoallolága birra
+""",
+    ]
+
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=(strings[0].splitlines(), strings[1].splitlines()),
+        anchor_word_list=load_anchor_words(),
+    )
+
+    assert compare_alignments(
+        lookahead=model.suggest_without_gui(),
+        dynamic=model.suggest_with_dynamic_programming(),
+    ) == [
+        ParityDifference(
+            start=(1, 1),
+            end=(3, 2),
+            lookahead_steps=[(1, 0), (1, 1)],
+            dynamic_steps=[(1, 1), (1, 0)],
+        )
+    ]
+
+
+def test_step_score_cache_size():
+    strings = [
+        """- regjeringen.no
+Ot.prp. nr. 25 (2006-2007)
+Om lov om reindrift (reindriftsloven)
+""",
+        """- regjeringen.no
+Boazodoallolága birra
+""",
+    ]
+
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=(strings[0].splitlines(), strings[1].splitlines()),
+        anchor_word_list=load_anchor_words(),
+        step_score_cache_size=3,
+    )
+    aligned = model.suggest_without_gui()
+    statistics = model.statistics()["step_score_cache"]
+
+    assert aligned.non_empty_pairs() == [
+        ("- regjeringen.no", "- regjeringen.no"),
+        ("Om lov om reindrift (reindriftsloven)", "Boazodoallolága birra"),
+    ]
+    assert statistics["evictions"] > 0
+    assert statistics["size"] == 0
+
+
+def test_iter_alignments():
+    strings = [
+        """- regjeringen.no
+Ot.prp. nr. 25 (2006-2007)
+Om lov om reindrift (reindriftsloven)
+""",
+        """- regjeringen.no
+Boazodoallolága birra
+""",
+    ]
+    sentences_tuple = (strings[0].splitlines(), strings[1].splitlines())
+
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=load_anchor_words(),
+    )
+    aligned_pairs = list(model.iter_alignments())
+
+    assert [
+        (aligned_pair.start_position, aligned_pair.alignment_suggestion)
+        for aligned_pair in aligned_pairs
+    ] == [((0, 0), (1, 1)), ((1, 1), (1, 0)), ((2, 1), (1, 1))]
+    assert aligned_pairs[-1].end_position == (3, 2)
+    assert [
+        aligned_pair.to_string_tuple()
+        for aligned_pair in aligned_pairs
+        if aligned_pair.is_non_empty()
+    ] == (
+        alignmentmodel.AlignmentModel(
+            sentences_tuple=sentences_tuple,
+            anchor_word_list=load_anchor_words(),
+        )
+        .suggest_without_gui()
+        .non_empty_pairs()
+    )
+    assert aligned_pairs[0].score == model.get_step_score((0, 0), (1, 1))
+
+
+def test_diagonal_band():
+    strings = [
+        """- regjeringen.no
+Ot.prp. nr. 25 (2006-2007)
+Om lov om reindrift (reindriftsloven)
+""",
+        """- regjeringen.no
+Boazodoallolága birra
+""",
+    ]
+    sentences_tuple = (strings[0].splitlines(), strings[1].splitlines())
+
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=load_anchor_words(),
+    )
+    banded_model = alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=load_anchor_words(),
+        diagonal_band=DiagonalBand(width=1),
+    )
+
+    assert (
+        banded_model.suggest_without_gui().non_empty_pairs()
+        == model.suggest_without_gui().non_empty_pairs()
+    )
+    assert banded_model.diagonal_band.rejections > 0
+    assert banded_model.path_extension_count < model.path_extension_count
+
+
+def test_diagonal_band_widens():
+    sentences_tuple = (
+        ["Tromsø kommune kjøpte 25 busser i 1999."],
+        [
+            "Innledning.",
+            "Kapittel en.",
+            "Kapittel to.",
+            "Kapittel tre.",
+            "Romssa gielda osttii 25 bussa 1999:s.",
+        ],
+    )
+
+    for search in ("lookahead", "dynamic"):
+        model = alignmentmodel.AlignmentModel(
+            sentences_tuple=sentences_tuple,
+            anchor_word_list=AnchorWordList(),
+            diagonal_band=DiagonalBand(width=1),
+        )
+        aligned = (
+            model.suggest_with_dynamic_programming()
+            if search == "dynamic"
+            else model.suggest_without_gui()
+        )
+
+        assert [
+            sum(len(elements[text_number]) for elements in aligned.alignments)
+            for text_number in range(2)
+        ] == [1, 5]
+        assert model.diagonal_band.widenings > 0
+        assert model.diagonal_band.level == 0
+
+
+class PeakPairMatchCache(PairMatchCache):
+    """Remembers the largest number of sentence pairs it has held."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.peak_size = 0
+
+    def get(self, left: AlignmentElement, right: AlignmentElement) -> PairMatches:
+        pair_matches = super().get(left, right)
+        self.peak_size = max(self.peak_size, len(self))
+        return pair_matches
+
+
+def test_dynamic_programming_widening_keeps_pair_window():
+    sentences_tuple = (
+        [f"Setning nummer {number} her." for number in range(20)],
+        [f"Cealkka nummer {number} dás." for number in range(83)],
+    )
+    peak_sizes = []
+    for width in (1, 4):
+        model = alignmentmodel.AlignmentModel(
+            sentences_tuple=sentences_tuple,
+            anchor_word_list=AnchorWordList(),
+            diagonal_band=DiagonalBand(width=width),
+        )
+        model.pair_match_cache = PeakPairMatchCache()
+        model.suggest_with_dynamic_programming()
+        peak_sizes.append(model.pair_match_cache.peak_size)
+        if width == 1:
+            assert model.diagonal_band.widenings > 0
+
+    # The band widens to a width of 4, and the refill forgets pairs as it goes
+    assert peak_sizes[0] <= peak_sizes[1]
+
+
+def test_dynamic_programming_clears_caches_on_failure(monkeypatch):
+    def fail(self):
+        raise ValueError("No path")
+
+    monkeypatch.setattr(ScoreLattice, "backtrace", fail)
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=(["Tromsø kommune."], ["Romssa gielda."]),
+        anchor_word_list=AnchorWordList(),
+    )
+
+    with pytest.raises(ValueError, match="No path"):
+        model.suggest_with_dynamic_programming()
+
+    assert len(model.step_score_cache) == 0
+    assert len(model.pair_match_cache) == 0
+
+
+def test_adaptive_depth():
+    strings = [
+        """- regjeringen.no
+Ot.prp. nr. 25 (2006-2007)
+Om lov om reindrift (reindriftsloven)
+1 million kroner til landbruket i arktisk
+""",
+        """- regjeringen.no
+Boazodoallolága birra
+1 miljon ruvnno árktalaš eanadollui
+""",
+    ]
+    sentences_tuple = (strings[0].splitlines(), strings[1].splitlines())
+
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=load_anchor_words(),
+    )
+    adaptive_model = alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=load_anchor_words(),
+        adaptive_depth=AdaptiveDepth(margin=1.0),
+    )
+
+    aligned = adaptive_model.suggest_without_gui()
+
+    assert aligned.non_empty_pairs() == model.suggest_without_gui().non_empty_pairs()
+    assert adaptive_model.path_extension_count < model.path_extension_count
+    # One search per step, and a last one finding the end of the documents
+    assert (
+        sum(adaptive_model.adaptive_depth.depths.values())
+        == len(aligned.alignments) + 1
+    )
+
+
+def test_adaptive_depth_keeps_max_path_length():
+    sentences_tuple = (
+        [f"Setning nummer {number} her." for number in range(6)],
+        [f"Cealkka nummer {number} dás." for number in range(6)],
+    )
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=AnchorWordList(),
+        adaptive_depth=AdaptiveDepth(margin=float("inf")),
+    )
+    model.max_path_length = 2
+
+    model.suggest_without_gui()
+
+    assert max(model.adaptive_depth.depths) == model.max_path_length
+    assert model.max_path_length < model.adaptive_depth.max_depth
+
+
+def test_search_options():
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=([], []),
+        anchor_word_list=AnchorWordList(),
+        step_score_cache_size=10,
+        diagonal_band=DiagonalBand(width=2),
+        adaptive_depth=AdaptiveDepth(margin=1.0),
+    )
+    model.max_path_length = 2
+    model.prune_visited_positions = True
+
+    part_model = alignmentmodel.AlignmentModel.from_parallel_documents(
+        ([], []), **model.get_search_options()
+    )
+
+    assert part_model.step_score_cache.max_size == 10  # noqa: PLR2004
+    assert part_model.diagonal_band is model.diagonal_band
+    assert part_model.adaptive_depth is model.adaptive_depth
+    assert part_model.max_path_length == 2  # noqa: PLR2004
+    assert part_model.prune_visited_positions
+    assert not alignmentmodel.AlignmentModel.prune_visited_positions
@@ -0,0 +1,88 @@
+import pickle
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from python_tca2 import anchor_word_list_cache, disk_cache
+from python_tca2.anchor_word_list_cache import (
+    get_cache_path,
+    load_anchor_word_list,
+    main,
+    parse_anchor_word_list,
+)
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.anchorwordlistentry import AnchorWordListEntry
+from python_tca2.disk_cache import hash_file
+
+ROOT = Path(__file__).parent.parent
+WORDS = ["Sametinget", "spurte", "om", "loven", "i", "Kautokeino"]
+
+
+def get_hits(anchor_word_list: AnchorWordList) -> list:
+    return [
+        anchor_word_list.get_anchor_word_hits(WORDS, text_number, 0)
+        for text_number in (0, 1)
+    ]
+
+
+def test_load_through_cache(tmp_path):
+    anchor_file = tmp_path / "anchor.txt"
+    anchor_file.write_text((ROOT / "bug3/anchor-nob-sme.txt").read_text())
+    parsed = load_anchor_word_list(anchor_file, cache_dir=None)
+
+    written = load_anchor_word_list(anchor_file, cache_dir=tmp_path)
+    cache_path = get_cache_path(hash_file(anchor_file), cache_dir=tmp_path)
+    assert cache_path.exists()
+
+    cached = load_anchor_word_list(anchor_file, cache_dir=tmp_path)
+    assert cached is not written
+    assert get_hits(cached) == get_hits(written) == get_hits(parsed)
+    assert len(cached.entries) == len(parsed.entries)
+
+    anchor_file.write_text("Sametinget / Sámediggi\n")
+    edited = load_anchor_word_list(anchor_file, cache_dir=tmp_path)
+    assert len(edited.entries) == 1
+    assert get_cache_path(hash_file(anchor_file), cache_dir=tmp_path).exists()
+
+
+def test_edited_code_parses_again(tmp_path, monkeypatch):
+    anchor_file = ROOT / "bug1/anchor-nob-sme.txt"
+    parsed = []
+    monkeypatch.setattr(
+        anchor_word_list_cache,
+        "parse_anchor_word_list",
+        lambda path: parsed.append(path) or parse_anchor_word_list(path),
+    )
+
+    load_anchor_word_list(anchor_file, cache_dir=tmp_path)
+    load_anchor_word_list(anchor_file, cache_dir=tmp_path)
+    assert len(parsed) == 1
+
+    monkeypatch.setattr(disk_cache, "get_code_fingerprint", lambda: "edited")
+    reloaded = load_anchor_word_list(anchor_file, cache_dir=tmp_path)
+
+    assert len(parsed) == 2  # noqa: PLR2004
+    assert get_hits(reloaded) == get_hits(parse_anchor_word_list(anchor_file))
+
+
+def test_no_anchor_file(tmp_path):
+    assert load_anchor_word_list(None, cache_dir=tmp_path).entries == []
+
+
+def test_pickled_entries_set_directly():
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.entries = [AnchorWordListEntry("loven / láhka")]
+
+    unpickled = pickle.loads(pickle.dumps(anchor_word_list))
+
+    assert unpickled.lines is None
+    assert get_hits(unpickled) == get_hits(anchor_word_list)
+
+
+def test_prebuild_command(tmp_path):
+    anchor_file = ROOT / "bug1/anchor-nob-sme.txt"
+
+    result = CliRunner().invoke(main, ["--cache_dir", str(tmp_path), str(anchor_file)])
+
+    assert result.exit_code == 0, result.output
+    assert get_cache_path(hash_file(anchor_file), cache_dir=tmp_path).exists()
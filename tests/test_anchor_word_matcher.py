@@ -0,0 +1,127 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.anchor_word_matcher import fold_case
+from python_tca2.anchorwordhit import AnchorWordHit
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.anchorwordlistentry import AnchorWordListEntry
+
+ROOT = Path(__file__).parent.parent
+
+
+def make_anchor_word_list(*lines: str) -> AnchorWordList:
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.entries = [AnchorWordListEntry(line) for line in lines]
+    return anchor_word_list
+
+
+def test_fold_case():
+    assert fold_case("SÁMEDIGGI") == fold_case("sámediggi")
+    assert fold_case("İstanbul") == fold_case("ıstanbul") == "istanbul"
+
+
+def test_phrase_hits():
+    anchor_word_list = make_anchor_word_list(
+        "sametinget / sámediggi", "om lov*, lov / láhka*"
+    )
+
+    hits = anchor_word_list.get_anchor_word_hits(
+        ["Sametinget", "vil", "ha", "Om", "loven", "om", "lov"],
+        text_number=0,
+        element_number=4,
+    ).hits
+
+    assert hits == [
+        AnchorWordHit(index=0, element_number=4, pos=0, word="Sametinget"),
+        AnchorWordHit(index=1, element_number=4, pos=3, word="Om   loven"),
+        AnchorWordHit(index=1, element_number=4, pos=5, word="om   lov"),
+        AnchorWordHit(index=1, element_number=4, pos=6, word="lov"),
+    ]
+
+
+def test_same_hits_as_scanning():
+    anchor_word_list = make_anchor_word_list(
+        "og, og / ja",
+        "sámedig*, *tinget, st.meld., a*b, * / x",
+        "nr. / (nr), nr|no, \\w+",
+        "i, å / i",
+        "strasse, straß* / x",
+        "om lov*, om, lov* om / y",
+    )
+    sentences = [
+        "Og sametinget og Sámediggi sa OG",
+        "St.meld. stXmeld. AB ab acb a",
+        "nr. (nr) nr no",
+        "I İ ı Å",
+        "Straße STRASSE strasse",
+        "om lov om lovene om",
+        "",
+    ]
+    for text_number in (0, 1):
+        for element_number, sentence in enumerate(sentences):
+            words = sentence.split(" ") + ["om\n", "tinget\n"]
+            assert anchor_word_list.get_anchor_word_hits(
+                words, text_number, element_number
+            ) == anchor_word_list.scan_anchor_word_hits(
+                words, text_number, element_number
+            )
+
+
+@pytest.mark.parametrize(
+    "text_files",
+    [
+        ("bug3/giella_no.docx_nob_new.txt", "bug3/giella_sam.docx_sme_new.txt"),
+        (
+            "bug3/samediggi-article-42.html_nob_new.txt",
+            "bug3/samediggi-article-42.html_sme_new.txt",
+        ),
+    ],
+)
+def test_same_hits_as_scanning_corpora(text_files):
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.load_from_file(str(ROOT / "bug3/anchor-nob-sme.txt"))
+    for text_number, text_file in enumerate(text_files):
+        for element_number, line in enumerate(
+            (ROOT / text_file).read_text().splitlines()
+        ):
+            words = AlignmentElement(
+                anchor_word_list=AnchorWordList(),
+                text=line,
+                text_number=text_number,
+                element_number=element_number,
+            ).words
+            assert anchor_word_list.get_anchor_word_hits(
+                words, text_number, element_number
+            ) == anchor_word_list.scan_anchor_word_hits(
+                words, text_number, element_number
+            )
+
+
+def test_matchers_follow_entries():
+    anchor_word_list = make_anchor_word_list("og / ja")
+    assert anchor_word_list.get_anchor_word_hits(["og"], 0, 0).hits
+
+    anchor_word_list.entries = [AnchorWordListEntry("eller / dahje")]
+    assert not anchor_word_list.get_anchor_word_hits(["og"], 0, 0).hits
+
+
+def test_word_matches_are_remembered():
+    anchor_word_list = make_anchor_word_list("og / ja", "om lov* / láhka")
+    words = ["og", "om", "loven", "og"]
+
+    hits = anchor_word_list.get_anchor_word_hits(words, 0, 0)
+    assert anchor_word_list.get_anchor_word_hits(words, 0, 1).hits == [
+        AnchorWordHit(index=hit.index, element_number=1, pos=hit.pos, word=hit.word)
+        for hit in hits.hits
+    ]
+
+    matcher = anchor_word_list.get_matcher(0)
+    assert matcher.to_json() == {"size": 3, "hits": 5, "misses": 3}
+    assert anchor_word_list.count_word_matches() == (5, 3)
+    assert anchor_word_list.to_json()["hit_rate"] == 5 / 8
+
+    unpickled = pickle.loads(pickle.dumps(anchor_word_list))
+    assert unpickled.get_matcher(0).to_json() == {"size": 0, "hits": 0, "misses": 0}
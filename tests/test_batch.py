@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.batch import ManifestEntry, align_manifest, read_manifest, summarize
+
+
+def write_pair(directory: Path) -> tuple[Path, Path]:
+    file1 = directory / "nob.txt"
+    file1.write_text(
+        "Kanskje en innkjøpsordning for kvenskspråklig litteratur.\n"
+        "Utvikling av undervisnings- og lærematerialer.\n"
+    )
+    file2 = directory / "fkv.txt"
+    file2.write_text(
+        "Kvääninkielinen litteratuuri osto-oorninkhiin piian.\n"
+        "Opetus- ja oppimateriaaliitten kehittäminen.\n"
+    )
+
+    return file1, file2
+
+
+def test_read_manifest(tmp_path):
+    manifest = tmp_path / "manifest.tsv"
+    manifest.write_text(
+        "# file1\tfile2\tlang1\tlang2\toutput\n"
+        "a.txt\tb.txt\tnob\tsme\ta.tmx\n"
+        "\n"
+        "c.txt\td.txt\tnob\tfkv\tc.html\n"
+    )
+
+    assert read_manifest(manifest) == [
+        ManifestEntry("a.txt", "b.txt", "nob", "sme", "a.tmx"),
+        ManifestEntry("c.txt", "d.txt", "nob", "fkv", "c.html"),
+    ]
+
+
+def test_read_manifest_bad_row(tmp_path):
+    manifest = tmp_path / "manifest.tsv"
+    manifest.write_text("a.txt\tb.txt\tnob\n")
+
+    with pytest.raises(ValueError, match="manifest.tsv:1"):
+        read_manifest(manifest)
+
+
+def test_align_manifest(tmp_path):
+    file1, file2 = write_pair(tmp_path)
+    entries = [
+        ManifestEntry(str(file1), str(file2), "nob", "fkv", str(tmp_path / "a.tmx")),
+        ManifestEntry(
+            str(tmp_path / "missing.txt"),
+            str(file2),
+            "nob",
+            "fkv",
+            str(tmp_path / "b.tmx"),
+        ),
+        ManifestEntry(str(file1), str(file2), "nob", "fkv", str(tmp_path / "c.txt")),
+    ]
+
+    results = align_manifest(entries, anchor_word_list=AnchorWordList(), workers=2)
+
+    assert [result.output for result in results] == [entry.output for entry in entries]
+    assert results[0].error is None
+    assert results[0].sentence_pairs == 2  # noqa: PLR2004
+    assert "Opetus- ja oppimateriaaliitten" in (tmp_path / "a.tmx").read_text()
+    assert results[1].error.startswith("FileNotFoundError")
+    assert results[2].error.startswith("ValueError")
+    assert results[0].word_match_misses > 0
+    summary = summarize(results)
+    assert summary["failures"] == 2  # noqa: PLR2004
+    assert 0 <= summary["word_match_hit_rate"] < 1
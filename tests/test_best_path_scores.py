@@ -0,0 +1,26 @@
+from python_tca2.best_path_scores import BestPathScores
+
+
+def test_is_improvement():
+    best_path_scores = BestPathScores()
+
+    assert best_path_scores.is_improvement((1, 1), 1.0)
+    best_path_scores.set((1, 1), 1.0)
+    assert not best_path_scores.is_improvement((1, 1), 1.0)
+    assert best_path_scores.is_improvement((1, 1), 1.5)
+
+    assert best_path_scores.to_json() == {
+        "lookups": 3,
+        "hits": 2,
+        "rejections": 1,
+        "updates": 1,
+    }
+
+
+def test_reset():
+    best_path_scores = BestPathScores()
+    best_path_scores.set((0, 1), 2.0)
+    best_path_scores.reset()
+
+    assert best_path_scores.get((0, 1)) is None
+    assert best_path_scores.updates == 1
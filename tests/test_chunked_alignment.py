@@ -0,0 +1,172 @@
+from python_tca2 import alignmentmodel
+from python_tca2.adaptive_depth import AdaptiveDepth
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.chunked_alignment import (
+    choose_cuts,
+    find_anchor_pairs,
+    longest_chain,
+    merge_search_statistics,
+    split_documents,
+    suggest_in_chunks,
+)
+
+
+def make_model(sentences_tuple: tuple[list[str], list[str]]):
+    return alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple, anchor_word_list=AnchorWordList()
+    )
+
+
+def test_longest_chain():
+    assert longest_chain([(5, 1), (0, 0), (2, 3), (3, 7), (4, 4), (6, 6)]) == [
+        (0, 0),
+        (2, 3),
+        (4, 4),
+        (6, 6),
+    ]
+
+
+def test_longest_chain_empty():
+    assert longest_chain([]) == []
+
+
+def test_find_anchor_pairs():
+    model = make_model(
+        (
+            [
+                "Tromsø fikk 25 nye busser.",
+                "Det var bra.",
+                "Tromsø fikk også 40 nye båter.",
+            ],
+            [
+                "Romsa oaččui 25 ođđa busse.",
+                "Dat lei buorre.",
+                "Romsa oaččui maid 40 ođđa fanasa.",
+            ],
+        )
+    )
+
+    # 25 and 40 are unique in both documents, but each pair has only one
+    assert find_anchor_pairs(model.parallel_documents) == []
+    assert find_anchor_pairs(model.parallel_documents, min_support=1) == [
+        (0, 0),
+        (2, 2),
+    ]
+
+
+def test_choose_cuts():
+    assert choose_cuts(
+        [(1, 1), (3, 4), (5, 5), (8, 9), (10, 10)],
+        lengths=(12, 12),
+        min_chunk_size=3,
+    ) == [(3, 4), (8, 9)]
+
+
+def test_split_documents():
+    documents = (list(range(5)), list(range(6)))
+
+    assert split_documents(documents, [(2, 3)]) == [
+        ([0, 1], [0, 1, 2]),
+        ([2, 3, 4], [3, 4, 5]),
+    ]
+
+
+def test_suggest_in_chunks():
+    sentences_tuple = (
+        [
+            "Tromsø kommune kjøpte 25 busser i 1999.",
+            "Det var bra.",
+            "Bodø kommune kjøpte 40 båter i 2001.",
+            "Det var også bra.",
+        ],
+        [
+            "Romssa gielda osttii 25 bussa 1999:s.",
+            "Dat lei buorre.",
+            "Bodø gielda osttii 40 fatnasa 2001:s.",
+            "Dat maid lei buorre.",
+        ],
+    )
+    model = make_model(sentences_tuple)
+
+    aligned, chunk_sizes, search_statistics = suggest_in_chunks(
+        model, workers=2, min_chunk_size=2
+    )
+
+    assert chunk_sizes == {
+        "chunks": 2,
+        "min_size": 4,
+        "median_size": 4.0,
+        "max_size": 4,
+        "sizes": [4, 4],
+    }
+    assert (
+        aligned.non_empty_pairs()
+        == make_model(sentences_tuple).suggest_without_gui().non_empty_pairs()
+    )
+    assert search_statistics["path_extensions"] > 0
+    assert search_statistics["adaptive_depth"] is None
+
+
+def test_suggest_in_chunks_with_search_options():
+    sentences_tuple = (
+        [
+            "Tromsø kommune kjøpte 25 busser i 1999.",
+            "Det var bra.",
+            "Bodø kommune kjøpte 40 båter i 2001.",
+            "Det var også bra.",
+        ],
+        [
+            "Romssa gielda osttii 25 bussa 1999:s.",
+            "Dat lei buorre.",
+            "Bodø gielda osttii 40 fatnasa 2001:s.",
+            "Dat maid lei buorre.",
+        ],
+    )
+    model = alignmentmodel.AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=AnchorWordList(),
+        adaptive_depth=AdaptiveDepth(),
+    )
+
+    aligned, _, search_statistics = suggest_in_chunks(
+        model, workers=2, min_chunk_size=2
+    )
+
+    # One search per step, and a last one finding the end of each chunk
+    assert (
+        search_statistics["adaptive_depth"]["searches"] == len(aligned.alignments) + 2
+    )
+    # The chunks are searched by models of their own
+    assert model.adaptive_depth.to_json()["searches"] == 0
+
+
+def test_merge_search_statistics():
+    adaptive_depths = [AdaptiveDepth(margin=0.5), AdaptiveDepth(margin=0.5)]
+    adaptive_depths[0].depths.update({1: 3, 2: 1})
+    adaptive_depths[1].depths.update({4: 1})
+
+    merged = merge_search_statistics(
+        [
+            {
+                "path_extensions": path_extensions,
+                "step_score_cache": {"max_size": 10, "hits": hits},
+                "diagonal_band": None,
+                "adaptive_depth": adaptive_depth.to_json(),
+            }
+            for path_extensions, hits, adaptive_depth in zip(
+                [5, 7], [1, 2], adaptive_depths, strict=True
+            )
+        ]
+    )
+
+    assert merged == {
+        "path_extensions": 12,
+        "step_score_cache": {"max_size": 10, "hits": 3},
+        "diagonal_band": None,
+        "adaptive_depth": {
+            "margin": 0.5,
+            "searches": 5,
+            "mean_depth": 1.8,
+            "depths": {"1": 3, "2": 1, "4": 1},
+        },
+    }
@@ -0,0 +1,72 @@
+from python_tca2 import match
+from python_tca2.clusters import Clusters
+from python_tca2.ref import Ref, RefFields
+
+
+def make_ref(
+    text_number: int, pos: int, match_type: int = match.DICE, length: int = 1
+) -> RefFields:
+    return Ref(
+        match_type=match_type,
+        weight=3.0,
+        text_number=text_number,
+        element_number=0,
+        pos=pos,
+        length=length,
+        word="word",
+    ).to_fields()
+
+
+def test_overlapping_refs_merge():
+    clusters = Clusters()
+    clusters.create_and_add_cluster(make_ref(0, pos=0), make_ref(1, pos=0))
+    clusters.create_and_add_cluster(make_ref(0, pos=3), make_ref(1, pos=3))
+
+    assert len(clusters.clusters) == 2  # noqa: PLR2004
+
+    clusters.create_and_add_cluster(make_ref(0, pos=0, length=4), make_ref(1, pos=5))
+
+    assert len(clusters.clusters) == 1
+    assert len(clusters.clusters[0].refs) == 6  # noqa: PLR2004
+    assert clusters.get_score() == clusters.clusters[0].get_score()
+
+
+def test_same_match_type_merges():
+    """Refs of the same anchor word match anywhere, other kinds do not."""
+    clusters = Clusters()
+    clusters.create_and_add_cluster(make_ref(0, pos=0, match_type=7), make_ref(1, 0))
+    clusters.create_and_add_cluster(make_ref(0, pos=5, match_type=7), make_ref(1, 5))
+    clusters.create_and_add_cluster(make_ref(0, pos=9), make_ref(1, pos=9))
+
+    assert [len(cluster.refs) for cluster in clusters.clusters] == [4, 2]
+
+
+def test_clusters_in_order_of_last_addition():
+    clusters = Clusters()
+    clusters.create_and_add_cluster(make_ref(0, pos=0), make_ref(1, pos=0))
+    clusters.create_and_add_cluster(make_ref(0, pos=3), make_ref(1, pos=3))
+    clusters.add_ref(make_ref(0, pos=0))
+
+    assert [cluster.refs[0].pos for cluster in clusters.clusters] == [3, 0]
+
+    other_clusters = Clusters()
+    other_clusters.add_ref(make_ref(1, pos=3))
+    clusters.add_clusters(other_clusters)
+
+    assert [cluster.refs[0].pos for cluster in clusters.clusters] == [0, 3]
+    assert clusters.get_score() == sum(
+        cluster.get_score() for cluster in clusters.clusters
+    )
+
+
+def test_duplicate_refs_added_once():
+    clusters = Clusters()
+    clusters.create_and_add_cluster(make_ref(0, pos=0), make_ref(1, pos=0))
+    clusters.create_and_add_cluster(make_ref(0, pos=0), make_ref(1, pos=0))
+
+    assert len(clusters.refs) == 2  # noqa: PLR2004
+    assert len({Ref(*make_ref(0, pos=0)), Ref(*make_ref(0, pos=0))}) == 1
+    assert clusters.clusters[0].refs == [
+        Ref(*make_ref(0, pos=0)),
+        Ref(*make_ref(1, pos=0)),
+    ]
@@ -0,0 +1,46 @@
+import pytest
+
+from python_tca2.diagonal_band import DiagonalBand
+
+
+def test_width_or_fraction():
+    with pytest.raises(ValueError, match="either"):
+        DiagonalBand()
+    with pytest.raises(ValueError, match="either"):
+        DiagonalBand(width=2, fraction=0.1)
+
+
+def test_contains():
+    diagonal_band = DiagonalBand(width=1)
+
+    assert diagonal_band.contains((5, 10), lengths=(10, 20))
+    assert diagonal_band.contains((5, 11), lengths=(10, 20))
+    assert not diagonal_band.contains((5, 12), lengths=(10, 20))
+
+
+def test_fraction():
+    diagonal_band = DiagonalBand(fraction=0.1)
+
+    assert diagonal_band.get_half_width(lengths=(100, 50)) == 10.0  # noqa: PLR2004
+    assert diagonal_band.get_columns(50, lengths=(100, 50)) == range(15, 36)
+
+
+def test_get_columns_clipped():
+    diagonal_band = DiagonalBand(width=2)
+
+    assert diagonal_band.get_columns(0, lengths=(4, 8)) == range(0, 3)
+    assert diagonal_band.get_columns(4, lengths=(4, 8)) == range(6, 9)
+    assert diagonal_band.get_columns(0, lengths=(0, 8)) == range(0, 3)
+
+
+def test_widen_and_reset():
+    diagonal_band = DiagonalBand(width=1)
+
+    diagonal_band.widen()
+    diagonal_band.widen()
+    assert diagonal_band.get_half_width(lengths=(4, 4)) == 4  # noqa: PLR2004
+    assert diagonal_band.covers(lengths=(4, 4))
+
+    diagonal_band.reset()
+    assert diagonal_band.get_half_width(lengths=(4, 4)) == 1
+    assert diagonal_band.widenings == 2  # noqa: PLR2004
@@ -0,0 +1,77 @@
+from itertools import product
+
+from python_tca2 import constants, similarity_utils
+from python_tca2.aelement import AlignmentElement
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.dice_index import find_dice_candidates, get_dice_words
+
+
+def make_elements(texts: list[str], text_number: int) -> list[AlignmentElement]:
+    return [
+        AlignmentElement(
+            anchor_word_list=AnchorWordList(),
+            text=text,
+            text_number=text_number,
+            element_number=element_number,
+        )
+        for element_number, text in enumerate(texts)
+    ]
+
+
+def is_any_dice_match(left: tuple, right: tuple) -> bool:
+    """Check a word pair the way the exhaustive comparison did."""
+    (info1, x), (info2, y) = left, right
+    bigrams1 = info1.profile.bigrams
+    bigrams2 = info2.profile.bigrams
+    return (
+        similarity_utils.dice_match_bigrams(
+            bigrams1[x], bigrams2[y], constants.DEFAULT_DICE_MIN_COUNTING_SCORE
+        )
+        or (
+            x < len(bigrams1) - 1
+            and similarity_utils.dice_match_bigrams_with_phrase(
+                bigrams2[y], (bigrams1[x], bigrams1[x + 1])
+            )
+        )
+        or (
+            y < len(bigrams2) - 1
+            and similarity_utils.dice_match_bigrams_with_phrase(
+                bigrams1[x], (bigrams2[y], bigrams2[y + 1])
+            )
+        )
+    )
+
+
+def test_get_dice_words():
+    left = make_elements(["Oslo kommune betaler"], text_number=0)
+
+    assert get_dice_words(left) == [(left[0], 1), (left[0], 2)]
+
+
+def test_candidates_cover_the_cross_product():
+    left = make_elements(
+        [
+            "Statsministeren besøkte Nordkapp kommune",
+            "Regjeringen foreslår sameskolestyre",
+        ],
+        text_number=0,
+    )
+    right = make_elements(
+        [
+            "Statsministeren besøkte Nordkapps kommunen",
+            "Regjeringa foreslår sameskole styret",
+        ],
+        text_number=1,
+    )
+    candidates = list(find_dice_candidates(left, right))
+    matches = [
+        (left_word, right_word)
+        for left_word, right_word in product(
+            get_dice_words(left), get_dice_words(right)
+        )
+        if is_any_dice_match(left_word, right_word)
+    ]
+
+    assert matches
+    assert [pair for pair in candidates if is_any_dice_match(*pair)] == matches
+    assert len(candidates) < len(get_dice_words(left)) * len(get_dice_words(right))
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from python_tca2 import disk_cache
+
+
+def test_get_cache_dir(monkeypatch):
+    monkeypatch.setenv("TCA2_CACHE_DIR", "/tmp/tca2")
+    assert disk_cache.get_cache_dir() == Path("/tmp/tca2")
+
+    monkeypatch.delenv("TCA2_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/xdg")
+    assert disk_cache.get_cache_dir() == Path("/tmp/xdg/python-tca2")
+
+
+def test_read_written_cache_file(tmp_path):
+    path = tmp_path / "sub" / "cached.pickle"
+    disk_cache.write_cache_file(path, key={"sha256": "abc"}, payload=[1, 2])
+
+    assert disk_cache.read_cache_file(path, key={"sha256": "abc"}) == [1, 2]
+    assert disk_cache.read_cache_file(path, key={"sha256": "def"}) is None
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_other_package_version(tmp_path, monkeypatch):
+    path = tmp_path / "cached.pickle"
+    disk_cache.write_cache_file(path, key={}, payload="payload")
+    monkeypatch.setattr(disk_cache, "get_package_version", lambda: "99.0")
+
+    assert disk_cache.read_cache_file(path, key={}) is None
+
+
+def test_other_package_code(tmp_path, monkeypatch):
+    path = tmp_path / "cached.pickle"
+    disk_cache.write_cache_file(path, key={}, payload="payload")
+    monkeypatch.setattr(disk_cache, "get_code_fingerprint", lambda: "edited")
+
+    assert disk_cache.read_cache_file(path, key={}) is None
+
+
+def test_code_fingerprint():
+    fingerprint = disk_cache.get_code_fingerprint()
+
+    assert len(fingerprint) == 64  # noqa: PLR2004
+    assert disk_cache.get_code_fingerprint() == fingerprint
+
+
+def test_unreadable_cache_files(tmp_path):
+    path = tmp_path / "cached.pickle"
+    assert disk_cache.read_cache_file(path, key={}) is None
+
+    path.write_bytes(b"not a cache file")
+    assert disk_cache.read_cache_file(path, key={}) is None
+
+    disk_cache.write_cache_file(path, key={}, payload="payload")
+    path.write_bytes(path.read_bytes()[:-5])
+    assert disk_cache.read_cache_file(path, key={}) is None
@@ -0,0 +1,126 @@
+from pathlib import Path
+
+from python_tca2 import disk_cache
+from python_tca2.alignmentmodel import AlignmentModel
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.anchorwordlistentry import AnchorWordListEntry
+from python_tca2.document_cache import clear_documents, make_key
+
+ROOT = Path(__file__).parent.parent
+SENTENCES_TUPLE = tuple(
+    (ROOT / text_file).read_text().splitlines()
+    for text_file in (
+        "bug3/giella_no.docx_nob_new.txt",
+        "bug3/giella_sam.docx_sme_new.txt",
+    )
+)
+
+
+def load_anchor_word_list() -> AnchorWordList:
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.load_from_file(str(ROOT / "bug3/anchor-nob-sme.txt"))
+    return anchor_word_list
+
+
+def describe(model: AlignmentModel) -> list:
+    return [
+        [
+            (alignment_element.to_json(), alignment_element.profile)
+            for alignment_element in document
+        ]
+        for document in model.parallel_documents
+    ]
+
+
+def test_make_key():
+    anchor_digest = load_anchor_word_list().digest()
+    key = make_key(["Sametinget."], 0, anchor_digest)
+
+    assert key == make_key(["Sametinget."], 0, load_anchor_word_list().digest())
+    assert key != make_key(["Sametinget."], 1, anchor_digest)
+    assert key != make_key(["Sametinget"], 0, anchor_digest)
+    assert key != make_key(["Sametinget."], 0, AnchorWordList().digest())
+
+
+def test_entries_set_directly(tmp_path):
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.entries = [AnchorWordListEntry("og / ja")]
+
+    model = AlignmentModel(
+        sentences_tuple=(["Sametinget og."], ["Sámediggi ja."]),
+        anchor_word_list=anchor_word_list,
+        document_cache_dir=tmp_path,
+    )
+
+    assert anchor_word_list.digest() is None
+    assert model.statistics()["document_cache"] == {"hits": 0, "misses": 0}
+    assert not list(tmp_path.iterdir())
+
+
+def test_load_through_cache(tmp_path):
+    loaded = AlignmentModel(
+        sentences_tuple=SENTENCES_TUPLE,
+        anchor_word_list=load_anchor_word_list(),
+        document_cache_dir=tmp_path,
+    )
+    assert loaded.statistics()["document_cache"] == {"hits": 0, "misses": 2}
+
+    cached = AlignmentModel(
+        sentences_tuple=SENTENCES_TUPLE,
+        anchor_word_list=load_anchor_word_list(),
+        document_cache_dir=tmp_path,
+    )
+    assert cached.statistics()["document_cache"] == {"hits": 2, "misses": 0}
+    assert describe(cached) == describe(loaded)
+    assert (
+        cached.suggest_without_gui().non_empty_pairs()
+        == loaded.suggest_without_gui().non_empty_pairs()
+    )
+
+    clear_documents(tmp_path)
+    cleared = AlignmentModel(
+        sentences_tuple=SENTENCES_TUPLE,
+        anchor_word_list=load_anchor_word_list(),
+        document_cache_dir=tmp_path,
+    )
+    assert cleared.statistics()["document_cache"] == {"hits": 0, "misses": 2}
+
+
+def test_edited_code_loads_again(tmp_path, monkeypatch):
+    AlignmentModel(
+        sentences_tuple=SENTENCES_TUPLE,
+        anchor_word_list=load_anchor_word_list(),
+        document_cache_dir=tmp_path,
+    )
+    monkeypatch.setattr(disk_cache, "get_code_fingerprint", lambda: "edited")
+
+    reloaded = AlignmentModel(
+        sentences_tuple=SENTENCES_TUPLE,
+        anchor_word_list=load_anchor_word_list(),
+        document_cache_dir=tmp_path,
+    )
+
+    assert reloaded.statistics()["document_cache"] == {"hits": 0, "misses": 2}
+
+
+def test_load_missing_document(tmp_path):
+    AlignmentModel(
+        sentences_tuple=SENTENCES_TUPLE,
+        anchor_word_list=load_anchor_word_list(),
+        document_cache_dir=tmp_path,
+    )
+    sentences_tuple = (SENTENCES_TUPLE[0], SENTENCES_TUPLE[1][:-1])
+
+    partly_cached = AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=load_anchor_word_list(),
+        load_workers=2,
+        document_cache_dir=tmp_path,
+    )
+
+    assert partly_cached.statistics()["document_cache"] == {"hits": 1, "misses": 1}
+    assert describe(partly_cached) == describe(
+        AlignmentModel(
+            sentences_tuple=sentences_tuple, anchor_word_list=load_anchor_word_list()
+        )
+    )
@@ -0,0 +1,308 @@
+from itertools import product
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from python_tca2 import constants, match, pair_matches, similarity_utils
+from python_tca2.aelement import AlignmentElement
+from python_tca2.alignment_suggestion import generate_alignment_suggestions
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.cluster import Cluster
+from python_tca2.clusters import Clusters
+from python_tca2.elementinfotobecompared import ElementInfoToBeCompared
+from python_tca2.pair_matches import MATCH_FINDERS
+from python_tca2.ref import Ref, RefFields
+
+ROOT = Path(__file__).parent.parent
+
+CORPORA = [
+    (
+        "data/anchor-nob-fkv.txt",
+        "data/kommisjonen_21.08.2020_nob.txt_nob_new.txt",
+        "data/kommisjonen_21.08.2020_fkv.txt_fkv_new.txt",
+    ),
+    (
+        "bug1/anchor-nob-sme.txt",
+        "bug1/9_id_446575.html_nob_new.txt",
+        "bug1/9_id_461249.html_sme_new.txt",
+    ),
+    (
+        "bug2/anchor-nob-sme.txt",
+        "bug2/19_id_326047.html_nob_new.txt",
+        "bug2/19_id_458644.html_sme_new.txt",
+    ),
+    (
+        "bug3/anchor-nob-sme.txt",
+        "bug3/giella_no.docx_nob_new.txt",
+        "bug3/giella_sam.docx_sme_new.txt",
+    ),
+]
+
+
+RefPairs = Iterator[tuple[RefFields, RefFields]]
+
+
+def get_words(
+    element_info: ElementInfoToBeCompared, text_number: int
+) -> list[tuple[AlignmentElement, int, str]]:
+    """Every word of the sentences of a text of the step, with its sentence."""
+    return [
+        (alignment_element, position, word)
+        for alignment_element in element_info.aligned_sentence_elements[text_number]
+        for position, word in enumerate(alignment_element.words)
+    ]
+
+
+def make_fields(
+    alignment_element: AlignmentElement,
+    match_type: int,
+    weight: float,
+    pos: int,
+    word: str,
+) -> RefFields:
+    return (
+        match_type,
+        weight,
+        alignment_element.text_number,
+        alignment_element.element_number,
+        pos,
+        word.count(" ") + 1,
+        word,
+    )
+
+
+def are_words_numbers_and_equal(word1: str, word2: str) -> bool:
+    try:
+        return float(word1) == float(word2)
+    except ValueError:
+        return False
+
+
+def reference_number_matches(element_info: ElementInfoToBeCompared) -> RefPairs:
+    """The number matches, as the cross product loop found them."""
+    weight = constants.DEFAULT_NUMBER_MATCH_WEIGHT
+    for (info1, x, word1), (info2, y, word2) in product(
+        get_words(element_info, 0), get_words(element_info, 1)
+    ):
+        if are_words_numbers_and_equal(word1, word2):
+            yield (
+                make_fields(info1, match.NUMBER, weight, x, word1),
+                make_fields(info2, match.NUMBER, weight, y, word2),
+            )
+
+
+def reference_propername_matches(element_info: ElementInfoToBeCompared) -> RefPairs:
+    """The proper name matches, as the cross product loop found them."""
+    weight = constants.DEFAULT_PROPERNAME_MATCH_WEIGHT
+    for (info1, x, word1), (info2, y, word2) in product(
+        get_words(element_info, 0), get_words(element_info, 1)
+    ):
+        if word2 and word1[0].isupper() and word2[0].isupper() and word1 == word2:
+            yield (
+                make_fields(info1, match.PROPER, weight, x, word1),
+                make_fields(info2, match.PROPER, weight, y, word2),
+            )
+
+
+def reference_dice_matches(element_info: ElementInfoToBeCompared) -> RefPairs:
+    """The Dice matches, as the cross product loop found them."""
+    weight = constants.DEFAULT_DICEPHRASE_MATCH_WEIGHT
+    min_length = constants.DEFAULT_DICE_MIN_WORD_LENGTH
+    for (info1, x, word1), (info2, y, word2) in product(
+        get_words(element_info, 0), get_words(element_info, 1)
+    ):
+        if len(word1) < min_length or len(word2) < min_length:
+            continue
+
+        if similarity_utils.dice_match_word_pair(
+            word1, word2, constants.DEFAULT_DICE_MIN_COUNTING_SCORE
+        ):
+            yield (
+                make_fields(info1, match.DICE, weight, x, word1),
+                make_fields(info2, match.DICE, weight, y, word2),
+            )
+
+        next_word1 = info1.words[x + 1] if x < len(info1.words) - 1 else ""
+        if len(next_word1) >= min_length and (
+            similarity_utils.dice_match_word_with_phrase(
+                word=word2, phrase=(word1, next_word1)
+            )
+        ):
+            yield (
+                make_fields(info1, match.DICE, weight, x, f"{word1} {next_word1}"),
+                make_fields(info2, match.DICE, weight, y, word2),
+            )
+
+        next_word2 = info2.words[y + 1] if y < len(info2.words) - 1 else ""
+        if len(next_word2) >= min_length and (
+            similarity_utils.dice_match_word_with_phrase(
+                word=word1, phrase=(word2, next_word2)
+            )
+        ):
+            yield (
+                make_fields(info1, match.DICE, weight, x, word1),
+                make_fields(info2, match.DICE, weight, y, f"{word2} {next_word2}"),
+            )
+
+
+def reference_special_character_matches(
+    element_info: ElementInfoToBeCompared,
+) -> RefPairs:
+    """The scoring character matches, as the cross product loop found them."""
+    weight = constants.DEFAULT_SCORING_CHARACTER_MATCH_WEIGHT
+    characters = [
+        [
+            (alignment_element, char)
+            for alignment_element in alignment_elements
+            for char in alignment_element.scoring_characters
+        ]
+        for alignment_elements in element_info.aligned_sentence_elements
+    ]
+    for (info1, char1), (info2, char2) in product(*characters):
+        if char1 == char2:
+            yield (
+                make_fields(info1, match.SCORING_CHARACTERS, weight, 0, char1),
+                make_fields(info2, match.SCORING_CHARACTERS, weight, 0, char2),
+            )
+
+
+REFERENCE_FINDERS: dict[
+    pair_matches.MatchFinder, Callable[[ElementInfoToBeCompared], RefPairs]
+] = {
+    pair_matches.find_number_matches: reference_number_matches,
+    pair_matches.find_propername_matches: reference_propername_matches,
+    pair_matches.find_dice_matches: reference_dice_matches,
+    pair_matches.find_special_character_matches: reference_special_character_matches,
+}
+"""The cross product loops the match finders replace, keyed by finder."""
+
+
+def merge_cluster(clusters: list[Cluster], new_cluster: Cluster) -> None:
+    """Add a cluster the way the Cluster objects were merged before Clusters."""
+    for cluster in [
+        cluster
+        for cluster in clusters
+        if any(cluster.matches(ref) for ref in new_cluster.refs)
+    ]:
+        new_cluster.add_cluster(cluster)
+        clusters.remove(cluster)
+    clusters.append(new_cluster)
+
+
+def make_cluster(*refs: Ref) -> Cluster:
+    cluster = Cluster()
+    for ref in refs:
+        cluster.add_ref(ref)
+
+    return cluster
+
+
+def get_object_clusters_score(element_info: ElementInfoToBeCompared) -> float:
+    clusters: list[Cluster] = []
+    for anchor_word_clusters in element_info.make_anchor_word_clusters():
+        anchor_clusters: list[Cluster] = []
+        for ref in anchor_word_clusters.refs:
+            merge_cluster(anchor_clusters, make_cluster(Ref(*ref)))
+        for cluster in anchor_clusters:
+            merge_cluster(clusters, cluster)
+
+    for finder in MATCH_FINDERS:
+        for ref1, ref2 in REFERENCE_FINDERS[finder](element_info):
+            merge_cluster(clusters, make_cluster(Ref(*ref1), Ref(*ref2)))
+
+    return sum(cluster.get_score() for cluster in clusters)
+
+
+def load_elements(
+    anchor_file: str, *text_files: str
+) -> tuple[list[AlignmentElement], ...]:
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.load_from_file(str(ROOT / anchor_file))
+    return tuple(
+        [
+            AlignmentElement(
+                anchor_word_list=anchor_word_list,
+                text=line,
+                text_number=text_number,
+                element_number=element_number,
+            )
+            for element_number, line in enumerate(
+                line for line in (ROOT / text_file).read_text().splitlines() if line
+            )
+        ]
+        for text_number, text_file in enumerate(text_files)
+    )
+
+
+@pytest.mark.parametrize("corpus", CORPORA, ids=lambda corpus: corpus[0])
+def test_clusters_score_matches_cluster_objects(corpus):
+    """The match finders and Clusters score as the cross product loops and
+    Cluster objects did."""
+    parallel_documents = load_elements(*corpus)
+    lengths = [len(document) for document in parallel_documents]
+    for i in range(lengths[0]):
+        for j in range(max(0, i - 2), min(lengths[1], i + 3)):
+            for step in generate_alignment_suggestions(2):
+                element_info = ElementInfoToBeCompared(
+                    (
+                        parallel_documents[0][i : i + step[0]],
+                        parallel_documents[1][j : j + step[1]],
+                    )
+                )
+                if element_info.empty():
+                    continue
+
+                assert element_info.calculate_clusters_score() == (
+                    get_object_clusters_score(element_info)
+                )
+
+
+def get_cluster_refs(clusters: Clusters) -> set[frozenset[Ref]]:
+    return {frozenset(cluster.refs) for cluster in clusters.clusters}
+
+
+def test_finders_match_cross_product_loops():
+    anchor_word_list = AnchorWordList()
+    texts = [
+        [
+            "Oslo og Oslo kjøpte 25 busser og 25 båter i 1999.",
+            "Reindrift loven gjelder reindriftsloven i Oslo, 25 %.",
+        ],
+        [
+            "Oslo ja Oslo osttii 25 bussa ja 25 fatnasa 1999:s.",
+            "Reindriftsloven guoská reindrift loven Oslos, 25 %.",
+        ],
+    ]
+    parallel_documents = [
+        [
+            AlignmentElement(
+                anchor_word_list=anchor_word_list,
+                text=text,
+                text_number=text_number,
+                element_number=element_number,
+            )
+            for element_number, text in enumerate(document_texts)
+        ]
+        for text_number, document_texts in enumerate(texts)
+    ]
+    element_info = ElementInfoToBeCompared(
+        (parallel_documents[0], parallel_documents[1])
+    )
+
+    for finder in MATCH_FINDERS:
+        clusters = Clusters()
+        for ref1, ref2 in element_info.find_matches(finder):
+            clusters.create_and_add_cluster(ref1=ref1, ref2=ref2)
+        reference_clusters = Clusters()
+        for ref1, ref2 in REFERENCE_FINDERS[finder](element_info):
+            reference_clusters.create_and_add_cluster(ref1=ref1, ref2=ref2)
+
+        assert reference_clusters.refs, finder.__name__
+        assert get_cluster_refs(clusters) == get_cluster_refs(reference_clusters)
+        assert clusters.get_score() == reference_clusters.get_score()
+
+    dice_refs = [ref for ref, _ in element_info.find_dice_matches()] + [
+        ref for _, ref in element_info.find_dice_matches()
+    ]
+    assert any(ref[5] == 2 for ref in dice_refs)  # noqa: PLR2004
@@ -0,0 +1,44 @@
+import dataclasses
+
+import pytest
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.feature_profile import FeatureProfile, parse_number
+
+
+def test_parse_number():
+    assert parse_number("25") == 25.0  # noqa: PLR2004
+    assert parse_number("2,5") is None
+    assert parse_number("Oslo") is None
+
+
+def test_profile():
+    alignment_element = AlignmentElement(
+        anchor_word_list=AnchorWordList(),
+        text="Oslo fikk 25% flere turister?",
+        text_number=0,
+        element_number=0,
+    )
+
+    assert alignment_element.profile == FeatureProfile(
+        lowercase_words=("oslo", "fikk", "25%", "flere", "turister"),
+        bigrams=(
+            frozenset({"os", "sl", "lo"}),
+            frozenset({"fi", "ik", "kk"}),
+            frozenset({"25", "5%"}),
+            frozenset({"fl", "le", "er", "re"}),
+            frozenset({"tu", "ur", "ri", "is", "st", "te", "er"}),
+        ),
+        numbers=(None, None, None, None, None),
+        capitalized=(True, False, False, False, False),
+        scoring_character_counts=(("%", 1), ("?", 1)),
+    )
+
+
+def test_profile_is_immutable():
+    profile = FeatureProfile.from_words(["1999"], scoring_characters="")
+
+    assert profile.numbers == (1999.0,)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        profile.numbers = ()  # type: ignore[misc]
@@ -0,0 +1,43 @@
+from python_tca2.aelement import AlignmentElement
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.pair_match_cache import PairMatchCache
+
+
+def make_elements(text_number: int) -> list[AlignmentElement]:
+    return [
+        AlignmentElement(
+            anchor_word_list=AnchorWordList(),
+            text=f"Sentence {element_number} of text {text_number}",
+            text_number=text_number,
+            element_number=element_number,
+        )
+        for element_number in range(3)
+    ]
+
+
+def test_get_reuses_matches():
+    left, right = make_elements(text_number=0), make_elements(text_number=1)
+    cache = PairMatchCache()
+
+    first = cache.get(left[0], right[0])
+
+    assert cache.get(left[0], right[0]) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_forget_before():
+    left, right = make_elements(text_number=0), make_elements(text_number=1)
+    cache = PairMatchCache()
+    for left_element in left:
+        for right_element in right:
+            cache.get(left_element, right_element)
+
+    cache.forget_before((1, 2))
+
+    assert sorted(cache.matches) == [(1, 2), (2, 2)]
+    assert cache.evictions == 7  # noqa: PLR2004
+
+    cache.forget_before((0, 0))
+
+    assert cache.window_start == (1, 2)
+    assert len(cache) == 2  # noqa: PLR2004
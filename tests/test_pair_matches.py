@@ -0,0 +1,69 @@
+from itertools import product
+
+from python_tca2.aelement import AlignmentElement
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.pair_matches import (
+    combine_ranked_matches,
+    equality_join,
+    find_number_matches,
+    find_propername_matches,
+)
+from python_tca2.ref import Ref
+
+
+def make_element(text: str, text_number: int, element_number: int):
+    return AlignmentElement(
+        anchor_word_list=AnchorWordList(),
+        text=text,
+        text_number=text_number,
+        element_number=element_number,
+    )
+
+
+def test_combine_follows_the_cross_product():
+    """Both sentences of the second side are crossed with 5 before 7."""
+    left = [make_element("5 7", text_number=0, element_number=0)]
+    right = [
+        make_element("7 5", text_number=1, element_number=0),
+        make_element("5", text_number=1, element_number=1),
+    ]
+
+    matches = combine_ranked_matches((left, right), find_number_matches)
+
+    refs = [(Ref(*ref1), Ref(*ref2)) for ref1, ref2 in matches]
+
+    assert [(ref1.word, ref2.element_number, ref2.pos) for ref1, ref2 in refs] == [
+        ("5", 0, 1),
+        ("5", 1, 0),
+        ("7", 0, 0),
+    ]
+
+
+def test_equality_join_follows_the_cross_product():
+    left_keys = [(0, "b"), (1, "a"), (2, "b")]
+    right_keys = [(0, "a"), (1, "b"), (2, "c"), (3, "b")]
+
+    assert list(equality_join(left_keys, right_keys)) == [
+        (x, y)
+        for (x, key1), (y, key2) in product(left_keys, right_keys)
+        if key1 == key2
+    ]
+
+
+def test_find_number_matches():
+    left = make_element("1 nan 2.50", text_number=0, element_number=0)
+    right = make_element("2.5 nan 1.0", text_number=1, element_number=0)
+
+    assert [
+        (rank, Ref(*ref1).word, Ref(*ref2).word)
+        for rank, ref1, ref2 in find_number_matches(left, right)
+    ] == [(0, "1", "1.0"), (2, "2.50", "2.5")]
+
+
+def test_find_propername_matches():
+    left = make_element("Oslo og Tromsø", text_number=0, element_number=0)
+    right = make_element("Tromsø ja Oslo oslo", text_number=1, element_number=0)
+
+    assert [
+        (rank, Ref(*ref2).pos) for rank, _, ref2 in find_propername_matches(left, right)
+    ] == [(0, 2), (2, 0)]
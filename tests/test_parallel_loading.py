@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from python_tca2.alignmentmodel import AlignmentModel
+from python_tca2.anchorwordlist import AnchorWordList
+from python_tca2.parallel_loading import load_in_parallel
+
+ROOT = Path(__file__).parent.parent
+
+
+def describe(alignment_element):
+    return alignment_element.to_json(), alignment_element.profile
+
+
+def test_same_sentences_as_serial_loading():
+    anchor_word_list = AnchorWordList()
+    anchor_word_list.load_from_file(str(ROOT / "bug3/anchor-nob-sme.txt"))
+    sentences_tuple = tuple(
+        (ROOT / text_file).read_text().splitlines()
+        for text_file in (
+            "bug3/giella_no.docx_nob_new.txt",
+            "bug3/giella_sam.docx_sme_new.txt",
+        )
+    )
+    model = AlignmentModel(
+        sentences_tuple=sentences_tuple, anchor_word_list=anchor_word_list
+    )
+
+    parallel_documents = load_in_parallel(
+        sentences_tuple, anchor_word_list=anchor_word_list, workers=2, chunk_size=5
+    )
+
+    assert [list(map(describe, document)) for document in parallel_documents] == [
+        list(map(describe, document)) for document in model.parallel_documents
+    ]
+
+
+def test_parallel_loading_model():
+    sentences_tuple = (
+        ["Kanskje en innkjøpsordning.", "Utvikling av materialer.", "Tre."],
+        ["Kvääninkielinen litteratuuri.", "Opetus- ja oppimateriaali.", "Kolme."],
+    )
+    serial = AlignmentModel(
+        sentences_tuple=sentences_tuple, anchor_word_list=AnchorWordList()
+    )
+    parallel = AlignmentModel(
+        sentences_tuple=sentences_tuple,
+        anchor_word_list=AnchorWordList(),
+        load_workers=2,
+        load_chunk_size=2,
+    )
+
+    assert [
+        [alignment_element.element_number for alignment_element in document]
+        for document in parallel.parallel_documents
+    ] == [[0, 1, 2], [0, 1, 2]]
+    assert (
+        parallel.suggest_without_gui().non_empty_pairs()
+        == serial.suggest_without_gui().non_empty_pairs()
+    )
+    assert parallel.statistics()["load"]["workers"] == 2  # noqa: PLR2004
+    assert parallel.statistics()["load"]["seconds"] > 0
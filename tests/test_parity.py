@@ -0,0 +1,27 @@
+from python_tca2.parity import ParityDifference, find_differences
+
+
+def test_find_differences_identical():
+    steps = [(1, 1), (1, 2), (1, 1)]
+
+    assert find_differences(steps, list(steps)) == []
+
+
+def test_find_differences():
+    lookahead_steps = [(1, 1), (1, 1), (2, 1), (1, 1), (1, 2)]
+    dynamic_steps = [(1, 1), (1, 0), (1, 1), (1, 1), (1, 1), (1, 1), (0, 1)]
+
+    assert find_differences(lookahead_steps, dynamic_steps) == [
+        ParityDifference(
+            start=(1, 1),
+            end=(4, 3),
+            lookahead_steps=[(1, 1), (2, 1)],
+            dynamic_steps=[(1, 0), (1, 1), (1, 1)],
+        ),
+        ParityDifference(
+            start=(5, 4),
+            end=(6, 6),
+            lookahead_steps=[(1, 2)],
+            dynamic_steps=[(1, 1), (0, 1)],
+        ),
+    ]
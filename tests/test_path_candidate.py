@@ -13,3 +13,17 @@ def test_is_hit():
 
     assert path_candidate.has_hit([1, 1])
     assert not path_candidate.has_hit([1, 2])
+
+
+def test_is_hit_tuple():
+    path_candidate = PathCandidate(
+        position=(2, 1),
+        alignment_suggestions=[
+            AlignmentSuggestion((1, 0)),
+            AlignmentSuggestion((1, 1)),
+        ],
+    )
+
+    assert list(path_candidate.visited_positions()) == [(2, 1), (1, 0), (0, 0)]
+    assert path_candidate.has_hit((1, 0))
+    assert not path_candidate.has_hit((1, 1))
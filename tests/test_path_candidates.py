@@ -0,0 +1,79 @@
+from python_tca2.path_candidate import PathCandidate
+from python_tca2.path_candidates import PathCandidates
+
+
+def make_path_candidates() -> PathCandidates:
+    return PathCandidates(
+        [
+            PathCandidate(
+                position=(2, 2),
+                score=2.0,
+                alignment_suggestions=[(1, 1), (1, 1)],
+            ),
+            PathCandidate(
+                position=(2, 1),
+                score=1.0,
+                alignment_suggestions=[(1, 0), (1, 1)],
+            ),
+            PathCandidate(
+                position=(1, 2),
+                score=1.0,
+                alignment_suggestions=[(0, 1), (1, 1)],
+            ),
+        ]
+    )
+
+
+def test_contains():
+    path_candidates = make_path_candidates()
+
+    assert (
+        PathCandidate(
+            position=(2, 1), score=1.0, alignment_suggestions=[(1, 0), (1, 1)]
+        )
+        in path_candidates
+    )
+    assert (
+        PathCandidate(
+            position=(2, 1), score=1.5, alignment_suggestions=[(1, 0), (1, 1)]
+        )
+        not in path_candidates
+    )
+
+
+def test_remove_visitors():
+    path_candidates = make_path_candidates()
+    expected = [
+        path_candidate
+        for path_candidate in path_candidates
+        if not path_candidate.has_hit((1, 1))
+    ]
+
+    path_candidates.remove_visitors((1, 1))
+
+    assert path_candidates.entries == expected
+    assert [path_candidate.position for path_candidate in path_candidates] == [
+        (2, 1),
+        (1, 2),
+    ]
+    assert len(path_candidates) == 2  # noqa: PLR2004
+
+    path_candidates.remove_visitors((0, 0))
+
+    assert not path_candidates
+
+
+def test_visitors_indexed_on_first_removal():
+    path_candidates = make_path_candidates()
+
+    assert path_candidates.visitors is None
+
+    path_candidates.remove_visitors((2, 2))
+    path_candidates.append(
+        PathCandidate(
+            position=(3, 3), score=3.0, alignment_suggestions=[(2, 1), (1, 2)]
+        )
+    )
+    path_candidates.remove_visitors((2, 1))
+
+    assert [path_candidate.position for path_candidate in path_candidates] == [(1, 2)]
@@ -0,0 +1,45 @@
+from python_tca2 import constants
+from python_tca2.alignment_suggestion import AlignmentSuggestion
+from python_tca2.diagonal_band import DiagonalBand
+from python_tca2.score_lattice import ScoreLattice
+
+
+def diagonal_scorer(position: tuple[int, int], step: AlignmentSuggestion) -> float:
+    """Reward 1-1 steps on the diagonal, make all 1-2 and 2-1 steps hopeless."""
+    if step == (1, 1):
+        return 2.0 if position[0] == position[1] else 0.5
+    if 0 in step:
+        return 0.0
+
+    return constants.ELEMENTINFO_SCORE_HOPELESS
+
+
+def test_backtrace_diagonal():
+    lattice = ScoreLattice(lengths=(3, 3))
+    lattice.fill(get_step_score=diagonal_scorer)
+
+    assert lattice.scores[(3, 3)] == 6.0  # noqa: PLR2004
+    assert lattice.backtrace() == [(1, 1), (1, 1), (1, 1)]
+
+
+def test_backtrace_uneven():
+    lattice = ScoreLattice(lengths=(2, 3))
+    lattice.fill(get_step_score=diagonal_scorer)
+
+    assert lattice.backtrace() == [(1, 1), (1, 1), (0, 1)]
+
+
+def test_empty_document():
+    lattice = ScoreLattice(lengths=(0, 2))
+    lattice.fill(get_step_score=diagonal_scorer)
+
+    assert lattice.backtrace() == [(0, 1), (0, 1)]
+
+
+def test_diagonal_band():
+    lattice = ScoreLattice(lengths=(6, 6), diagonal_band=DiagonalBand(width=1))
+    lattice.fill(get_step_score=diagonal_scorer)
+
+    assert lattice.backtrace() == [(1, 1)] * 6
+    assert (0, 2) not in lattice.scores
+    assert len(lattice.scores) == 7 * 3 - 2
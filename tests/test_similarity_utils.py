@@ -1,6 +1,8 @@
 from python_tca2.similarity_utils import (
     adjust_for_length_correlation,
     bad_length_correlation,
+    dice_match_bigrams,
+    dice_match_bigrams_with_phrase,
     dice_match_word_pair,
     dice_match_word_with_phrase,
 )
@@ -69,3 +71,15 @@ def test_dice_match2():
     assert dice_match_word_with_phrase(phrase=("Hello", "hello"), word="world") is False
     assert dice_match_word_with_phrase(phrase=("hello", "hola"), word="world") is False
     assert dice_match_word_with_phrase(phrase=("hello", "world"), word="") is False
+
+
+def test_dice_match_bigrams():
+    assert dice_match_bigrams(frozenset({"he", "el"}), frozenset({"he"}), 0.6) is True
+    assert dice_match_bigrams(frozenset({"he", "el"}), frozenset(), 0.5) is False
+    assert (
+        dice_match_bigrams_with_phrase(
+            word_bigrams=frozenset({"he", "el", "ll", "lo"}),
+            phrase_bigrams=(frozenset({"he", "el"}), frozenset({"ll", "lo"})),
+        )
+        is True
+    )
@@ -0,0 +1,29 @@
+from python_tca2.step_score_cache import StepScoreCache
+
+
+def test_eviction():
+    step_score_cache = StepScoreCache(max_size=2)
+    step_score_cache.set((0, 0, 1, 1), 1.0)
+    step_score_cache.set((0, 0, 1, 0), 0.0)
+
+    assert step_score_cache.get((0, 0, 1, 1)) == 1.0
+    step_score_cache.set((0, 0, 0, 1), 0.0)
+
+    assert step_score_cache.get((0, 0, 1, 0)) is None
+    assert step_score_cache.get((0, 0, 1, 1)) == 1.0
+    assert step_score_cache.to_json() == {
+        "max_size": 2,
+        "size": 2,
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_clear():
+    step_score_cache = StepScoreCache(max_size=None)
+    step_score_cache.set((3, 4, 1, 2), 2.5)
+    step_score_cache.clear()
+
+    assert not step_score_cache
+    assert step_score_cache.get((3, 4, 1, 2)) is None
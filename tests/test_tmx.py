@@ -0,0 +1,26 @@
+from lxml import etree
+
+from python_tca2.tmx import make_tmx, write_tmx_stream
+
+
+def test_write_tmx_stream(tmp_path):
+    sentence_pairs = [("Hei.", "Bures."), ("Takk for sist.", "Giitu maŋimuš.")]
+    output_path = tmp_path / "streamed.tmx"
+
+    unit_count = write_tmx_stream(
+        file1_path=tmp_path / "nob.txt",
+        language_pair=("nob", "sme"),
+        non_empty_sentence_pairs=iter(sentence_pairs),
+        output_path=output_path,
+    )
+
+    assert unit_count == len(sentence_pairs)
+    assert etree.tostring(
+        etree.parse(output_path, etree.XMLParser(remove_blank_text=True))
+    ) == etree.tostring(
+        make_tmx(
+            file1_name="nob",
+            language_pair=("nob", "sme"),
+            aligned_text_pairs=sentence_pairs,
+        )
+    )